@@ -1,5 +1,16 @@
 import { getSupabase, getOpenAI } from '$lib/server/clients';
 
+export interface RAGMatch {
+	chunk_id: string;
+	chunk_index: number;
+	chapter_id: string;
+	// Set when the book was indexed with `rag --unit passages`: the matched
+	// passage is chunk.text from char_start to char_end (chunk offsets)
+	passage_id?: string | null;
+	char_start?: number | null;
+	char_end?: number | null;
+}
+
 /**
  * Query pgvector for semantically similar chunks, filtered to avoid spoilers.
  */
@@ -8,7 +19,7 @@ export async function queryRAG(
 	question: string,
 	maxChunkIndex: number,
 	limit: number = 5
-): Promise<{ chunk_id: string; chunk_index: number; chapter_id: string }[]> {
+): Promise<RAGMatch[]> {
 	const embeddingResponse = await getOpenAI().embeddings.create({
 		model: 'text-embedding-3-small',
 		input: question
@@ -102,11 +102,27 @@ export const POST: RequestHandler = async ({ request }) => {
 	let ragChunks: { text: string; chapter_title: string }[] = [];
 	if (shouldUseRAG(question)) {
 		const ragResults = await queryRAG(book_id, question, chunk_index, 5);
+		// A passage hit contributes just the passage, not its whole parent chunk;
+		// the same chunk or passage is never included twice
+		const seen = new Set<string>();
 		ragChunks = ragResults
+			.filter((r) => {
+				const key = r.passage_id ?? r.chunk_id;
+				if (seen.has(key)) return false;
+				seen.add(key);
+				return true;
+			})
 			.map((r) => {
 				const chunk = chunks.find((c: Chunk) => c.chunk_id === r.chunk_id);
 				const chapter = chapters.find((ch: Chapter) => ch.chapter_id === r.chapter_id);
-				return { text: chunk?.text || '', chapter_title: chapter?.title || '' };
+				let text = chunk?.text || '';
+				if (chunk && r.passage_id && r.char_start != null && r.char_end != null) {
+					text = chunk.text.slice(
+						r.char_start - chunk.char_start,
+						r.char_end - chunk.char_start
+					);
+				}
+				return { text, chapter_title: chapter?.title || '' };
 			})
 			.filter((r: { text: string }) => r.text);
 	}
@@ -0,0 +1,242 @@
+"""Benchmark ElevenLabs request pooling against a local HTTPS mock server.
+
+Runs the same batch of synthesize() calls three ways and reports requests
+per second and TLS handshakes (connections the server accepted):
+
+- ``per-request``: a new ``httpx.AsyncClient`` per request, as before the
+  provider shared one client
+- ``pooled``: ``ElevenLabsTTS`` with its shared HTTP/1.1 connection pool
+- ``http2``: ``ElevenLabsTTS`` multiplexing over HTTP/2 (needs the
+  ``http2`` extra; skipped without h2)
+
+The server listens on 127.0.0.1 with a throwaway self-signed certificate
+(generated with the ``openssl`` CLI), waits ``--latency-ms`` per request to
+stand in for synthesis time and answers with ``--response-kb`` of audio.
+Loopback has no round-trip time, so the gap measured here is a lower bound
+on what pooling saves against the real API.
+
+Usage:
+    python scripts/bench_http_pool.py --requests 400 --concurrency 5
+"""
+
+import asyncio
+import importlib.util
+import os
+import ssl
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import click
+import httpx
+
+from lectorius_pipeline.config import HTTPPoolConfig
+from lectorius_pipeline.stages.tts.providers import elevenlabs
+from lectorius_pipeline.stages.tts.providers.elevenlabs import ElevenLabsTTS
+
+VOICE_ID = "bench-voice"
+
+
+@dataclass
+class MockServer:
+    """HTTP/1.1 and HTTP/2 (via ALPN) TTS stand-in that counts connections."""
+
+    latency_s: float
+    body: bytes
+    connections: int = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        ssl_object = writer.get_extra_info("ssl_object")
+        try:
+            if ssl_object is not None and ssl_object.selected_alpn_protocol() == "h2":
+                await self._serve_h2(reader, writer)
+            else:
+                await self._serve_http1(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError, ssl.SSLError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_http1(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                return
+            length = 0
+            for line in head.decode("latin-1").split("\r\n")[1:]:
+                name, _, value = line.partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            await asyncio.sleep(self.latency_s)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: audio/mpeg\r\n"
+                + f"Content-Length: {len(self.body)}\r\n\r\n".encode()
+                + self.body
+            )
+            await writer.drain()
+
+    async def _serve_h2(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        window_open = asyncio.Event()
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.latency_s)
+            conn.send_headers(stream_id, [
+                (":status", "200"),
+                ("content-type", "audio/mpeg"),
+                ("content-length", str(len(self.body))),
+            ])
+            sent = 0
+            while sent < len(self.body):
+                window = min(
+                    conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size
+                )
+                if window <= 0:
+                    window_open.clear()
+                    await window_open.wait()
+                    continue
+                piece = self.body[sent : sent + window]
+                sent += len(piece)
+                conn.send_data(stream_id, piece, end_stream=sent == len(self.body))
+                writer.write(conn.data_to_send())
+            writer.write(conn.data_to_send())
+
+        while data := await reader.read(65536):
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    task = asyncio.create_task(respond(event.stream_id))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                elif isinstance(event, h2.events.WindowUpdated):
+                    window_open.set()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+
+def _self_signed_cert(directory: Path) -> tuple[Path, Path]:
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-keyout", str(key), "-out", str(cert), "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+class SynthesizeFn:
+    """A request mode under test: ``await mode(text)`` sends one request."""
+
+    def __init__(self, base_url: str, http: HTTPPoolConfig | None) -> None:
+        self._base_url = base_url
+        self._provider = ElevenLabsTTS("bench-key", VOICE_ID, http=http) if http else None
+
+    async def __call__(self, text: str) -> bytes:
+        if self._provider is not None:
+            return await self._provider.synthesize(text)
+        # A new client per request: a fresh connection and TLS handshake each time
+        async with httpx.AsyncClient(
+            base_url=self._base_url, headers={"xi-api-key": "bench-key"}
+        ) as client:
+            response = await client.post(f"/{VOICE_ID}", json={"text": text})
+            response.raise_for_status()
+            return response.content
+
+    async def aclose(self) -> None:
+        if self._provider is not None:
+            await self._provider.aclose()
+
+
+async def _run_batch(synthesize: SynthesizeFn, requests: int, concurrency: int) -> float:
+    """Seconds to finish ``requests`` calls with at most ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    text = "It was the best of times, it was the worst of times. " * 8
+
+    async def one() -> None:
+        async with semaphore:
+            await synthesize(text)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+async def _bench(
+    requests: int, concurrency: int, latency_ms: float, response_kb: int, max_connections: int
+) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = _self_signed_cert(Path(tmp))
+        # httpx reads the trust store from SSL_CERT_FILE, so the provider code runs unchanged
+        os.environ["SSL_CERT_FILE"] = str(cert)
+
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(cert, key)
+        context.set_alpn_protocols(["h2", "http/1.1"])
+        mock = MockServer(latency_s=latency_ms / 1000, body=os.urandom(response_kb * 1024))
+        server = await asyncio.start_server(mock.handle, "127.0.0.1", 0, ssl=context)
+        port = server.sockets[0].getsockname()[1]
+        base_url = f"https://localhost:{port}/v1/text-to-speech"
+        elevenlabs.API_BASE = base_url
+
+        modes: list[tuple[str, HTTPPoolConfig | None]] = [
+            ("per-request", None),
+            ("pooled", HTTPPoolConfig(max_connections=max_connections)),
+        ]
+        if importlib.util.find_spec("h2") is not None:
+            modes.append(("http2", HTTPPoolConfig(max_connections=max_connections, http2=True)))
+        else:
+            click.echo("h2 not installed (pip install 'httpx[http2]'), skipping http2")
+
+        click.echo(
+            f"{requests} requests, concurrency {concurrency}, "
+            f"{latency_ms:g} ms server latency, {response_kb} KB responses\n"
+        )
+        click.echo(f"{'mode':<12} {'req/s':>8} {'handshakes':>11}")
+        async with server:
+            # One uncounted request, so lazy imports don't slow down the first mode
+            await SynthesizeFn(base_url, None)("warm up")
+            for name, http in modes:
+                synthesize = SynthesizeFn(base_url, http)
+                mock.connections = 0
+                elapsed = await _run_batch(synthesize, requests, concurrency)
+                handshakes = mock.connections
+                await synthesize.aclose()
+                click.echo(f"{name:<12} {requests / elapsed:>8.1f} {handshakes:>11}")
+
+
+@click.command()
+@click.option("--requests", default=400, show_default=True, help="Requests per mode")
+@click.option("--concurrency", default=5, show_default=True, help="Requests in flight")
+@click.option("--latency-ms", default=20.0, show_default=True, help="Server time per request")
+@click.option("--response-kb", default=64, show_default=True, help="Audio bytes per response")
+@click.option("--max-connections", default=16, show_default=True, help="Pool size")
+def main(
+    requests: int, concurrency: int, latency_ms: float, response_kb: int, max_connections: int
+) -> None:
+    """Compare per-request clients, a pooled client and HTTP/2 on a local mock."""
+    asyncio.run(_bench(requests, concurrency, latency_ms, response_kb, max_connections))
+
+
+if __name__ == "__main__":
+    main()
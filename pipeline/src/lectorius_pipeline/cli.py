@@ -7,16 +7,31 @@ from typing import Literal
 
 import click
 
-from lectorius_pipeline.config import DEFAULT_CONFIG, PipelineConfig
+from lectorius_pipeline.config import (
+    DEFAULT_CONFIG,
+    AdaptiveConcurrencyConfig,
+    AudioCacheConfig,
+    BatchConfig,
+    ChunkConfig,
+    HedgeConfig,
+    HTTPPoolConfig,
+    PipelineConfig,
+    RateLimitConfig,
+    TTSScheduleConfig,
+)
 from lectorius_pipeline.errors import PipelineError
+from lectorius_pipeline.schemas import TTSEstimate
 from lectorius_pipeline.stages.chapterize import run_chapterize
 from lectorius_pipeline.stages.chunkify import run_chunkify
 from lectorius_pipeline.stages.ingest import run_ingest
 from lectorius_pipeline.stages.memory import run_memory
+from lectorius_pipeline.stages.package_audio import run_package_audio
 from lectorius_pipeline.stages.rag import run_rag
 from lectorius_pipeline.stages.fallbacks import run_fallbacks
-from lectorius_pipeline.stages.tts import run_tts
+from lectorius_pipeline.stages.tts import estimate_tts, run_tts
 from lectorius_pipeline.stages.validate import run_validate
+from lectorius_pipeline.stages.verify import run_verify_pack
+from lectorius_pipeline.stages.verify.audio import DEFAULT_PROBE_WORKERS
 
 # Core text-processing stages (used by the `process` command).
 # TTS, RAG, and Memory are separate commands — see below.
@@ -91,6 +106,24 @@ def main() -> None:
     default=None,
     help="Voice ID to write into book.json (e.g. ElevenLabs voice_id)",
 )
+@click.option(
+    "--low-memory",
+    is_flag=True,
+    default=False,
+    help="Memory-map raw_text.txt and stream chunks (for very large books)",
+)
+@click.option(
+    "--multi-granularity",
+    is_flag=True,
+    default=False,
+    help="Also write passages.jsonl (retrieval) and sections.jsonl (memory)",
+)
+@click.option(
+    "--target-seconds",
+    type=float,
+    default=None,
+    help="Size chunks by spoken duration, using the voice's learned chars/sec",
+)
 def process(
     input_path: Path,
     book_id: str,
@@ -101,6 +134,9 @@ def process(
     llm_assist: bool,
     tts_provider: str | None,
     voice_id: str | None,
+    low_memory: bool,
+    multi_granularity: bool,
+    target_seconds: float | None,
 ) -> None:
     """
     Process an epub through the pipeline.
@@ -110,7 +146,14 @@ def process(
     setup_logging(verbose)
     logger = logging.getLogger(__name__)
 
-    config = PipelineConfig(llm_assist=llm_assist) if llm_assist else DEFAULT_CONFIG
+    config = PipelineConfig(
+        chunking=ChunkConfig(
+            multi_granularity=multi_granularity,
+            target_seconds=target_seconds,
+        ),
+        llm_assist=llm_assist,
+        low_memory=low_memory,
+    )
 
     # Determine which stages to run
     start_idx = TEXT_STAGES.index(from_stage) if from_stage else 0
@@ -125,7 +168,7 @@ def process(
                 run_ingest(input_path, output_dir, book_id, config,
                            tts_provider=tts_provider, voice_id=voice_id)
             elif stage == "chapterize":
-                run_chapterize(output_dir, book_id)
+                run_chapterize(output_dir, book_id, config)
             elif stage == "chunkify":
                 run_chunkify(output_dir, book_id, config)
             elif stage == "validate":
@@ -213,13 +256,20 @@ def ingest(
     required=True,
     help="Book identifier",
 )
+@click.option(
+    "--low-memory",
+    is_flag=True,
+    default=False,
+    help="Memory-map raw_text.txt and stream chunks (for very large books)",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
-def chapterize(book_dir: Path, book_id: str, verbose: bool) -> None:
+def chapterize(book_dir: Path, book_id: str, low_memory: bool, verbose: bool) -> None:
     """Run the chapterize stage only."""
     setup_logging(verbose)
+    config = PipelineConfig(low_memory=low_memory)
 
     try:
-        report = run_chapterize(book_dir, book_id)
+        report = run_chapterize(book_dir, book_id, config)
         click.echo(f"Chapterize completed: {report.chapters_detected} chapters")
     except PipelineError as e:
         click.echo(f"Error: {e}", err=True)
@@ -238,11 +288,58 @@ def chapterize(book_dir: Path, book_id: str, verbose: bool) -> None:
     required=True,
     help="Book identifier",
 )
+@click.option(
+    "--low-memory",
+    is_flag=True,
+    default=False,
+    help="Memory-map raw_text.txt and stream chunks (for very large books)",
+)
+@click.option(
+    "--planner",
+    type=click.Choice(["greedy", "numpy"]),
+    default="greedy",
+    help="Chunk boundary planner (numpy is vectorized, same boundaries)",
+)
+@click.option(
+    "--multi-granularity",
+    is_flag=True,
+    default=False,
+    help="Also write passages.jsonl (retrieval) and sections.jsonl (memory)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Content-stable chunk IDs; re-chunk only changed chapters",
+)
+@click.option(
+    "--target-seconds",
+    type=float,
+    default=None,
+    help="Size chunks by spoken duration, using the voice's learned chars/sec",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
-def chunkify(book_dir: Path, book_id: str, verbose: bool) -> None:
+def chunkify(
+    book_dir: Path,
+    book_id: str,
+    low_memory: bool,
+    planner: str,
+    multi_granularity: bool,
+    incremental: bool,
+    target_seconds: float | None,
+    verbose: bool,
+) -> None:
     """Run the chunkify stage only."""
     setup_logging(verbose)
-    config = DEFAULT_CONFIG
+    config = PipelineConfig(
+        chunking=ChunkConfig(
+            planner=planner,
+            multi_granularity=multi_granularity,
+            incremental=incremental,
+            target_seconds=target_seconds,
+        ),
+        low_memory=low_memory,
+    )
 
     try:
         report = run_chunkify(book_dir, book_id, config)
@@ -264,11 +361,17 @@ def chunkify(book_dir: Path, book_id: str, verbose: bool) -> None:
     required=True,
     help="Book identifier",
 )
+@click.option(
+    "--low-memory",
+    is_flag=True,
+    default=False,
+    help="Memory-map raw_text.txt and stream chunks (for very large books)",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
-def validate(book_dir: Path, book_id: str, verbose: bool) -> None:
+def validate(book_dir: Path, book_id: str, low_memory: bool, verbose: bool) -> None:
     """Run the validate stage only."""
     setup_logging(verbose)
-    config = DEFAULT_CONFIG
+    config = PipelineConfig(low_memory=low_memory)
 
     try:
         report = run_validate(book_dir, book_id, config)
@@ -306,7 +409,127 @@ def validate(book_dir: Path, book_id: str, verbose: bool) -> None:
     help="Model name (openai: tts-1/tts-1-hd, elevenlabs: eleven_multilingual_v2)",
 )
 @click.option("--resume", is_flag=True, help="Resume interrupted processing")
-@click.option("--concurrency", default=5, help="Max parallel API requests")
+@click.option(
+    "--reconcile",
+    is_flag=True,
+    help="Rebuild progress from valid audio already on disk; redo only missing/corrupt chunks",
+)
+@click.option(
+    "--concurrency",
+    default=5,
+    help="Parallel API requests (starting point unless --fixed-concurrency)",
+)
+@click.option(
+    "--max-concurrency",
+    default=AdaptiveConcurrencyConfig.max_concurrency,
+    show_default=True,
+    help="Upper bound for adaptive concurrency",
+)
+@click.option(
+    "--fixed-concurrency",
+    is_flag=True,
+    default=False,
+    help="Keep --concurrency constant instead of adapting to 429s/latency",
+)
+@click.option(
+    "--chars-per-minute",
+    type=float,
+    default=None,
+    help="Pace requests to this many characters per minute (provider quota)",
+)
+@click.option(
+    "--requests-per-minute",
+    type=float,
+    default=None,
+    help="Pace requests to this many requests per minute (provider quota)",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Audio cache directory (default: $LECTORIUS_TTS_CACHE or ~/.cache/lectorius/tts)",
+)
+@click.option(
+    "--cache-max-gb",
+    type=float,
+    default=AudioCacheConfig.max_bytes / 1024**3,
+    show_default=True,
+    help="Evict least recently used cached audio beyond this size",
+)
+@click.option("--no-cache", is_flag=True, default=False, help="Do not read or fill the audio cache")
+@click.option(
+    "--max-connections",
+    type=int,
+    default=None,
+    help="HTTP connection pool size (default: max(16, concurrency ceiling); elevenlabs)",
+)
+@click.option(
+    "--http2",
+    is_flag=True,
+    default=False,
+    help="Multiplex requests over HTTP/2 (needs the http2 extra; elevenlabs)",
+)
+@click.option(
+    "--head-chunks",
+    type=int,
+    default=TTSScheduleConfig.head_chunks,
+    show_default=True,
+    help="Synthesize the first N chunks of every chapter before the rest (0: book order)",
+)
+@click.option(
+    "--publish-interval",
+    type=float,
+    default=TTSScheduleConfig.publish_interval_s,
+    show_default=True,
+    help="Seconds between playback_map.jsonl rewrites during the run (0: only at the end)",
+)
+@click.option(
+    "--hedge-percentile",
+    type=float,
+    default=HedgeConfig.percentile,
+    show_default=True,
+    help="Send a second request when one outlasts this latency percentile of the run",
+)
+@click.option(
+    "--hedge-budget",
+    type=float,
+    default=HedgeConfig.max_extra_chars,
+    show_default=True,
+    help="Cap on hedge spend, as a fraction of the characters to synthesize",
+)
+@click.option("--no-hedge", is_flag=True, default=False, help="Never send hedged requests")
+@click.option(
+    "--batch",
+    is_flag=True,
+    default=False,
+    help="Pack consecutive short chunks into one request and split the audio per chunk",
+)
+@click.option(
+    "--batch-short-chars",
+    type=int,
+    default=BatchConfig.short_chars,
+    show_default=True,
+    help="With --batch, chunks shorter than this are packed",
+)
+@click.option(
+    "--batch-max-chars",
+    type=int,
+    default=BatchConfig.max_chars,
+    show_default=True,
+    help="With --batch, characters per packed request",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Estimate billable characters, cost and time per provider/voice; send nothing",
+)
+@click.option(
+    "--price-per-million",
+    type=float,
+    default=None,
+    help="With --dry-run, USD per million characters (default: the provider's list price)",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 def tts(
     book_dir: Path,
@@ -314,7 +537,27 @@ def tts(
     voice: str | None,
     tts_model: str | None,
     resume: bool,
+    reconcile: bool,
     concurrency: int,
+    max_concurrency: int,
+    fixed_concurrency: bool,
+    chars_per_minute: float | None,
+    requests_per_minute: float | None,
+    cache_dir: Path | None,
+    cache_max_gb: float,
+    no_cache: bool,
+    max_connections: int | None,
+    http2: bool,
+    head_chunks: int,
+    publish_interval: float,
+    hedge_percentile: float,
+    hedge_budget: float,
+    no_hedge: bool,
+    batch: bool,
+    batch_short_chars: int,
+    batch_max_chars: int,
+    dry_run: bool,
+    price_per_million: float | None,
     verbose: bool,
 ) -> None:
     """Generate audio for each chunk using TTS."""
@@ -323,7 +566,50 @@ def tts(
     # Derive book_id from directory name
     book_id = book_dir.name
 
+    adaptive = None
+    if not fixed_concurrency:
+        adaptive = AdaptiveConcurrencyConfig(max_concurrency=max(max_concurrency, concurrency))
+    ceiling = adaptive.max_concurrency if adaptive else concurrency
+    pool_size = max_connections or max(HTTPPoolConfig.max_connections, ceiling)
+    http = HTTPPoolConfig(
+        max_connections=pool_size, max_keepalive_connections=pool_size, http2=http2
+    )
+
+    hedge = None
+    if not no_hedge:
+        hedge = HedgeConfig(percentile=hedge_percentile, max_extra_chars=hedge_budget)
+
+    batching = None
+    if batch:
+        batching = BatchConfig(short_chars=batch_short_chars, max_chars=batch_max_chars)
+
+    cache = None
+    if not no_cache:
+        cache = AudioCacheConfig(max_bytes=int(cache_max_gb * 1024**3))
+        if cache_dir:
+            cache.directory = cache_dir
+
+    rate_limit = RateLimitConfig(
+        chars_per_minute=chars_per_minute, requests_per_minute=requests_per_minute
+    )
+
     try:
+        if dry_run:
+            estimates = estimate_tts(
+                book_dir=book_dir,
+                provider_name=provider,
+                voice=voice,
+                model=tts_model,
+                resume=resume or reconcile,
+                concurrency=concurrency,
+                rate_limit=rate_limit,
+                cache=cache,
+                hedge=hedge,
+                batch=batching,
+                price_per_million_chars=price_per_million,
+            )
+            _echo_tts_estimates(book_id, estimates)
+            return
         report = run_tts(
             book_dir=book_dir,
             book_id=book_id,
@@ -331,18 +617,81 @@ def tts(
             voice=voice,
             model=tts_model,
             resume=resume,
+            reconcile=reconcile,
             concurrency=concurrency,
+            http=http,
+            adaptive=adaptive,
+            rate_limit=rate_limit,
+            cache=cache,
+            schedule=TTSScheduleConfig(
+                head_chunks=head_chunks, publish_interval_s=publish_interval
+            ),
+            hedge=hedge,
+            batch=batching,
         )
         duration_s = report.total_duration_ms // 1000
         click.echo(
             f"TTS completed: {report.completed_chunks}/{report.total_chunks} chunks, "
-            f"{report.failed_chunks} failed, ~{duration_s}s total audio"
+            f"{report.failed_chunks} failed, {report.cache_hits} from cache, "
+            f"~{duration_s}s total audio"
         )
+        latency = report.requests.latency
+        if report.requests.requests:
+            click.echo(
+                f"Requests: {report.requests.requests} ({report.requests.failed_requests} failed), "
+                f"latency p50/p95/p99 {latency.p50_ms:.0f}/{latency.p95_ms:.0f}/"
+                f"{latency.p99_ms:.0f} ms, {report.requests.chars_per_s:.0f} chars/s"
+            )
+        if report.hedged_requests:
+            click.echo(
+                f"Hedged {report.hedged_requests} slow requests "
+                f"({report.hedge_wins} won, {report.hedge_chars} extra chars)"
+            )
+        if report.batched_requests:
+            click.echo(
+                f"Packed {report.batched_chunks} short chunks into "
+                f"{report.batched_requests} requests ({report.batch_split_fallbacks} not split)"
+            )
     except PipelineError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
 
+def _echo_tts_estimates(book_id: str, estimates: list[TTSEstimate]) -> None:
+    """Print one line per provider/voice of a TTS dry run."""
+    first = estimates[0]
+    click.echo(
+        f"Dry run for {book_id}: {first.pending_chunks} chunks to voice, "
+        f"{first.deduplicated_chunks} repeat another chunk's text"
+    )
+    for e in estimates:
+        cost = f"${e.cost_usd:,.2f}" if e.cost_usd is not None else "unknown cost"
+        if e.hedge_chars_max:
+            cost += f" (+ up to {e.hedge_chars_max:,} chars of hedges)"
+        if e.eta_s is None:
+            eta = "ETA unknown (no past runs)"
+        elif e.throughput_basis == "none":
+            eta = f"ETA at least {_hours_minutes(e.eta_s)} ({e.limited_by}-bound; no past runs)"
+        else:
+            runs = "run" if e.throughput_runs == 1 else "runs"
+            eta = (
+                f"ETA {_hours_minutes(e.eta_s)} ({e.limited_by}-bound; "
+                f"{e.throughput_runs} past {runs} of this {e.throughput_basis})"
+            )
+        click.echo(
+            f"  {e.provider}/{e.voice} ({e.model}): {e.billable_chars:,} chars in "
+            f"{e.requests:,} requests ({e.cached_chunks} cached), {cost}, "
+            f"~{_hours_minutes(e.audio_duration_s)} of audio, {eta}"
+        )
+
+
+def _hours_minutes(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    minutes = round(seconds / 60)
+    return f"{minutes // 60}h{minutes % 60:02d}m" if minutes >= 60 else f"{minutes}m"
+
+
 @main.command()
 @click.option(
     "--book-dir",
@@ -357,11 +706,25 @@ def tts(
     help="Embedding model (default: text-embedding-3-small)",
 )
 @click.option("--batch-size", default=100, help="Chunks per embedding API call")
+@click.option(
+    "--unit",
+    type=click.Choice(["chunks", "passages"]),
+    default="chunks",
+    help="Embed playback chunks or passages.jsonl (needs chunkify --multi-granularity)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Reuse stored vectors for unchanged chunk IDs, embed only new chunks",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 def rag(
     book_dir: Path,
     embedding_model: str | None,
     batch_size: int,
+    unit: Literal["chunks", "passages"],
+    incremental: bool,
     verbose: bool,
 ) -> None:
     """Build RAG vector index from chunks."""
@@ -374,6 +737,8 @@ def rag(
             book_id=book_id,
             model=embedding_model,
             batch_size=batch_size,
+            unit=unit,
+            incremental=incremental,
         )
         click.echo(
             f"RAG completed: {report.vectors_indexed} vectors, "
@@ -397,12 +762,23 @@ def rag(
     default=None,
     help="LLM model for summaries (default: claude-sonnet-4-20250514)",
 )
-@click.option("--interval", default=50, help="Chunks between checkpoints (default: 50)")
+@click.option(
+    "--interval",
+    default=50,
+    help="Chunks between checkpoints (default: 50, unused when sections.jsonl exists)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Keep checkpoints before the first chunk change, regenerate the rest",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 def memory(
     book_dir: Path,
     llm_model: str | None,
     interval: int,
+    incremental: bool,
     verbose: bool,
 ) -> None:
     """Generate memory checkpoints (story summaries + entity tracking)."""
@@ -415,6 +791,7 @@ def memory(
             book_id=book_id,
             model=llm_model,
             interval=interval,
+            incremental=incremental,
         )
         click.echo(
             f"Memory completed: {report.checkpoints_generated} checkpoints, "
@@ -425,6 +802,70 @@ def memory(
         sys.exit(1)
 
 
+@main.command("package-audio")
+@click.option(
+    "--book-dir",
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+    help="Book output directory",
+)
+@click.option(
+    "--book-id",
+    required=True,
+    help="Book identifier",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+def package_audio(book_dir: Path, book_id: str, verbose: bool) -> None:
+    """Join chunk audio into one MP3 per chapter, with a byte-range playback map."""
+    setup_logging(verbose)
+
+    try:
+        report = run_package_audio(book_dir, book_id)
+        click.echo(
+            f"Packaged {report.chunks} chunks ({report.files_before} files) into "
+            f"{report.chapters} chapter files, {report.total_bytes / 1e6:.1f} MB"
+        )
+    except PipelineError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@main.command("verify-pack")
+@click.option(
+    "--book-dir",
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+    help="Book output directory",
+)
+@click.option(
+    "--book-id",
+    required=True,
+    help="Book identifier",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=DEFAULT_PROBE_WORKERS,
+    show_default=True,
+    help="Threads used to probe audio files",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+def verify_pack(book_dir: Path, book_id: str, workers: int, verbose: bool) -> None:
+    """Cross-check chunks, playback map, audio files, RAG metadata and checkpoints."""
+    setup_logging(verbose)
+
+    try:
+        report = run_verify_pack(book_dir, book_id, workers)
+        click.echo(
+            f"Pack verified: {report.total_chunks} chunks, "
+            f"{report.audio_files_checked} audio files, {report.warning_count} warnings "
+            f"({report.elapsed_s:.2f}s)"
+        )
+    except PipelineError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
 @main.command("generate-fallbacks")
 @click.option(
     "--book-dir",
@@ -1,6 +1,8 @@
 """Pipeline configuration."""
 
+import os
 from dataclasses import dataclass, field
+from pathlib import Path
 
 
 @dataclass
@@ -12,6 +14,93 @@ class ChunkConfig:
     max_chars: int = 1600
     sentence_splitter: str = "regex"  # "spacy" or "regex"
     spacy_model: str = "en_core_web_sm"
+    planner: str = "greedy"  # "greedy" or "numpy" (vectorized, same boundaries)
+    multi_granularity: bool = False  # also write passages.jsonl and sections.jsonl
+    passage_target_chars: int = 250  # retrieval passage size (split inside a chunk)
+    section_token_budget: int = 8000  # memory section size (estimated tokens)
+    incremental: bool = False  # content-stable chunk IDs, re-chunk only changed chapters
+    target_seconds: float | None = None  # size chunks by spoken duration instead of target_chars
+
+
+@dataclass
+class ValidateConfig:
+    """Validate stage configuration."""
+
+    near_duplicates: bool = True  # MinHash/LSH near-duplicate clusters
+    near_duplicate_threshold: float = 0.8  # Jaccard similarity of word shingles
+    shingle_words: int = 3
+    minhash_permutations: int = 128
+    lsh_bands: int = 32  # 32 bands x 4 rows: ~100% recall at 0.8, candidates verified exactly
+
+
+@dataclass
+class HTTPPoolConfig:
+    """Connection pool for HTTP-based TTS providers (one client per run)."""
+
+    max_connections: int = 16  # keep >= TTS concurrency or requests queue for a connection
+    max_keepalive_connections: int = 16
+    keepalive_expiry: float = 30.0  # seconds an idle connection stays open
+    http2: bool = False  # multiplex over one connection (needs the httpx[http2] extra)
+    timeout: float = 60.0
+
+
+@dataclass
+class AdaptiveConcurrencyConfig:
+    """AIMD bounds for TTS request concurrency (see stages/tts/concurrency.py)."""
+
+    min_concurrency: int = 1
+    max_concurrency: int = 32
+    latency_spike_factor: float = 2.0  # halve when per-char latency exceeds this x baseline
+    decrease_cooldown_s: float = 2.0  # at most one decrease per cooldown
+
+
+@dataclass
+class RateLimitConfig:
+    """Provider quota for TTS requests; None means unlimited."""
+
+    chars_per_minute: float | None = None
+    requests_per_minute: float | None = None
+    burst_seconds: float = 10.0  # bucket capacity, in seconds of quota
+
+
+@dataclass
+class TTSScheduleConfig:
+    """Order in which TTS synthesizes chunks, and how often partial results are published."""
+
+    head_chunks: int = 3  # first chunks of each chapter synthesized before the rest; 0 = book order
+    publish_interval_s: float = 30.0  # rewrite playback_map.jsonl during a run; 0 = only at the end
+
+
+@dataclass
+class HedgeConfig:
+    """Extra TTS requests for stragglers past a live latency percentile (stages/tts/hedging.py)."""
+
+    percentile: float = 0.95  # hedge once a request outlasts this share of completed ones
+    min_samples: int = 20  # completed requests observed before hedging starts
+    min_delay_s: float = 1.0  # never hedge a request younger than this
+    max_extra_chars: float = 0.05  # hedge spend cap, as a fraction of the run's characters
+
+
+@dataclass
+class BatchConfig:
+    """Pack short TTS chunks into one request and split its audio (stages/tts/batching.py)."""
+
+    short_chars: int = 300  # chunks shorter than this are packed with their neighbours
+    max_chars: int = 1200  # characters per packed request
+    max_chunks: int = 8  # chunks per packed request
+
+
+def _default_audio_cache_dir() -> Path:
+    env = os.environ.get("LECTORIUS_TTS_CACHE")
+    return Path(env) if env else Path.home() / ".cache" / "lectorius" / "tts"
+
+
+@dataclass
+class AudioCacheConfig:
+    """Content-addressed TTS audio cache shared by all books on this machine."""
+
+    directory: Path = field(default_factory=_default_audio_cache_dir)
+    max_bytes: int = 10 * 1024**3  # least recently used entries are evicted past this
 
 
 @dataclass
@@ -20,9 +109,11 @@ class PipelineConfig:
 
     pipeline_version: str = "1.0.0"
     chunking: ChunkConfig = field(default_factory=ChunkConfig)
+    validation: ValidateConfig = field(default_factory=ValidateConfig)
     min_text_length: int = 1000  # minimum chars for valid book
     llm_assist: bool = False
     llm_model: str = "claude-sonnet-4-20250514"
+    low_memory: bool = False  # mmap raw_text.txt and stream chunks (collected-works volumes)
 
 
 # Default configuration instance
@@ -137,3 +137,25 @@ class FallbacksError(PipelineError):
 
     def __init__(self, message: str) -> None:
         super().__init__(message, stage="fallbacks")
+
+
+class VerifyPackError(PipelineError):
+    """Error during book pack verification."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message, stage="verify-pack")
+
+
+class PackVerificationFailedError(VerifyPackError):
+    """Pack verification found inconsistent artifacts."""
+
+    def __init__(self, error_count: int) -> None:
+        super().__init__(f"Pack verification failed with {error_count} error(s)")
+        self.error_count = error_count
+
+
+class PackageAudioError(PipelineError):
+    """Error while packaging chunk audio into chapter files."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message, stage="package-audio")
@@ -79,6 +79,34 @@ class Chunk(BaseModel):
     char_end: int
 
 
+class Passage(BaseModel):
+    """Retrieval-sized slice of a chunk, aligned to sentence boundaries."""
+
+    book_id: str
+    chapter_id: str
+    chunk_id: str  # parent chunk
+    chunk_index: int  # parent chunk's global index (for spoiler filtering)
+    passage_id: str  # format: {chunk_id}_p{n:02d}
+    passage_index: int  # global 1-indexed position across entire book
+    text: str  # exact substring of the parent chunk text
+    char_start: int
+    char_end: int
+
+
+class MemorySection(BaseModel):
+    """Token-budgeted run of consecutive chunks summarized by one memory checkpoint."""
+
+    book_id: str
+    section_index: int  # 1-indexed
+    first_chunk_id: str
+    first_chunk_index: int
+    last_chunk_id: str
+    last_chunk_index: int
+    chunk_count: int
+    char_count: int
+    est_tokens: int
+
+
 class LLMAnalysis(BaseModel):
     """LLM-generated analysis of text structure."""
 
@@ -117,10 +145,33 @@ class ChapterizeReport(BaseModel):
     chapters_detected: int
     pattern_matches: dict[str, int] = Field(default_factory=dict)
     fallback_used: bool = False
+    low_memory: bool = False
+    peak_rss_mb: float | None = None  # process high-water mark
     warnings: list[str] = Field(default_factory=list)
     errors: list[str] = Field(default_factory=list)
 
 
+class ChapterChunkState(BaseModel):
+    """Per-chapter fingerprint recorded by chunkify for incremental re-chunking."""
+
+    text_hash: str  # sha256 of chapter text + chunking settings
+    char_start: int  # chapter offset when the hash was taken
+
+
+class ChunkChangeSet(BaseModel):
+    """Chunk IDs added/removed/unchanged by an incremental chunkify run."""
+
+    book_id: str
+    previous_chunks: int
+    total_chunks: int
+    first_changed_index: int | None = None  # first chunk_index where old and new order differ
+    rechunked_chapters: list[str] = Field(default_factory=list)
+    reused_chapters: list[str] = Field(default_factory=list)
+    added: list[str] = Field(default_factory=list)
+    removed: list[str] = Field(default_factory=list)
+    unchanged: list[str] = Field(default_factory=list)
+
+
 class ChunkifyReport(BaseModel):
     """Report from chunkify stage."""
 
@@ -131,6 +182,18 @@ class ChunkifyReport(BaseModel):
     min_chunk_chars: int
     max_chunk_chars: int
     sentence_splitter_used: str
+    total_passages: int = 0
+    total_sections: int = 0
+    target_chars: int | None = None  # effective target (derived when target_seconds is set)
+    min_chars: int | None = None  # effective bounds, checked by validate
+    max_chars: int | None = None
+    target_seconds: float | None = None
+    chars_per_second: float | None = None  # speech rate used to convert target_seconds
+    speech_rate_basis: str | None = None  # "voice", "provider", "all" or "default"
+    incremental: bool = False
+    chapter_states: dict[str, ChapterChunkState] = Field(default_factory=dict)
+    low_memory: bool = False
+    peak_rss_mb: float | None = None  # process high-water mark
     warnings: list[str] = Field(default_factory=list)
     errors: list[str] = Field(default_factory=list)
 
@@ -141,10 +204,26 @@ class PlaybackMapEntry(BaseModel):
     chunk_id: str
     chapter_id: str
     chunk_index: int
-    audio_path: str  # relative: audio/chunks/{chunk_id}.mp3
+    audio_path: str  # relative: audio/chunks/{chunk_id}.mp3 or audio/chapters/{chapter_id}.mp3
+    duration_ms: int
+    start_ms: int = 0  # offset into audio_path; always 0 for per-chunk audio
+    end_ms: int  # start_ms + duration_ms
+    byte_start: int | None = None  # chunk's frames in a chapter file (package-audio)
+    byte_end: int | None = None  # exclusive; both None for per-chunk audio
+
+
+class ChapterAudio(BaseModel):
+    """A chapter file written by package-audio, with its seek index."""
+
+    chapter_id: str
+    audio_path: str  # relative: audio/chapters/{chapter_id}.mp3
+    size_bytes: int
     duration_ms: int
-    start_ms: int = 0  # always 0 for per-chunk audio
-    end_ms: int  # same as duration_ms
+    sample_rate: int
+    samples_per_frame: int
+    frame_count: int
+    interval_ms: int  # spacing of seek_points
+    seek_points: list[tuple[int, int]]  # (ms, byte) of the first frame at/after each interval
 
 
 class TTSChunkProgress(BaseModel):
@@ -157,6 +236,49 @@ class TTSChunkProgress(BaseModel):
     error: str | None = None
 
 
+class ConcurrencyPoint(BaseModel):
+    """One change of the TTS concurrency limit."""
+
+    elapsed_s: float  # since the start of synthesis
+    limit: int
+    reason: str  # "start", "increase", "throttled" or "latency"
+
+
+class LatencyPercentiles(BaseModel):
+    """Latency distribution over TTS requests, in milliseconds."""
+
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class ThroughputPoint(BaseModel):
+    """TTS requests that ended within one time bucket of the run."""
+
+    elapsed_s: float  # bucket start, since the start of synthesis
+    requests: int
+    errors: int
+    chars: int  # characters of successful requests
+    bytes: int  # audio bytes received
+
+
+class TTSRequestStats(BaseModel):
+    """Per-request telemetry of a TTS run, aggregated (raw samples: samples_path)."""
+
+    requests: int = 0  # API attempts, cache hits excluded
+    failed_requests: int = 0
+    cancelled_requests: int = 0  # lost to their hedge (or stopped with the run)
+    latency: LatencyPercentiles = Field(default_factory=LatencyPercentiles)  # successful requests
+    first_byte: LatencyPercentiles = Field(default_factory=LatencyPercentiles)
+    chars_per_s: float = 0.0  # successful characters per second of synthesis
+    audio_bytes: int = 0
+    throughput: list[ThroughputPoint] = Field(default_factory=list)
+    attempts_histogram: dict[int, int] = Field(default_factory=dict)  # attempts -> chunks
+    errors_by_type: dict[str, int] = Field(default_factory=dict)  # "http_429", "ReadTimeout", ...
+    samples_path: str | None = None
+
+
 class TTSReport(BaseModel):
     """Report from TTS stage."""
 
@@ -169,10 +291,56 @@ class TTSReport(BaseModel):
     completed_chunks: int
     failed_chunks: int
     total_duration_ms: int
+    adaptive_concurrency: bool = False
+    final_concurrency: int | None = None
+    throttled_requests: int = 0  # 429/5xx/timeout responses, including retried ones
+    concurrency_trajectory: list[ConcurrencyPoint] = Field(default_factory=list)
+    rate_limit_wait_s: float = 0.0  # summed over requests waiting for provider quota
+    cache_hits: int = 0  # chunks served from the audio cache without an API call
+    deduplicated_chunks: int = 0  # pending chunks that reused the audio of one with equal text
+    deduplicated_chars: int = 0  # characters those chunks did not send to the provider
+    head_chunks: int = 0  # first chunks per chapter synthesized ahead of the rest
+    playback_map_publishes: int = 0  # mid-run rewrites of playback_map.jsonl
+    all_chapters_playable_s: float | None = None  # run time until every chapter could start
+    requests: TTSRequestStats = Field(default_factory=TTSRequestStats)
+    hedged_requests: int = 0  # second requests sent for slow ones
+    hedge_wins: int = 0  # hedges that finished before the original
+    hedge_chars: int = 0  # characters spent on hedges
+    hedge_threshold_ms: float | None = None  # last live latency threshold for hedging
+    batched_requests: int = 0  # packed requests planned for runs of short chunks
+    batched_chunks: int = 0  # chunks in those requests
+    batch_split_fallbacks: int = 0  # packed requests redone per chunk (unsplit or failed)
+    reconciled: bool = False  # progress rebuilt from audio on disk (--reconcile)
+    reconciled_valid: int = 0  # chunks whose existing audio was kept
+    reconciled_invalid: list[str] = Field(default_factory=list)  # corrupt/truncated, redone
+    event_loop_lag_p99_ms: float = 0.0  # how late the loop ran tasks (blocking work)
+    event_loop_lag_max_ms: float = 0.0
     warnings: list[str] = Field(default_factory=list)
     errors: list[str] = Field(default_factory=list)
 
 
+class TTSEstimate(BaseModel):
+    """Dry-run estimate of a TTS run with one provider/voice (tts --dry-run)."""
+
+    provider: str
+    voice: str
+    model: str
+    pending_chunks: int
+    deduplicated_chunks: int = 0  # pending chunks that would reuse another's audio
+    cached_chunks: int = 0  # distinct texts already in the audio cache
+    requests: int = 0
+    billable_chars: int = 0
+    hedge_chars_max: int = 0  # hedges may send up to this many characters more
+    price_per_million_chars: float | None = None
+    cost_usd: float | None = None  # billable characters at that price; None if unknown
+    audio_duration_s: float = 0.0  # at the voice's past speaking rate
+    throughput_basis: str = "none"  # past runs used: same "voice", "model", "provider" or "none"
+    throughput_runs: int = 0
+    chars_per_s: float | None = None  # expected, after quotas; None without runs or quotas
+    eta_s: float | None = None  # a lower bound (quotas only) when throughput_basis is "none"
+    limited_by: str | None = None  # "concurrency", "chars_per_minute" or "requests_per_minute"
+
+
 class ValidationIssue(BaseModel):
     """Single validation issue."""
 
@@ -192,6 +360,38 @@ class ValidateReport(BaseModel):
     issues: list[ValidationIssue] = Field(default_factory=list)
     error_count: int = 0
     warning_count: int = 0
+    near_duplicate_clusters: int = 0
+    low_memory: bool = False
+    peak_rss_mb: float | None = None  # process high-water mark
+
+
+class VerifyPackReport(BaseModel):
+    """Report from verify-pack: cross-artifact consistency of a book pack."""
+
+    success: bool
+    book_id: str
+    total_chunks: int
+    playback_entries: int = 0
+    audio_files_checked: int = 0
+    rag_vectors: int = 0
+    checkpoints: int = 0
+    issues: list[ValidationIssue] = Field(default_factory=list)
+    error_count: int = 0
+    warning_count: int = 0
+    elapsed_s: float = 0.0
+
+
+class PackageAudioReport(BaseModel):
+    """Report from package-audio: chunk audio joined into chapter files."""
+
+    success: bool
+    book_id: str
+    chapters: int
+    chunks: int
+    total_bytes: int
+    total_duration_ms: int
+    files_before: int  # per-chunk files the player would otherwise fetch
+    elapsed_s: float = 0.0
 
 
 class RAGMeta(BaseModel):
@@ -201,6 +401,7 @@ class RAGMeta(BaseModel):
     chunk_id: str
     chunk_index: int
     chapter_id: str
+    passage_id: str | None = None  # set when passages are embedded instead of chunks
 
 
 class RAGReport(BaseModel):
@@ -213,6 +414,7 @@ class RAGReport(BaseModel):
     vectors_indexed: int
     dimensions: int
     index_type: str
+    embedding_unit: Literal["chunks", "passages"] = "chunks"
     warnings: list[str] = Field(default_factory=list)
     errors: list[str] = Field(default_factory=list)
 
@@ -2,10 +2,15 @@
 
 import logging
 import re
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Lines after a candidate inspected by _validate_chapter_context
+CONTEXT_LINES = 6
+
 # Chapter detection patterns
 CHAPTER_PATTERNS = [
     (
@@ -62,6 +67,26 @@ def detect_chapter_boundaries(
         text: Full text to scan
         llm_chapter_pattern: Optional regex from LLM analysis, prepended to patterns
 
+    Returns:
+        List of ChapterCandidate in order of appearance
+    """
+    return detect_chapter_boundaries_in_lines(text.split("\n"), llm_chapter_pattern)
+
+
+def detect_chapter_boundaries_in_lines(
+    lines: Iterable[str],
+    llm_chapter_pattern: str | None = None,
+) -> list[ChapterCandidate]:
+    """
+    Detect potential chapter boundaries from a stream of lines.
+
+    Only a small lookahead window is held in memory, so this works on
+    lines read lazily from a memory-mapped file.
+
+    Args:
+        lines: Lines of the text without trailing newlines (as ``text.split("\\n")``)
+        llm_chapter_pattern: Optional regex from LLM analysis, prepended to patterns
+
     Returns:
         List of ChapterCandidate in order of appearance
     """
@@ -80,45 +105,59 @@ def detect_chapter_boundaries(
             logger.warning("Invalid LLM chapter pattern '%s': %s", llm_chapter_pattern, e)
 
     candidates: list[ChapterCandidate] = []
-    lines = text.split("\n")
     char_offset = 0
+    previous_line = ""
 
-    for line_num, line in enumerate(lines):
-        # Check position - must be at start or after blank line
-        if line_num > 0 and lines[line_num - 1].strip():
-            char_offset += len(line) + 1
-            continue
-
-        # Try each pattern
-        for pattern_name, pattern in patterns:
-            if pattern.match(line):
-                # Reject single-letter roman numeral matches that are drop caps
-                if pattern_name == "roman_numeral_line" and _is_drop_cap(lines, line_num):
-                    logger.debug(
-                        "Skipping drop cap '%s' at line %d", line.strip(), line_num
-                    )
-                    break
+    # window[0] is the current line, followed by up to CONTEXT_LINES of lookahead
+    source = iter(lines)
+    window: deque[str] = deque()
+    for line in source:
+        window.append(line)
+        if len(window) > CONTEXT_LINES:
+            break
 
-                # Validate with context
-                if _validate_chapter_context(lines, line_num):
-                    title = _extract_title(line, pattern_name)
-                    candidates.append(
-                        ChapterCandidate(
-                            line_number=line_num,
-                            char_start=char_offset,
-                            title=title,
-                            pattern_name=pattern_name,
+    line_num = 0
+    while window:
+        line = window[0]
+
+        # Check position - must be at start or after blank line
+        if line_num == 0 or not previous_line.strip():
+            # Try each pattern
+            for pattern_name, pattern in patterns:
+                if pattern.match(line):
+                    context = list(window)
+                    # Reject single-letter roman numeral matches that are drop caps
+                    if pattern_name == "roman_numeral_line" and _is_drop_cap(context, 0):
+                        logger.debug(
+                            "Skipping drop cap '%s' at line %d", line.strip(), line_num
+                        )
+                        break
+
+                    # Validate with context
+                    if _validate_chapter_context(context, 0):
+                        title = _extract_title(line, pattern_name)
+                        candidates.append(
+                            ChapterCandidate(
+                                line_number=line_num,
+                                char_start=char_offset,
+                                title=title,
+                                pattern_name=pattern_name,
+                            )
                         )
-                    )
-                    logger.debug(
-                        "Found chapter candidate: '%s' at line %d (pattern: %s)",
-                        title,
-                        line_num,
-                        pattern_name,
-                    )
-                break
+                        logger.debug(
+                            "Found chapter candidate: '%s' at line %d (pattern: %s)",
+                            title,
+                            line_num,
+                            pattern_name,
+                        )
+                    break
 
         char_offset += len(line) + 1
+        previous_line = window.popleft()
+        line_num += 1
+        next_line = next(source, None)
+        if next_line is not None:
+            window.append(next_line)
 
     return candidates
 
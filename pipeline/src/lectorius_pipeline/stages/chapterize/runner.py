@@ -5,10 +5,17 @@ import re
 from collections import Counter
 from pathlib import Path
 
+from lectorius_pipeline.config import DEFAULT_CONFIG, PipelineConfig
 from lectorius_pipeline.errors import OverlappingChaptersError
 from lectorius_pipeline.schemas import Chapter, ChapterizeReport, IngestReport, Manifest
+from lectorius_pipeline.utils.mapped_text import MappedText
+from lectorius_pipeline.utils.resources import peak_rss_mb
 
-from .detector import ChapterCandidate, detect_chapter_boundaries
+from .detector import (
+    ChapterCandidate,
+    detect_chapter_boundaries,
+    detect_chapter_boundaries_in_lines,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,15 +23,22 @@ MIN_CHAPTER_CHARS = 500
 LARGE_CHAPTER_THRESHOLD = 0.20  # 20% of book
 
 
-def run_chapterize(output_dir: Path, book_id: str) -> ChapterizeReport:
+def run_chapterize(
+    output_dir: Path,
+    book_id: str,
+    config: PipelineConfig = DEFAULT_CONFIG,
+) -> ChapterizeReport:
     """
     Run the chapterize stage.
 
-    Detects chapter boundaries from raw_text.txt.
+    Detects chapter boundaries from raw_text.txt. With ``config.low_memory``
+    the text is memory-mapped and scanned line by line instead of being
+    loaded into a single string.
 
     Args:
         output_dir: Book output directory
         book_id: Book identifier
+        config: Pipeline configuration
 
     Returns:
         ChapterizeReport with processing results
@@ -32,7 +46,21 @@ def run_chapterize(output_dir: Path, book_id: str) -> ChapterizeReport:
     logger.info("Starting chapterize stage for %s", book_id)
 
     raw_text_path = output_dir / "raw_text.txt"
+    if config.low_memory:
+        with MappedText(raw_text_path) as mapped:
+            return _chapterize_text(output_dir, book_id, mapped, config)
+
     text = raw_text_path.read_text(encoding="utf-8")
+    return _chapterize_text(output_dir, book_id, text, config)
+
+
+def _chapterize_text(
+    output_dir: Path,
+    book_id: str,
+    text: str | MappedText,
+    config: PipelineConfig,
+) -> ChapterizeReport:
+    """Detect, build and write chapters for an in-memory or mapped text."""
     text_length = len(text)
 
     warnings: list[str] = []
@@ -42,7 +70,12 @@ def run_chapterize(output_dir: Path, book_id: str) -> ChapterizeReport:
     llm_chapter_pattern = _get_llm_chapter_pattern(output_dir)
 
     # Detect candidates
-    candidates = detect_chapter_boundaries(text, llm_chapter_pattern=llm_chapter_pattern)
+    if isinstance(text, MappedText):
+        candidates = detect_chapter_boundaries_in_lines(
+            text.iter_lines(), llm_chapter_pattern=llm_chapter_pattern
+        )
+    else:
+        candidates = detect_chapter_boundaries(text, llm_chapter_pattern=llm_chapter_pattern)
 
     # Filter out mid-sentence false boundaries
     candidates = _validate_chapter_boundaries(candidates, text, warnings)
@@ -88,6 +121,8 @@ def run_chapterize(output_dir: Path, book_id: str) -> ChapterizeReport:
         chapters_detected=len(chapters),
         pattern_matches=dict(pattern_counts),
         fallback_used=fallback_used,
+        low_memory=config.low_memory,
+        peak_rss_mb=peak_rss_mb(),
         warnings=warnings,
     )
     _write_report(output_dir / "reports", report)
@@ -160,7 +195,7 @@ def _create_fallback_chapter(book_id: str, text_length: int) -> Chapter:
 
 def _merge_tiny_chapters(
     chapters: list[Chapter],
-    text: str,
+    text: str | MappedText,
     book_id: str,
 ) -> tuple[list[Chapter], list[str]]:
     """Merge chapters smaller than MIN_CHAPTER_CHARS with previous."""
@@ -327,7 +362,7 @@ def _extract_pattern_stem(pattern: str) -> str | None:
 
 def _validate_chapter_boundaries(
     candidates: list[ChapterCandidate],
-    text: str,
+    text: str | MappedText,
     warnings: list[str],
 ) -> list[ChapterCandidate]:
     """Filter out chapter boundaries where previous text doesn't end with sentence punctuation.
@@ -346,17 +381,8 @@ def _validate_chapter_boundaries(
             valid.append(candidate)
             continue
 
-        before = text[: candidate.char_start].rstrip()
-        if not before:
-            valid.append(candidate)
-            continue
-
         # Check last non-blank line for sentence-ending punctuation
-        last_line = ""
-        for line in reversed(before.split("\n")):
-            if line.strip():
-                last_line = line.strip()
-                break
+        last_line = _last_nonblank_line(text, candidate.char_start)
 
         # Accept if: no text, ends with punctuation, or last line is short
         # (short lines are likely captions/headings, not mid-sentence prose)
@@ -380,6 +406,22 @@ def _validate_chapter_boundaries(
     return valid
 
 
+def _last_nonblank_line(text: str | MappedText, end: int) -> str:
+    """Return the last non-blank line (stripped) of ``text[:end]``.
+
+    Reads backwards in growing windows rather than slicing the whole prefix,
+    which keeps the check cheap for memory-mapped texts.
+    """
+    window = 4096
+    while True:
+        start = max(0, end - window)
+        before = text[start:end].rstrip()
+        newline = before.rfind("\n")
+        if newline != -1 or start == 0:
+            return before[newline + 1 :].strip()
+        window *= 2
+
+
 def _get_llm_chapter_pattern(output_dir: Path) -> str | None:
     """Load LLM chapter pattern hint from ingest report if available."""
     path = output_dir / "reports" / "ingest.json"
@@ -0,0 +1,170 @@
+"""Retrieval passages and memory sections derived alongside playback chunks."""
+
+import logging
+from typing import TYPE_CHECKING
+
+from lectorius_pipeline.schemas import Chunk, MemorySection, Passage
+
+from .splitter import (
+    split_into_sentences_regex,
+    split_into_sentences_spacy,
+    split_text_into_paragraphs,
+)
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+logger = logging.getLogger(__name__)
+
+# Rough English average, good enough for budgeting LLM prompt size
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(char_count: int) -> int:
+    """Estimate LLM tokens for a span of text."""
+    return (char_count + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def split_passages(
+    chunk: Chunk,
+    target_chars: int,
+    first_passage_index: int,
+    nlp: "Language | None" = None,
+) -> list[Passage]:
+    """
+    Split a chunk into sentence-aligned retrieval passages.
+
+    Passages never cross the parent chunk's boundaries and are exact
+    substrings of its text, so char offsets stay consistent with chunks.jsonl.
+
+    Args:
+        chunk: Parent playback chunk
+        target_chars: Passage size to pack sentences up to
+        first_passage_index: Global index for the first passage
+        nlp: Optional spacy model (regex splitting otherwise)
+
+    Returns:
+        Passages in text order
+    """
+    text = chunk.text
+
+    # Start offset of each sentence within the chunk text
+    starts: list[int] = [0]
+    cursor = 0
+    for para in split_text_into_paragraphs(text):
+        if nlp:
+            sentences = split_into_sentences_spacy(para, nlp)
+        else:
+            sentences = split_into_sentences_regex(para)
+        for sentence in sentences:
+            start = text.find(sentence, cursor)
+            if start == -1:
+                # Splitter normalized this sentence; it stays with its predecessor
+                continue
+            if start > starts[-1]:
+                starts.append(start)
+            cursor = start + len(sentence)
+
+    # Each sentence runs up to the next one, minus the separator whitespace
+    spans = [
+        (start, len(text[:next_start].rstrip()))
+        for start, next_start in zip(starts, starts[1:] + [len(text)])
+    ]
+
+    # Pack sentences greedily up to target_chars
+    groups: list[tuple[int, int]] = []
+    group_start, group_end = spans[0]
+    for start, end in spans[1:]:
+        if end - group_start > target_chars:
+            groups.append((group_start, group_end))
+            group_start = start
+        group_end = end
+    groups.append((group_start, group_end))
+
+    return [
+        _create_passage(chunk, start, end, n, first_passage_index + n - 1)
+        for n, (start, end) in enumerate(groups, start=1)
+    ]
+
+
+def _create_passage(
+    chunk: Chunk,
+    start: int,
+    end: int,
+    ordinal: int,
+    passage_index: int,
+) -> Passage:
+    """Create the ``ordinal``-th Passage of a chunk for chunk.text[start:end]."""
+    return Passage(
+        book_id=chunk.book_id,
+        chapter_id=chunk.chapter_id,
+        chunk_id=chunk.chunk_id,
+        chunk_index=chunk.chunk_index,
+        passage_id=f"{chunk.chunk_id}_p{ordinal:02d}",
+        passage_index=passage_index,
+        text=chunk.text[start:end],
+        char_start=chunk.char_start + start,
+        char_end=chunk.char_start + end,
+    )
+
+
+class SectionBuilder:
+    """Group consecutive chunks into memory sections under a token budget.
+
+    A section is closed before the chunk that would push it over budget,
+    so each memory checkpoint prompt stays roughly the same size no matter
+    how long individual chunks are. A single chunk larger than the budget
+    gets a section of its own.
+    """
+
+    def __init__(self, book_id: str, token_budget: int) -> None:
+        self._book_id = book_id
+        self._token_budget = token_budget
+        self._section_index = 0
+        self._first: Chunk | None = None
+        self._last: Chunk | None = None
+        self._chunk_count = 0
+        self._char_count = 0
+
+    def add(self, chunk: Chunk) -> MemorySection | None:
+        """Add the next chunk; return the section it closed, if any."""
+        closed = None
+        chars = len(chunk.text)
+        if (
+            self._first is not None
+            and estimate_tokens(self._char_count + chars) > self._token_budget
+        ):
+            closed = self._close()
+
+        if self._first is None:
+            self._first = chunk
+        self._last = chunk
+        self._chunk_count += 1
+        self._char_count += chars
+        return closed
+
+    def finish(self) -> MemorySection | None:
+        """Close and return the final partial section."""
+        if self._first is None:
+            return None
+        return self._close()
+
+    def _close(self) -> MemorySection:
+        assert self._first is not None and self._last is not None
+        self._section_index += 1
+        section = MemorySection(
+            book_id=self._book_id,
+            section_index=self._section_index,
+            first_chunk_id=self._first.chunk_id,
+            first_chunk_index=self._first.chunk_index,
+            last_chunk_id=self._last.chunk_id,
+            last_chunk_index=self._last.chunk_index,
+            chunk_count=self._chunk_count,
+            char_count=self._char_count,
+            est_tokens=estimate_tokens(self._char_count),
+        )
+        self._first = None
+        self._last = None
+        self._chunk_count = 0
+        self._char_count = 0
+        return section
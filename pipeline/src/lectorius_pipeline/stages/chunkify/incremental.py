@@ -0,0 +1,143 @@
+"""Incremental re-chunking with content-stable chunk IDs.
+
+Positional chunk IDs (``{chapter_id}_{chunk_index:06d}``) shift whenever an
+earlier chapter gains or loses a chunk, which invalidates every audio file,
+embedding and memory checkpoint after the edit. In incremental mode chunk IDs
+are derived from the chunk text instead, and chapters whose text (and
+chunking settings) hash the same as last run are copied from the previous
+chunks.jsonl rather than re-chunked.
+"""
+
+import hashlib
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from lectorius_pipeline.config import ChunkConfig
+from lectorius_pipeline.schemas import (
+    ChapterChunkState,
+    Chunk,
+    ChunkChangeSet,
+    ChunkifyReport,
+)
+from lectorius_pipeline.utils.io import iter_chunks
+
+logger = logging.getLogger(__name__)
+
+# Hex digits of the text digest used in stable chunk IDs
+STABLE_ID_DIGEST_LENGTH = 12
+
+
+def chapter_text_hash(chapter_text: str, chunk_config: ChunkConfig) -> str:
+    """Fingerprint a chapter's text together with the settings that shape its chunks."""
+    settings = (
+        f"{chunk_config.target_chars}|{chunk_config.min_chars}|{chunk_config.max_chars}"
+        f"|{chunk_config.sentence_splitter}|{chunk_config.spacy_model}"
+        f"|{chunk_config.incremental}"
+    )
+    digest = hashlib.sha256(settings.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(chapter_text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def stable_chunk_ids(chunks: Iterable[Chunk]) -> list[str]:
+    """
+    Derive content-stable IDs for one chapter's chunks.
+
+    The ID is ``{chapter_id}_{digest}`` where digest is a prefix of the
+    sha1 of the chunk text. Repeated identical texts within a chapter get a
+    ``-2``, ``-3``... suffix in order of appearance.
+    """
+    ids: list[str] = []
+    seen: dict[str, int] = {}
+    for chunk in chunks:
+        digest = hashlib.sha1(chunk.text.encode("utf-8")).hexdigest()[:STABLE_ID_DIGEST_LENGTH]
+        base = f"{chunk.chapter_id}_{digest}"
+        seen[base] = seen.get(base, 0) + 1
+        ids.append(base if seen[base] == 1 else f"{base}-{seen[base]}")
+    return ids
+
+
+def load_previous_states(output_dir: Path) -> dict[str, ChapterChunkState]:
+    """Load per-chapter fingerprints from the previous chunkify report, if any."""
+    path = output_dir / "reports" / "chunks.json"
+    if not path.exists():
+        return {}
+    try:
+        report = ChunkifyReport.model_validate_json(path.read_text())
+    except ValidationError as e:
+        logger.warning("Ignoring unreadable previous chunkify report: %s", e)
+        return {}
+    return report.chapter_states
+
+
+def load_previous_chunks(
+    output_dir: Path, reusable: set[str]
+) -> tuple[list[str], dict[str, list[Chunk]]]:
+    """
+    Read the previous chunks.jsonl before it is replaced.
+
+    Args:
+        output_dir: Book output directory
+        reusable: Chapter IDs whose chunks may be copied forward
+
+    Returns:
+        Tuple of (every previous chunk ID in order, chunks of reusable chapters)
+    """
+    if not (output_dir / "chunks.jsonl").exists():
+        return [], {}
+
+    ids: list[str] = []
+    by_chapter: dict[str, list[Chunk]] = {}
+    for chunk in iter_chunks(output_dir):
+        ids.append(chunk.chunk_id)
+        if chunk.chapter_id in reusable:
+            by_chapter.setdefault(chunk.chapter_id, []).append(chunk)
+    return ids, by_chapter
+
+
+def shift_chunks(chunks: list[Chunk], delta: int) -> list[Chunk]:
+    """Move reused chunks to their chapter's new position in raw_text."""
+    if delta == 0:
+        return chunks
+    return [
+        chunk.model_copy(
+            update={"char_start": chunk.char_start + delta, "char_end": chunk.char_end + delta}
+        )
+        for chunk in chunks
+    ]
+
+
+def build_change_set(
+    book_id: str,
+    previous_ids: list[str],
+    current_ids: list[str],
+    rechunked_chapters: list[str],
+    reused_chapters: list[str],
+) -> ChunkChangeSet:
+    """Compare the previous and current chunk ID sequences."""
+    previous = set(previous_ids)
+    current = set(current_ids)
+
+    first_changed_index = None
+    for i in range(max(len(previous_ids), len(current_ids))):
+        old = previous_ids[i] if i < len(previous_ids) else None
+        new = current_ids[i] if i < len(current_ids) else None
+        if old != new:
+            first_changed_index = i + 1
+            break
+
+    return ChunkChangeSet(
+        book_id=book_id,
+        previous_chunks=len(previous_ids),
+        total_chunks=len(current_ids),
+        first_changed_index=first_changed_index,
+        rechunked_chapters=rechunked_chapters,
+        reused_chapters=reused_chapters,
+        added=[cid for cid in current_ids if cid not in previous],
+        removed=[cid for cid in previous_ids if cid not in current],
+        unchanged=[cid for cid in current_ids if cid in previous],
+    )
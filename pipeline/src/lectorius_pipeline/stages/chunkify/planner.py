@@ -0,0 +1,105 @@
+"""Vectorized chunk boundary planning.
+
+Computes the same split points as the greedy packing loop in
+``runner._pack_paragraphs_greedy``, but from cumulative length arrays.
+For every possible chunk start the end of that chunk is found with
+``np.searchsorted`` in one batch; the actual plan is then the chain of
+starts reachable from the first unit, which only costs one step per chunk.
+"""
+
+import numpy as np
+
+
+def plan_paragraph_spans(
+    para_lengths: np.ndarray,
+    sentence_end: np.ndarray,
+    target_chars: int,
+    max_chars: int,
+) -> list[tuple[int, int, bool]]:
+    """Plan chunk spans over a chapter's paragraphs.
+
+    Paragraphs are joined with a 2-char ``\\n\\n`` separator. A chunk grows
+    while it fits ``target_chars``; past that it keeps absorbing paragraphs
+    until one ends a sentence, as long as it stays within ``max_chars``.
+    A paragraph longer than ``target_chars`` that would start a chunk is
+    emitted on its own and sentence-split by the caller.
+
+    Args:
+        para_lengths: Length of each paragraph.
+        sentence_end: True where a paragraph ends with sentence punctuation.
+        target_chars: Soft chunk size.
+        max_chars: Hard chunk size when extending to a sentence end.
+
+    Returns:
+        List of (first, last, split_sentences) paragraph index spans, inclusive.
+    """
+    n = len(para_lengths)
+    if n == 0:
+        return []
+
+    lengths = np.asarray(para_lengths, dtype=np.int64)
+    starts = np.arange(n)
+
+    # prefix[i] = sum of (length + separator) over paragraphs [0, i)
+    prefix = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(lengths + 2, out=prefix[1:])
+
+    # Joined length of paragraphs s..k is prefix[k + 1] - prefix[s] - 2
+    base = prefix[:n] + 2
+    fit_target = np.searchsorted(prefix, base + target_chars, side="right") - 2
+    fit_max = np.searchsorted(prefix, base + max_chars, side="right") - 2
+
+    # First paragraph at or after i that ends a sentence (n if none)
+    ends_at = np.where(np.asarray(sentence_end, dtype=bool), starts, n)
+    next_end = np.minimum.accumulate(ends_at[::-1])[::-1]
+
+    # Extend past target to the next sentence end, unless that would pass max
+    fit_target = np.maximum(fit_target, starts)
+    candidate = next_end[fit_target]
+    last = np.where(candidate <= fit_max, candidate, fit_max)
+    last = np.maximum(last, fit_target)
+
+    oversized = lengths > target_chars
+    last = np.where(oversized, starts, last)
+
+    spans: list[tuple[int, int, bool]] = []
+    s = 0
+    while s < n:
+        e = int(last[s])
+        spans.append((s, e, bool(oversized[s])))
+        s = e + 1
+    return spans
+
+
+def plan_sentence_spans(sentence_lengths: np.ndarray, target_chars: int) -> list[tuple[int, int]]:
+    """Plan chunk spans over the sentences of one oversized paragraph.
+
+    Sentences are joined with a single space and packed greedily up to
+    ``target_chars``; a sentence that alone exceeds the target is its own chunk.
+
+    Args:
+        sentence_lengths: Length of each sentence.
+        target_chars: Soft chunk size.
+
+    Returns:
+        List of (first, last) sentence index spans, inclusive.
+    """
+    n = len(sentence_lengths)
+    if n == 0:
+        return []
+
+    lengths = np.asarray(sentence_lengths, dtype=np.int64)
+    prefix = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(lengths + 1, out=prefix[1:])
+
+    base = prefix[:n] + 1
+    last = np.searchsorted(prefix, base + target_chars, side="right") - 2
+    last = np.maximum(last, np.arange(n))
+
+    spans: list[tuple[int, int]] = []
+    s = 0
+    while s < n:
+        e = int(last[s])
+        spans.append((s, e))
+        s = e + 1
+    return spans
@@ -2,12 +2,38 @@
 
 import logging
 import re
+from contextlib import ExitStack
+from dataclasses import replace
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 from lectorius_pipeline.config import ChunkConfig, PipelineConfig
 from lectorius_pipeline.errors import ChunkTooLargeError, OffsetMismatchError
-from lectorius_pipeline.schemas import Chapter, Chunk, ChunkifyReport, Manifest
-
+from lectorius_pipeline.schemas import (
+    Chapter,
+    ChapterChunkState,
+    Chunk,
+    ChunkChangeSet,
+    ChunkifyReport,
+    Manifest,
+)
+from lectorius_pipeline.utils.io import atomic_write, load_book_meta
+from lectorius_pipeline.utils.mapped_text import MappedText
+from lectorius_pipeline.utils.resources import peak_rss_mb
+from lectorius_pipeline.utils.speech_rate import SpeechRate, estimate_speech_rate
+
+from .granularity import SectionBuilder, split_passages
+from .incremental import (
+    build_change_set,
+    chapter_text_hash,
+    load_previous_chunks,
+    load_previous_states,
+    shift_chunks,
+    stable_chunk_ids,
+)
+from .planner import plan_paragraph_spans, plan_sentence_spans
 from .splitter import (
     ends_with_sentence_punctuation,
     load_spacy_model,
@@ -17,8 +43,21 @@ from .splitter import (
     unwrap_hard_wrapped_lines,
 )
 
+if TYPE_CHECKING:
+    from spacy.language import Language
+
 logger = logging.getLogger(__name__)
 
+# min/max chars as a fraction of the derived target when sizing by duration.
+# Narrower than the 200/600/1600 defaults so audio lengths cluster tighter,
+# while still leaving room to reach a sentence end.
+DURATION_MIN_RATIO = 0.5
+DURATION_MAX_RATIO = 2.0
+
+# Extra granularities written when ChunkConfig.multi_granularity is set
+PASSAGES_FILENAME = "passages.jsonl"
+SECTIONS_FILENAME = "sections.jsonl"
+
 # Pattern to match chapter headings at start of chapter text
 CHAPTER_HEADING_RE = re.compile(
     r"^(?:"
@@ -36,7 +75,24 @@ def run_chunkify(output_dir: Path, book_id: str, config: PipelineConfig) -> Chun
     """
     Run the chunkify stage.
 
-    Splits text into chunks of approximately target_chars size.
+    Splits text into chunks of approximately target_chars size. Chapters are
+    chunked one at a time and written straight to chunks.jsonl, so only one
+    chapter's chunks are held in memory. With ``config.low_memory`` the raw
+    text is memory-mapped rather than read into a single string.
+
+    With ``chunking.multi_granularity`` the same pass also writes
+    passages.jsonl (sentence-aligned retrieval passages, each inside one
+    parent chunk) and sections.jsonl (token-budgeted chunk runs used as
+    memory checkpoint boundaries).
+
+    With ``chunking.incremental`` chunk IDs are derived from chunk text, and
+    chapters whose text hash matches the previous run are copied from the
+    old chunks.jsonl instead of re-chunked. The added/removed/unchanged chunk
+    IDs are written to reports/chunk_changes.json.
+
+    With ``chunking.target_seconds`` the char targets are derived from a
+    duration budget, using the speaking rate learned from audio already
+    generated for the book's TTS voice (see utils.speech_rate).
 
     Args:
         output_dir: Book output directory
@@ -47,10 +103,27 @@ def run_chunkify(output_dir: Path, book_id: str, config: PipelineConfig) -> Chun
         ChunkifyReport with processing results
     """
     logger.info("Starting chunkify stage for %s", book_id)
-    chunk_config = config.chunking
 
-    # Load text and chapters
-    raw_text = (output_dir / "raw_text.txt").read_text(encoding="utf-8")
+    raw_text_path = output_dir / "raw_text.txt"
+    if config.low_memory:
+        with MappedText(raw_text_path) as mapped:
+            return _chunkify_text(output_dir, book_id, mapped, config)
+
+    raw_text = raw_text_path.read_text(encoding="utf-8")
+    return _chunkify_text(output_dir, book_id, raw_text, config)
+
+
+def _chunkify_text(
+    output_dir: Path,
+    book_id: str,
+    raw_text: str | MappedText,
+    config: PipelineConfig,
+) -> ChunkifyReport:
+    """Chunk every chapter of an in-memory or mapped text and stream the results."""
+    chunk_config = config.chunking
+    speech_rate: SpeechRate | None = None
+    if chunk_config.target_seconds:
+        chunk_config, speech_rate = _duration_chunk_config(output_dir, chunk_config)
     chapters = _load_chapters(output_dir)
 
     # Try to load spacy
@@ -65,61 +138,205 @@ def run_chunkify(output_dir: Path, book_id: str, config: PipelineConfig) -> Chun
     if chunk_config.sentence_splitter == "spacy" and nlp is None:
         warnings.append("spacy unavailable, using regex sentence splitter")
 
-    # Process each chapter
-    all_chunks: list[Chunk] = []
+    # Running stats, so chunks can be written as soon as each chapter is done
+    text_length = len(raw_text)
+    total_chunks = 0
+    total_chars = 0
+    min_chars = 0
+    max_chars = 0
+    previous: Chunk | None = None
     global_chunk_index = 0
 
-    for chapter in chapters:
-        chapter_text = raw_text[chapter.char_start : chapter.char_end]
-
-        if not chapter_text.strip():
-            warnings.append(f"Chapter {chapter.chapter_id} is empty, skipping")
-            continue
-
-        chapter_chunks, global_chunk_index = _chunkify_chapter(
-            chapter_text=chapter_text,
-            chapter=chapter,
-            book_id=book_id,
-            global_chunk_index=global_chunk_index,
-            chunk_config=chunk_config,
-            nlp=nlp,
-        )
-
-        all_chunks.extend(chapter_chunks)
+    multi_granularity = chunk_config.multi_granularity
+    section_builder = SectionBuilder(book_id, chunk_config.section_token_budget)
+    total_passages = 0
+    total_sections = 0
+
+    incremental = chunk_config.incremental
+    chapter_states: dict[str, ChapterChunkState] = {}
+    previous_states: dict[str, ChapterChunkState] = {}
+    previous_ids: list[str] = []
+    reusable_chunks: dict[str, list[Chunk]] = {}
+    current_ids: list[str] = []
+    rechunked_chapters: list[str] = []
+    reused_chapters: list[str] = []
+    if incremental:
+        previous_states = load_previous_states(output_dir)
+        for chapter in chapters:
+            chapter_states[chapter.chapter_id] = ChapterChunkState(
+                text_hash=chapter_text_hash(
+                    raw_text[chapter.char_start : chapter.char_end], chunk_config
+                ),
+                char_start=chapter.char_start,
+            )
+        reusable = {
+            chapter_id
+            for chapter_id, state in chapter_states.items()
+            if chapter_id in previous_states
+            and previous_states[chapter_id].text_hash == state.text_hash
+        }
+        # Must happen before atomic_write replaces chunks.jsonl
+        previous_ids, reusable_chunks = load_previous_chunks(output_dir, reusable)
+
+    with ExitStack() as stack:
+        f = stack.enter_context(atomic_write(output_dir / "chunks.jsonl"))
+        if multi_granularity:
+            passages_f = stack.enter_context(atomic_write(output_dir / PASSAGES_FILENAME))
+            sections_f = stack.enter_context(atomic_write(output_dir / SECTIONS_FILENAME))
+
+        for chapter in chapters:
+            chapter_text = raw_text[chapter.char_start : chapter.char_end]
+            if not incremental:
+                chapter_states[chapter.chapter_id] = ChapterChunkState(
+                    text_hash=chapter_text_hash(chapter_text, chunk_config),
+                    char_start=chapter.char_start,
+                )
 
-    if not all_chunks:
-        raise ChunkTooLargeError("No chunks produced from text")
+            if not chapter_text.strip():
+                warnings.append(f"Chapter {chapter.chapter_id} is empty, skipping")
+                continue
 
-    # Re-index all chunks globally (merging may have created gaps)
-    all_chunks = _reindex_chunks(all_chunks)
+            reused = reusable_chunks.get(chapter.chapter_id)
+            if reused:
+                previous_start = previous_states[chapter.chapter_id].char_start
+                chapter_chunks = shift_chunks(reused, chapter.char_start - previous_start)
+                reused_chapters.append(chapter.chapter_id)
+            else:
+                chapter_chunks, global_chunk_index = _chunkify_chapter(
+                    chapter_text=chapter_text,
+                    chapter=chapter,
+                    book_id=book_id,
+                    global_chunk_index=global_chunk_index,
+                    chunk_config=chunk_config,
+                    nlp=nlp,
+                )
+                rechunked_chapters.append(chapter.chapter_id)
 
-    # Validate offsets
-    _validate_chunk_offsets(all_chunks, raw_text)
+            # Re-index globally (merging may have created gaps)
+            chapter_chunks = _reindex_chunks(
+                chapter_chunks, start=total_chunks + 1, stable_ids=incremental
+            )
+            if incremental:
+                current_ids.extend(chunk.chunk_id for chunk in chapter_chunks)
+
+            # Validate offsets
+            _validate_chunk_offsets(chapter_chunks, text_length, previous)
+
+            for chunk in chapter_chunks:
+                f.write(chunk.model_dump_json() + "\n")
+                size = len(chunk.text)
+                total_chars += size
+                min_chars = size if total_chunks == 0 else min(min_chars, size)
+                max_chars = max(max_chars, size)
+                total_chunks += 1
+
+                if multi_granularity:
+                    for passage in split_passages(
+                        chunk, chunk_config.passage_target_chars, total_passages + 1, nlp
+                    ):
+                        passages_f.write(passage.model_dump_json() + "\n")
+                        total_passages += 1
+                    section = section_builder.add(chunk)
+                    if section:
+                        sections_f.write(section.model_dump_json() + "\n")
+                        total_sections += 1
+
+            if chapter_chunks:
+                previous = chapter_chunks[-1]
+
+        if not total_chunks:
+            raise ChunkTooLargeError("No chunks produced from text")
+
+        if multi_granularity:
+            section = section_builder.finish()
+            if section:
+                sections_f.write(section.model_dump_json() + "\n")
+                total_sections += 1
+
+    logger.debug("Wrote %s", output_dir / "chunks.jsonl")
+    if multi_granularity:
+        logger.info("Wrote %d passages and %d memory sections", total_passages, total_sections)
+    else:
+        _remove_stale_granularities(output_dir)
 
     # Calculate stats
-    chunk_sizes = [len(c.text) for c in all_chunks]
-    avg_size = sum(chunk_sizes) / len(chunk_sizes) if chunk_sizes else 0
+    avg_size = total_chars / total_chunks
 
-    # Write outputs
-    _write_chunks(output_dir, all_chunks)
-    _update_manifest(output_dir, len(all_chunks))
+    _update_manifest(output_dir, total_chunks)
+
+    if incremental:
+        change_set = build_change_set(
+            book_id, previous_ids, current_ids, rechunked_chapters, reused_chapters
+        )
+        _write_change_set(output_dir / "reports", change_set)
+        logger.info(
+            "Re-chunked %d chapters, reused %d: %d chunks added, %d removed, %d unchanged",
+            len(rechunked_chapters),
+            len(reused_chapters),
+            len(change_set.added),
+            len(change_set.removed),
+            len(change_set.unchanged),
+        )
+    else:
+        # Positional IDs: a change set from an earlier incremental run no longer applies
+        (output_dir / "reports" / "chunk_changes.json").unlink(missing_ok=True)
 
     report = ChunkifyReport(
         success=True,
         book_id=book_id,
-        total_chunks=len(all_chunks),
+        total_chunks=total_chunks,
         avg_chunk_chars=round(avg_size, 1),
-        min_chunk_chars=min(chunk_sizes) if chunk_sizes else 0,
-        max_chunk_chars=max(chunk_sizes) if chunk_sizes else 0,
+        min_chunk_chars=min_chars,
+        max_chunk_chars=max_chars,
         sentence_splitter_used=splitter_used,
+        target_chars=chunk_config.target_chars,
+        min_chars=chunk_config.min_chars,
+        max_chars=chunk_config.max_chars,
+        target_seconds=chunk_config.target_seconds,
+        chars_per_second=speech_rate.chars_per_second if speech_rate else None,
+        speech_rate_basis=speech_rate.basis if speech_rate else None,
+        total_passages=total_passages,
+        total_sections=total_sections,
+        incremental=incremental,
+        chapter_states=chapter_states,
+        low_memory=config.low_memory,
+        peak_rss_mb=peak_rss_mb(),
         warnings=warnings,
     )
     _write_report(output_dir / "reports", report)
 
-    logger.info("Chunkify stage completed: %d chunks", len(all_chunks))
+    logger.info("Chunkify stage completed: %d chunks", total_chunks)
     return report
 
 
+def _duration_chunk_config(
+    output_dir: Path, chunk_config: ChunkConfig
+) -> tuple[ChunkConfig, SpeechRate]:
+    """Convert ``target_seconds`` into char targets for the book's TTS voice."""
+    assert chunk_config.target_seconds is not None
+    book_meta = load_book_meta(output_dir)
+    provider = (book_meta.tts_provider if book_meta else None) or "openai"
+    voice = book_meta.voice_id if book_meta else None
+
+    speech_rate = estimate_speech_rate(output_dir.parent, provider, voice)
+    target = speech_rate.chars_for(chunk_config.target_seconds)
+    logger.info(
+        "Sizing chunks for %.1fs at %.2f chars/s (%s, %d samples): target %d chars",
+        chunk_config.target_seconds,
+        speech_rate.chars_per_second,
+        speech_rate.basis,
+        speech_rate.samples,
+        target,
+    )
+    sized = replace(
+        chunk_config,
+        target_chars=target,
+        min_chars=round(target * DURATION_MIN_RATIO),
+        max_chars=round(target * DURATION_MAX_RATIO),
+    )
+    return sized, speech_rate
+
+
 def _load_chapters(output_dir: Path) -> list[Chapter]:
     """Load chapters from chapters.jsonl."""
     path = output_dir / "chapters.jsonl"
@@ -136,7 +353,7 @@ def _chunkify_chapter(
     book_id: str,
     global_chunk_index: int,
     chunk_config: ChunkConfig,
-    nlp,
+    nlp: "Language | None",
 ) -> tuple[list[Chunk], int]:
     """
     Chunkify a single chapter.
@@ -168,26 +385,54 @@ def _chunkify_chapter(
         processed_paragraphs.append(unwrap_hard_wrapped_lines(para))
 
     # Build chunks using paragraph-aware packing
+    pack = (
+        _pack_paragraphs_planned
+        if chunk_config.planner == "numpy"
+        else _pack_paragraphs_greedy
+    )
+    chunks, global_chunk_index = pack(
+        paragraphs=processed_paragraphs,
+        chapter=chapter,
+        book_id=book_id,
+        global_chunk_index=global_chunk_index,
+        chunk_config=chunk_config,
+        nlp=nlp,
+        char_start=chapter.char_start + heading_skip,
+    )
+
+    # Merge tiny chunks (threshold is now 200 chars)
+    chunks = _merge_tiny_chunks(chunks, book_id, chunk_config)
+
+    # Merge chapter-heading-only chunks with next chunk
+    chunks = _merge_heading_chunks(chunks, book_id, chunk_config)
+
+    return chunks, global_chunk_index
+
+
+def _pack_paragraphs_greedy(
+    paragraphs: list[str],
+    chapter: Chapter,
+    book_id: str,
+    global_chunk_index: int,
+    chunk_config: ChunkConfig,
+    nlp: "Language | None",
+    char_start: int,
+) -> tuple[list[Chunk], int]:
+    """Pack paragraphs into chunks one paragraph at a time."""
     chunks: list[Chunk] = []
     current_paragraphs: list[str] = []
     current_len = 0
-    current_start = chapter.char_start + heading_skip
+    current_start = char_start
     para_idx = 0
 
-    while para_idx < len(processed_paragraphs):
-        para = processed_paragraphs[para_idx]
+    while para_idx < len(paragraphs):
+        para = paragraphs[para_idx]
         para_len = len(para)
 
         # If single paragraph exceeds target, we need to split it
         if para_len > chunk_config.target_chars and not current_paragraphs:
             # Split large paragraph into sentences
-            if nlp:
-                sentences = split_into_sentences_spacy(para, nlp)
-            else:
-                sentences = split_into_sentences_regex(para)
-
-            if not sentences:
-                sentences = [para]  # fallback
+            sentences = _split_sentences(para, nlp)
 
             # Pack sentences into chunks (sentence packing already ensures boundaries)
             sentence_chunks = _pack_sentences_into_chunks(
@@ -277,15 +522,76 @@ def _chunkify_chapter(
         )
         chunks.append(chunk)
 
-    # Merge tiny chunks (threshold is now 200 chars)
-    chunks = _merge_tiny_chunks(chunks, book_id, chunk_config)
+    return chunks, global_chunk_index
 
-    # Merge chapter-heading-only chunks with next chunk
-    chunks = _merge_heading_chunks(chunks, book_id, chunk_config)
+
+def _pack_paragraphs_planned(
+    paragraphs: list[str],
+    chapter: Chapter,
+    book_id: str,
+    global_chunk_index: int,
+    chunk_config: ChunkConfig,
+    nlp: "Language | None",
+    char_start: int,
+) -> tuple[list[Chunk], int]:
+    """Pack paragraphs into chunks from a vectorized boundary plan.
+
+    Produces the same chunks as _pack_paragraphs_greedy; only the final
+    joining of planned spans happens per chunk in Python.
+    """
+    para_lengths = np.fromiter((len(p) for p in paragraphs), dtype=np.int64, count=len(paragraphs))
+    sentence_end = np.fromiter(
+        (ends_with_sentence_punctuation(p) for p in paragraphs),
+        dtype=bool,
+        count=len(paragraphs),
+    )
+    spans = plan_paragraph_spans(
+        para_lengths, sentence_end, chunk_config.target_chars, chunk_config.max_chars
+    )
+
+    chunks: list[Chunk] = []
+    for first, last, split_sentences in spans:
+        if split_sentences:
+            sentences = _split_sentences(paragraphs[first], nlp)
+            sentence_lengths = np.fromiter(
+                (len(s) for s in sentences), dtype=np.int64, count=len(sentences)
+            )
+            texts = [
+                " ".join(sentences[s_first : s_last + 1])
+                for s_first, s_last in plan_sentence_spans(
+                    sentence_lengths, chunk_config.target_chars
+                )
+            ]
+        else:
+            if last + 1 < len(paragraphs) and not sentence_end[last]:
+                logger.warning("Chunk doesn't end with sentence punctuation but at max size")
+            texts = ["\n\n".join(paragraphs[first : last + 1])]
+
+        for text in texts:
+            global_chunk_index += 1
+            chunk = _create_chunk(
+                text=text,
+                book_id=book_id,
+                chapter_id=chapter.chapter_id,
+                chunk_index=global_chunk_index,
+                char_start=char_start,
+            )
+            chunks.append(chunk)
+            char_start = chunk.char_end
 
     return chunks, global_chunk_index
 
 
+def _split_sentences(paragraph: str, nlp: "Language | None") -> list[str]:
+    """Split a paragraph into sentences, falling back to the whole paragraph."""
+    if nlp:
+        sentences = split_into_sentences_spacy(paragraph, nlp)
+    else:
+        sentences = split_into_sentences_regex(paragraph)
+
+    return sentences or [paragraph]
+
+
 def _pack_sentences_into_chunks(
     sentences: list[str],
     book_id: str,
@@ -450,11 +756,22 @@ def _merge_heading_chunks(
     return merged
 
 
-def _reindex_chunks(chunks: list[Chunk]) -> list[Chunk]:
-    """Re-index all chunks with sequential global indices."""
+def _reindex_chunks(
+    chunks: list[Chunk], start: int = 1, stable_ids: bool = False
+) -> list[Chunk]:
+    """
+    Re-index chunks with sequential global indices beginning at ``start``.
+
+    IDs are positional (``{chapter_id}_{chunk_index:06d}``) unless
+    ``stable_ids`` is set, in which case they are derived from chunk text.
+    """
+    if stable_ids:
+        chunk_ids = stable_chunk_ids(chunks)
+    else:
+        chunk_ids = [f"{chunk.chapter_id}_{i:06d}" for i, chunk in enumerate(chunks, start=start)]
+
     reindexed: list[Chunk] = []
-    for i, chunk in enumerate(chunks, start=1):
-        chunk_id = f"{chunk.chapter_id}_{i:06d}"
+    for i, (chunk, chunk_id) in enumerate(zip(chunks, chunk_ids), start=start):
         reindexed.append(Chunk(
             book_id=chunk.book_id,
             chapter_id=chunk.chapter_id,
@@ -467,30 +784,38 @@ def _reindex_chunks(chunks: list[Chunk]) -> list[Chunk]:
     return reindexed
 
 
-def _validate_chunk_offsets(chunks: list[Chunk], raw_text: str) -> None:
-    """Validate that chunk offsets are sequential and don't overlap."""
-    for i, chunk in enumerate(chunks):
-        if chunk.char_end > len(raw_text):
+def _validate_chunk_offsets(
+    chunks: list[Chunk],
+    text_length: int,
+    previous: Chunk | None = None,
+) -> None:
+    """Validate that chunk offsets are sequential and don't overlap.
+
+    ``previous`` is the last chunk already written, so offsets can be checked
+    across chapter boundaries while chunks are streamed out.
+    """
+    prev = previous
+    for chunk in chunks:
+        if chunk.char_end > text_length:
             raise OffsetMismatchError(
                 f"Chunk {chunk.chunk_id} char_end ({chunk.char_end}) "
-                f"exceeds text length ({len(raw_text)})"
+                f"exceeds text length ({text_length})"
             )
 
-        if i > 0:
-            prev = chunks[i - 1]
-            if chunk.char_start < prev.char_end:
-                raise OffsetMismatchError(
-                    f"Chunk {chunk.chunk_id} overlaps with {prev.chunk_id}"
-                )
+        if prev is not None and chunk.char_start < prev.char_end:
+            raise OffsetMismatchError(
+                f"Chunk {chunk.chunk_id} overlaps with {prev.chunk_id}"
+            )
+        prev = chunk
 
 
-def _write_chunks(output_dir: Path, chunks: list[Chunk]) -> None:
-    """Write chunks.jsonl."""
-    path = output_dir / "chunks.jsonl"
-    with path.open("w", encoding="utf-8") as f:
-        for chunk in chunks:
-            f.write(chunk.model_dump_json() + "\n")
-    logger.debug("Wrote %s", path)
+def _remove_stale_granularities(output_dir: Path) -> None:
+    """Delete passages/sections left by an earlier run; they no longer match the chunks."""
+    for name in (PASSAGES_FILENAME, SECTIONS_FILENAME):
+        path = output_dir / name
+        if path.exists():
+            path.unlink()
+            logger.info("Removed stale %s", name)
 
 
 def _update_manifest(output_dir: Path, chunk_count: int) -> None:
@@ -511,3 +836,10 @@ def _write_report(reports_dir: Path, report: ChunkifyReport) -> None:
     path = reports_dir / "chunks.json"
     path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
     logger.debug("Wrote %s", path)
+
+
+def _write_change_set(reports_dir: Path, change_set: ChunkChangeSet) -> None:
+    """Write chunk_changes.json for downstream stages."""
+    path = reports_dir / "chunk_changes.json"
+    path.write_text(change_set.model_dump_json(indent=2), encoding="utf-8")
+    logger.debug("Wrote %s", path)
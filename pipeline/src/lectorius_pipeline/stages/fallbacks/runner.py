@@ -93,23 +93,27 @@ async def _generate_and_upload(
     """Generate and upload missing fallback audio files."""
     results: dict[str, bool] = {}
 
-    for fb in FALLBACKS:
-        remote_path = f"fallback-audio/{voice_id}/{fb['id']}.mp3"
-
-        # Check if already exists in Supabase Storage
-        if _exists_in_storage(supabase, remote_path):
-            logger.info("Fallback '%s' already exists for voice %s, skipping", fb["id"], voice_id)
-            results[fb["id"]] = False
-            continue
-
-        # Generate audio
-        logger.info("Generating fallback '%s' for voice %s...", fb["id"], voice_id)
-        audio_bytes = await provider.synthesize(fb["text"])
-
-        # Upload to Supabase Storage
-        _upload_to_storage(supabase, remote_path, audio_bytes)
-        logger.info("Uploaded fallback '%s' (%d bytes)", fb["id"], len(audio_bytes))
-        results[fb["id"]] = True
+    # Keep one provider client for all fallbacks; close it in this event loop
+    async with provider:
+        for fb in FALLBACKS:
+            remote_path = f"fallback-audio/{voice_id}/{fb['id']}.mp3"
+
+            # Check if already exists in Supabase Storage
+            if _exists_in_storage(supabase, remote_path):
+                logger.info(
+                    "Fallback '%s' already exists for voice %s, skipping", fb["id"], voice_id
+                )
+                results[fb["id"]] = False
+                continue
+
+            # Generate audio
+            logger.info("Generating fallback '%s' for voice %s...", fb["id"], voice_id)
+            audio_bytes = await provider.synthesize(fb["text"])
+
+            # Upload to Supabase Storage
+            _upload_to_storage(supabase, remote_path, audio_bytes)
+            logger.info("Uploaded fallback '%s' (%d bytes)", fb["id"], len(audio_bytes))
+            results[fb["id"]] = True
 
     return results
 
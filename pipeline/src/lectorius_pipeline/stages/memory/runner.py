@@ -4,12 +4,13 @@ import json
 import logging
 import os
 from pathlib import Path
+from typing import Any
 
 from anthropic import Anthropic
 
 from lectorius_pipeline.errors import CheckpointGenerationError, MemoryStageError
-from lectorius_pipeline.schemas import Chunk, MemoryReport
-from lectorius_pipeline.utils.io import load_chunks
+from lectorius_pipeline.schemas import Chunk, MemoryReport, MemorySection
+from lectorius_pipeline.utils.io import load_chunk_changes, load_chunks, load_sections
 
 from .prompts import CHECKPOINT_PROMPT
 
@@ -24,6 +25,7 @@ def run_memory(
     book_id: str,
     model: str | None = None,
     interval: int = DEFAULT_INTERVAL,
+    incremental: bool = False,
 ) -> MemoryReport:
     """Run the memory stage: generate periodic story summaries.
 
@@ -31,7 +33,11 @@ def run_memory(
         book_dir: Path to book output directory.
         book_id: Book identifier.
         model: LLM model name. Defaults to claude-sonnet.
-        interval: Chunks between checkpoints.
+        interval: Chunks between checkpoints. Ignored when chunkify wrote
+            token-budgeted sections.jsonl that matches the current chunks.
+        incremental: Keep existing checkpoints that only cover chunks before
+            the first change recorded in reports/chunk_changes.json, and
+            generate the rest starting from the last kept checkpoint.
 
     Returns:
         MemoryReport with processing stats.
@@ -54,17 +60,30 @@ def run_memory(
     client = Anthropic(api_key=api_key)
     llm_model = model or DEFAULT_MODEL
 
+    warnings: list[str] = []
+
     # Determine checkpoint positions
-    positions = _compute_positions(total, interval)
+    positions = None
+    sections = load_sections(book_dir)
+    if sections is not None:
+        positions = _section_positions(sections, chunks)
+        if positions is None:
+            warnings.append("sections.jsonl does not match chunks.jsonl, using fixed interval")
+        else:
+            logger.info("Using %d token-budgeted sections from sections.jsonl", len(positions))
+    if positions is None:
+        positions = _compute_positions(total, interval)
     logger.info("Checkpoint positions: %s", positions)
 
     # Generate checkpoints
     checkpoints: list[dict] = []
-    previous: dict | None = None
-    last_end = 0
-    warnings: list[str] = []
+    if incremental:
+        checkpoints = _reusable_checkpoints(book_dir, chunks, positions)
+        logger.info("Reusing %d checkpoints from the previous run", len(checkpoints))
+    previous: dict[str, Any] | None = checkpoints[-1] if checkpoints else None
+    last_end = previous["until_chunk_index"] if previous else 0
 
-    for i, pos in enumerate(positions):
+    for i, pos in enumerate(positions[len(checkpoints) :], start=len(checkpoints)):
         section_chunks = chunks[last_end:pos]
         chunk_texts = "\n\n---\n\n".join(c.text for c in section_chunks)
 
@@ -163,6 +182,65 @@ def _compute_positions(total: int, interval: int) -> list[int]:
     return positions
 
 
+def _section_positions(sections: list[MemorySection], chunks: list[Chunk]) -> list[int] | None:
+    """Use section ends as checkpoint positions.
+
+    Returns None if the sections were written for a different chunking
+    (wrong chunk IDs, gaps, or not ending at the last chunk).
+    """
+    positions: list[int] = []
+    expected_first = 1
+    for section in sections:
+        last = section.last_chunk_index
+        if (
+            section.first_chunk_index != expected_first
+            or not expected_first <= last <= len(chunks)
+            or chunks[last - 1].chunk_id != section.last_chunk_id
+        ):
+            return None
+        positions.append(last)
+        expected_first = last + 1
+
+    if not positions or positions[-1] != len(chunks):
+        return None
+    return positions
+
+
+def _reusable_checkpoints(
+    book_dir: Path, chunks: list[Chunk], positions: list[int]
+) -> list[dict[str, Any]]:
+    """Return the leading existing checkpoints still valid for the current chunks.
+
+    A checkpoint is kept only if it sits at the same position as before, all
+    chunks it covers precede the first change from the last incremental
+    chunkify, and its until_chunk_id still matches. Reuse stops at the first
+    checkpoint that fails, since each summary builds on the previous one.
+    Nothing is reused unless the last chunkify run was incremental, because
+    positional chunk IDs would match whatever text now sits at that index.
+    """
+    path = book_dir / "memory" / "checkpoints.jsonl"
+    changes = load_chunk_changes(book_dir)
+    if not path.exists() or changes is None:
+        logger.warning(
+            "No previous checkpoints or last chunkify was not incremental; regenerating all"
+        )
+        return []
+
+    existing = [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+    first_changed = changes.first_changed_index
+
+    kept: list[dict[str, Any]] = []
+    for pos, checkpoint in zip(positions, existing):
+        if (
+            checkpoint.get("until_chunk_index") != pos
+            or (first_changed is not None and pos >= first_changed)
+            or checkpoint.get("until_chunk_id") != chunks[pos - 1].chunk_id
+        ):
+            break
+        kept.append(checkpoint)
+    return kept
+
+
 def _call_llm(client: Anthropic, model: str, prompt: str) -> dict:
     """Call Claude and parse JSON response.
 
@@ -0,0 +1,5 @@
+"""package-audio: join per-chunk audio into one file per chapter."""
+
+from lectorius_pipeline.stages.package_audio.runner import run_package_audio
+
+__all__ = ["run_package_audio"]
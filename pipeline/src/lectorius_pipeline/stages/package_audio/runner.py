@@ -0,0 +1,209 @@
+"""package-audio: join per-chunk MP3s into one file per chapter.
+
+Chunk files are cut on frame boundaries (ID3 tags and Xing/Info/VBRI frames
+are dropped) and appended in chunk order, so each chapter file is one clean
+MP3 stream. audio/chapters/playback_map.jsonl maps each chunk into the
+chapter files with real start_ms/end_ms and byte ranges; the top-level
+playback_map.jsonl, which the player reads, is left pointing at the chunk
+files. audio/chapters/seek_index.jsonl records the frame layout of each file
+and the byte offset of a frame every SEEK_INTERVAL_MS, so a player can seek
+with one ranged request.
+
+Timings come from frame counts (samples per frame / sample rate), so they
+are exact for the bytes in the file. The per-chunk files are kept: they are
+what ``tts --resume``/``--reconcile`` work from. Rerun package-audio after tts.
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO
+
+from lectorius_pipeline.errors import PackageAudioError
+from lectorius_pipeline.schemas import ChapterAudio, PackageAudioReport, PlaybackMapEntry
+from lectorius_pipeline.utils.io import atomic_write, unique_temp_path
+from lectorius_pipeline.utils.mp3 import mp3_frames
+
+logger = logging.getLogger(__name__)
+
+SEEK_INTERVAL_MS = 1000
+SEEK_INDEX_FILENAME = "seek_index.jsonl"
+CHAPTER_MAP_FILENAME = "playback_map.jsonl"
+
+
+@dataclass
+class _ChapterWriter:
+    """Running state while appending chunk frames to one chapter file."""
+
+    chapter_id: str
+    sample_rate: int = 0
+    samples_per_frame: int = 0
+    frames: int = 0
+    size: int = 0
+    next_seek_ms: int = 0
+    seek_points: list[tuple[int, int]] = field(default_factory=list)
+
+    def ms_at(self, frames: int) -> int:
+        return frames * self.samples_per_frame * 1000 // self.sample_rate
+
+
+def run_package_audio(book_dir: Path, book_id: str) -> PackageAudioReport:
+    """
+    Package chunk audio into chapter files with their own playback map.
+
+    Args:
+        book_dir: Book output directory (after tts)
+        book_id: Book identifier
+
+    Returns:
+        PackageAudioReport with file counts and sizes
+
+    Raises:
+        PackageAudioError: If playback_map.jsonl is missing, or a chunk's audio
+            is missing, unreadable or in another format than its chapter
+    """
+    started = time.perf_counter()
+    map_path = book_dir / "playback_map.jsonl"
+    if not map_path.exists():
+        raise PackageAudioError(f"playback_map.jsonl not found in {book_dir}; run tts first")
+    with open(map_path) as f:
+        entries = [PlaybackMapEntry.model_validate_json(line) for line in f if line.strip()]
+    if not entries:
+        raise PackageAudioError("playback_map.jsonl is empty")
+    entries.sort(key=lambda e: e.chunk_index)
+
+    by_chapter: dict[str, list[PlaybackMapEntry]] = {}
+    for entry in entries:
+        by_chapter.setdefault(entry.chapter_id, []).append(entry)
+    logger.info("Packaging %d chunks into %d chapter files", len(entries), len(by_chapter))
+
+    chapters_dir = book_dir / "audio" / "chapters"
+    chapters_dir.mkdir(parents=True, exist_ok=True)
+    packaged: list[PlaybackMapEntry] = []
+    index: list[ChapterAudio] = []
+    for chapter_id, chapter_entries in by_chapter.items():
+        chapter, chapter_map = _package_chapter(book_dir, chapter_id, chapter_entries)
+        index.append(chapter)
+        packaged.extend(chapter_map)
+
+    # Chapters that no longer exist in the map
+    written = {Path(c.audio_path).name for c in index}
+    for stale in chapters_dir.glob("*.mp3"):
+        if stale.name not in written:
+            stale.unlink()
+
+    with atomic_write(chapters_dir / SEEK_INDEX_FILENAME) as f:
+        for chapter in index:
+            f.write(chapter.model_dump_json() + "\n")
+    with atomic_write(chapters_dir / CHAPTER_MAP_FILENAME) as f:
+        for entry in packaged:
+            f.write(entry.model_dump_json() + "\n")
+
+    report = PackageAudioReport(
+        success=True,
+        book_id=book_id,
+        chapters=len(index),
+        chunks=len(packaged),
+        total_bytes=sum(c.size_bytes for c in index),
+        total_duration_ms=sum(c.duration_ms for c in index),
+        files_before=len({e.audio_path for e in entries}),
+        elapsed_s=round(time.perf_counter() - started, 3),
+    )
+    reports_dir = book_dir / "reports"
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    (reports_dir / "package_audio.json").write_text(report.model_dump_json(indent=2))
+
+    logger.info(
+        "Packaged %d chunks into %d chapter files (%.1f MB, %ds) in %.2fs",
+        report.chunks,
+        report.chapters,
+        report.total_bytes / 1e6,
+        report.total_duration_ms // 1000,
+        report.elapsed_s,
+    )
+    return report
+
+
+def _package_chapter(
+    book_dir: Path, chapter_id: str, entries: list[PlaybackMapEntry]
+) -> tuple[ChapterAudio, list[PlaybackMapEntry]]:
+    """Write one chapter file; returns its index record and playback entries."""
+    relative_path = f"audio/chapters/{chapter_id}.mp3"
+    path = book_dir / relative_path
+    tmp_path = unique_temp_path(path)
+    writer = _ChapterWriter(chapter_id)
+    packaged: list[PlaybackMapEntry] = []
+    try:
+        with open(tmp_path, "wb") as out:
+            for entry in entries:
+                packaged.append(_append_chunk(book_dir, entry, relative_path, writer, out))
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    chapter = ChapterAudio(
+        chapter_id=chapter_id,
+        audio_path=relative_path,
+        size_bytes=writer.size,
+        duration_ms=writer.ms_at(writer.frames),
+        sample_rate=writer.sample_rate,
+        samples_per_frame=writer.samples_per_frame,
+        frame_count=writer.frames,
+        interval_ms=SEEK_INTERVAL_MS,
+        seek_points=writer.seek_points,
+    )
+    return chapter, packaged
+
+
+def _append_chunk(
+    book_dir: Path,
+    entry: PlaybackMapEntry,
+    chapter_path: str,
+    writer: _ChapterWriter,
+    out: BinaryIO,
+) -> PlaybackMapEntry:
+    """Append one chunk's frames to the chapter file and return its new map entry."""
+    source = book_dir / "audio" / "chunks" / f"{entry.chunk_id}.mp3"
+    try:
+        data = source.read_bytes()
+    except OSError as e:
+        raise PackageAudioError(f"Cannot read audio for {entry.chunk_id}: {e}") from e
+    frames = mp3_frames(data)
+    if frames is None:
+        raise PackageAudioError(f"{source.name} has no MP3 audio frames")
+    if writer.frames == 0:
+        writer.sample_rate = frames.sample_rate
+        writer.samples_per_frame = frames.samples_per_frame
+    elif (frames.sample_rate, frames.samples_per_frame) != (
+        writer.sample_rate,
+        writer.samples_per_frame,
+    ):
+        raise PackageAudioError(
+            f"{source.name} is {frames.sample_rate} Hz but chapter {writer.chapter_id} "
+            f"is {writer.sample_rate} Hz; re-run tts for the chapter with one voice"
+        )
+
+    byte_start, start_frames = writer.size, writer.frames
+    for offset in frames.offsets:
+        ms = writer.ms_at(writer.frames)
+        if ms >= writer.next_seek_ms:
+            writer.seek_points.append((ms, writer.size + offset - frames.start))
+            writer.next_seek_ms = (ms // SEEK_INTERVAL_MS + 1) * SEEK_INTERVAL_MS
+        writer.frames += 1
+    out.write(memoryview(data)[frames.start : frames.end])
+    writer.size += frames.end - frames.start
+
+    start_ms, end_ms = writer.ms_at(start_frames), writer.ms_at(writer.frames)
+    return PlaybackMapEntry(
+        chunk_id=entry.chunk_id,
+        chapter_id=entry.chapter_id,
+        chunk_index=entry.chunk_index,
+        audio_path=chapter_path,
+        duration_ms=end_ms - start_ms,
+        start_ms=start_ms,
+        end_ms=end_ms,
+        byte_start=byte_start,
+        byte_end=writer.size,
+    )
@@ -1,26 +1,33 @@
 """RAG stage runner — embed chunks and upload to Supabase pgvector."""
 
+import json
 import logging
 import os
 from pathlib import Path
+from typing import Any, Literal, cast
 
 import numpy as np
-from supabase import create_client
+from supabase import Client, create_client
 
 from lectorius_pipeline.errors import RAGError
-from lectorius_pipeline.schemas import RAGMeta, RAGReport
-from lectorius_pipeline.utils.io import load_chunks
+from lectorius_pipeline.schemas import Chunk, Passage, RAGMeta, RAGReport
+from lectorius_pipeline.utils.io import load_chunk_changes, load_chunks, load_passages
 
 from .embedder import Embedder
 
 logger = logging.getLogger(__name__)
 
+# PostgREST caps rows per response, so existing vectors are read in pages
+FETCH_PAGE_SIZE = 1000
+
 
 def run_rag(
     book_dir: Path,
     book_id: str,
     model: str | None = None,
     batch_size: int = 100,
+    unit: Literal["chunks", "passages"] = "chunks",
+    incremental: bool = False,
 ) -> RAGReport:
     """Run the RAG stage: embed all chunks and upload to Supabase pgvector.
 
@@ -29,6 +36,15 @@ def run_rag(
         book_id: Book identifier.
         model: Embedding model name. Defaults to text-embedding-3-small.
         batch_size: Chunks per API call.
+        unit: "chunks" to embed playback chunks, or "passages" to embed the
+            smaller passages.jsonl units from multi-granularity chunkify.
+            Passage rows carry their parent chunk_id/chunk_index, so
+            spoiler filtering at query time is unchanged, plus their
+            passage_id and char_start/char_end, so /api/ask can use the
+            passage text instead of the whole parent chunk.
+        incremental: Reuse vectors already stored for this book's chunk IDs
+            and embed only chunks that are new. Intended for use after
+            ``chunkify --incremental``, whose chunk IDs are content-stable.
 
     Returns:
         RAGReport with processing stats.
@@ -38,9 +54,17 @@ def run_rag(
     """
     logger.info("Starting RAG stage for %s", book_id)
 
-    # Load chunks
-    chunks = load_chunks(book_dir, RAGError)
-    logger.info("Loaded %d chunks for embedding", len(chunks))
+    # Load embedding units
+    chunks: list[Chunk | Passage]
+    if unit == "passages":
+        chunks = list(load_passages(book_dir, RAGError))
+    elif unit == "chunks":
+        chunks = list(load_chunks(book_dir, RAGError))
+    else:
+        raise RAGError(f"Unknown embedding unit: {unit}")
+    logger.info("Loaded %d %s for embedding", len(chunks), unit)
+    if incremental and unit != "chunks":
+        raise RAGError("Incremental RAG requires unit 'chunks' (passage rows share chunk IDs)")
 
     # Create embedder
     api_key = os.environ.get("OPENAI_API_KEY")
@@ -49,20 +73,53 @@ def run_rag(
 
     embedder = Embedder(api_key=api_key, model=model or "text-embedding-3-small", batch_size=batch_size)
 
-    # Batch embed all chunks
-    all_embeddings: list[list[float]] = []
-    total_batches = (len(chunks) + batch_size - 1) // batch_size
+    supabase_url = os.environ.get("SUPABASE_URL")
+    supabase_key = os.environ.get("SUPABASE_SERVICE_KEY")
+    if not supabase_url or not supabase_key:
+        raise RAGError("SUPABASE_URL or SUPABASE_SERVICE_KEY environment variable not set")
+
+    supabase = create_client(supabase_url, supabase_key)
+
+    # Vectors that can be carried over from the previous run
+    existing: dict[str, list[float]] = {}
+    if incremental:
+        changes = load_chunk_changes(book_dir)
+        if changes is None:
+            # Without content-stable IDs a chunk ID says nothing about its text
+            logger.warning(
+                "Last chunkify was not incremental (no chunk_changes.json); re-embedding everything"
+            )
+        elif _previous_model(book_dir) != embedder.model:
+            logger.warning("Embedding model changed since last run; re-embedding everything")
+        else:
+            logger.info(
+                "Chunk changes since last chunkify: %d added, %d removed",
+                len(changes.added),
+                len(changes.removed),
+            )
+            existing = _fetch_existing_embeddings(supabase, book_id)
+            logger.info("Fetched %d stored vectors for reuse", len(existing))
+
+    pending = [i for i, c in enumerate(chunks) if c.chunk_id not in existing]
+    all_embeddings: list[list[float]] = [existing.get(c.chunk_id, []) for c in chunks]
+
+    # Batch embed all chunks without a reusable vector
+    total_batches = (len(pending) + batch_size - 1) // batch_size
 
     for batch_idx in range(total_batches):
-        start = batch_idx * batch_size
-        end = min(start + batch_size, len(chunks))
-        batch_texts = [c.text for c in chunks[start:end]]
+        batch = pending[batch_idx * batch_size : (batch_idx + 1) * batch_size]
+        batch_texts = [chunks[i].text for i in batch]
 
         logger.info("Embedding batch %d/%d (%d chunks)", batch_idx + 1, total_batches, len(batch_texts))
         embeddings = embedder.embed_batch(batch_texts)
-        all_embeddings.extend(embeddings)
+        for i, embedding in zip(batch, embeddings):
+            all_embeddings[i] = embedding
 
-    logger.info("Embedded %d chunks, normalizing vectors", len(all_embeddings))
+    logger.info(
+        "Embedded %d chunks (%d reused), normalizing vectors",
+        len(pending),
+        len(chunks) - len(pending),
+    )
 
     # L2-normalize embeddings for cosine similarity
     embeddings_np = np.array(all_embeddings, dtype=np.float32)
@@ -83,27 +140,27 @@ def run_rag(
                 chunk_id=chunk.chunk_id,
                 chunk_index=chunk.chunk_index,
                 chapter_id=chunk.chapter_id,
+                passage_id=chunk.passage_id if isinstance(chunk, Passage) else None,
             )
             f.write(meta.model_dump_json() + "\n")
     logger.info("Wrote %d metadata entries to meta.jsonl", len(chunks))
 
     # Insert embeddings into Supabase pgvector
-    supabase_url = os.environ.get("SUPABASE_URL")
-    supabase_key = os.environ.get("SUPABASE_SERVICE_KEY")
-    if not supabase_url or not supabase_key:
-        raise RAGError("SUPABASE_URL or SUPABASE_SERVICE_KEY environment variable not set")
-
-    supabase = create_client(supabase_url, supabase_key)
-
     rows = []
     for i, chunk in enumerate(chunks):
-        rows.append({
+        row: dict[str, Any] = {
             "book_id": book_id,
             "chunk_id": chunk.chunk_id,
             "chunk_index": chunk.chunk_index,
             "chapter_id": chunk.chapter_id,
             "embedding": embeddings_np[i].tolist(),
-        })
+        }
+        if isinstance(chunk, Passage):
+            # Span within the parent chunk's text, in the same offsets as chunks
+            row["passage_id"] = chunk.passage_id
+            row["char_start"] = chunk.char_start
+            row["char_end"] = chunk.char_end
+        rows.append(row)
 
     # Delete existing embeddings for this book (in case of re-run)
     supabase.table("book_embeddings").delete().eq("book_id", book_id).execute()
@@ -112,8 +169,8 @@ def run_rag(
     insert_batch_size = 100
     total_insert_batches = (len(rows) + insert_batch_size - 1) // insert_batch_size
     for i in range(0, len(rows), insert_batch_size):
-        batch = rows[i : i + insert_batch_size]
-        supabase.table("book_embeddings").insert(batch).execute()
+        insert_rows = rows[i : i + insert_batch_size]
+        supabase.table("book_embeddings").insert(insert_rows).execute()
         logger.info(
             "Inserted embeddings batch %d/%d", i // insert_batch_size + 1, total_insert_batches
         )
@@ -129,6 +186,7 @@ def run_rag(
         vectors_indexed=len(chunks),
         dimensions=dimensions,
         index_type="pgvector",
+        embedding_unit=unit,
     )
 
     # Write report
@@ -141,3 +199,33 @@ def run_rag(
     return report
 
 
+def _fetch_existing_embeddings(supabase: Client, book_id: str) -> dict[str, list[float]]:
+    """Read the vectors currently stored for a book, keyed by chunk ID."""
+    existing: dict[str, list[float]] = {}
+    offset = 0
+    while True:
+        response = (
+            supabase.table("book_embeddings")
+            .select("chunk_id, embedding")
+            .eq("book_id", book_id)
+            .range(offset, offset + FETCH_PAGE_SIZE - 1)
+            .execute()
+        )
+        rows = cast(list[dict[str, Any]], response.data)
+        for row in rows:
+            embedding = row["embedding"]
+            # pgvector columns come back as their text form, e.g. "[0.1,0.2]"
+            if isinstance(embedding, str):
+                embedding = json.loads(embedding)
+            existing[row["chunk_id"]] = embedding
+        if len(rows) < FETCH_PAGE_SIZE:
+            return existing
+        offset += FETCH_PAGE_SIZE
+
+
+def _previous_model(book_dir: Path) -> str | None:
+    """Embedding model recorded by the previous RAG run, if any."""
+    path = book_dir / "reports" / "rag.json"
+    if not path.exists():
+        return None
+    return RAGReport.model_validate_json(path.read_text()).embedding_model
@@ -1,5 +1,6 @@
 """TTS stage — generate audio for each chunk."""
 
+from .estimate import estimate_tts
 from .runner import create_provider, run_tts
 
-__all__ = ["create_provider", "run_tts"]
+__all__ = ["create_provider", "estimate_tts", "run_tts"]
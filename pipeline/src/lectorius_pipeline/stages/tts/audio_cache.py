@@ -0,0 +1,160 @@
+"""Content-addressed cache of synthesized audio, shared across books and runs.
+
+Audio is keyed by what determines the sound (provider, voice, model, voice
+settings and normalized text), not by chunk ID, so re-chunking a book,
+renaming it or voicing the same text in another book reuses audio that was
+already paid for. Entries live at ``{root}/{key[:2]}/{key}.mp3`` and are
+hardlinked into the book pack when possible (copied across filesystems).
+The cache is trimmed to ``max_bytes`` by evicting least recently used
+entries; a hit refreshes the entry's mtime.
+
+Pack files may share an inode with a cache entry, so both sides only ever
+replace files (write to a temp name, then rename) and never write in place.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import unicodedata
+from pathlib import Path
+
+from lectorius_pipeline.config import AudioCacheConfig
+from lectorius_pipeline.utils.io import link_or_copy
+
+logger = logging.getLogger(__name__)
+
+# Trim to this fraction of max_bytes, so eviction runs rarely
+EVICT_TO_FRACTION = 0.9
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form of chunk text for cache keys (NFC, collapsed whitespace)."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def cache_key(
+    provider: str, voice: str, model: str, voice_settings: dict[str, object], text: str
+) -> str:
+    """Hex digest identifying the audio a provider would produce for ``text``."""
+    identity = json.dumps(
+        [provider, voice, model, voice_settings, normalize_text(text)],
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def cached_keys(config: AudioCacheConfig) -> set[str]:
+    """Keys in the cache, read without creating, touching or trimming anything."""
+    if not config.directory.is_dir():
+        return set()
+    return set(_scan(config.directory))
+
+
+def _scan(root: Path) -> dict[str, tuple[float, int]]:
+    """key -> (mtime, size) of every entry under ``root``."""
+    entries: dict[str, tuple[float, int]] = {}
+    for shard in os.scandir(root):
+        if shard.is_dir():
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".mp3"):
+                    st = entry.stat()
+                    entries[entry.name[:-4]] = (st.st_mtime, st.st_size)
+    return entries
+
+
+class AudioCache:
+    """Local LRU store of audio files addressed by ``cache_key``.
+
+    ``fetch`` and ``store`` are thread-safe.
+    """
+
+    def __init__(self, config: AudioCacheConfig) -> None:
+        self._root = config.directory
+        self._max_bytes = config.max_bytes
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # key -> (mtime, size); scanned once, then kept current in memory
+        self._entries = _scan(self._root)
+        self._total_bytes = sum(size for _, size in self._entries.values())
+        self.hits = 0
+        self.misses = 0
+        logger.info(
+            "Audio cache %s: %d entries, %.1f MB",
+            self._root,
+            len(self._entries),
+            self._total_bytes / 1e6,
+        )
+        if self._total_bytes > self._max_bytes:
+            self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self._root / key[:2] / f"{key}.mp3"
+
+    def fetch(self, key: str, dest: Path) -> bool:
+        """Place the cached audio for ``key`` at ``dest``. Returns False on a miss."""
+        with self._lock:
+            return self._fetch(key, dest)
+
+    def _fetch(self, key: str, dest: Path) -> bool:
+        path = self._path(key)
+        if key not in self._entries:
+            self.misses += 1
+            return False
+        try:
+            link_or_copy(path, dest)
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted by another process since the scan
+            self._forget(key)
+            self.misses += 1
+            return False
+        self._entries[key] = (path.stat().st_mtime, self._entries[key][1])
+        self.hits += 1
+        return True
+
+    def store(self, key: str, source: Path) -> None:
+        """Add the audio at ``source`` under ``key``; failures only log a warning."""
+        with self._lock:
+            self._store(key, source)
+
+    def _store(self, key: str, source: Path) -> None:
+        if key in self._entries:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            link_or_copy(source, path)
+            st = path.stat()
+        except OSError as e:
+            logger.warning("Could not add %s to the audio cache: %s", source.name, e)
+            return
+        self._entries[key] = (st.st_mtime, st.st_size)
+        self._total_bytes += st.st_size
+        if self._total_bytes > self._max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries down to EVICT_TO_FRACTION of the budget."""
+        target = self._max_bytes * EVICT_TO_FRACTION
+        evicted = 0
+        for key in sorted(self._entries, key=lambda k: self._entries[k][0]):
+            if self._total_bytes <= target:
+                break
+            self._path(key).unlink(missing_ok=True)
+            self._forget(key)
+            evicted += 1
+        logger.debug(
+            "Evicted %d audio cache entries (now %.1f MB)", evicted, self._total_bytes / 1e6
+        )
+
+    def _forget(self, key: str) -> None:
+        _, size = self._entries.pop(key, (0.0, 0))
+        self._total_bytes -= size
+
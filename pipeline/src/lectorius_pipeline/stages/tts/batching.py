@@ -0,0 +1,192 @@
+"""Pack consecutive short chunks into one TTS request and split the audio back.
+
+Chunks near ``min_chars`` spend most of their request time on overhead and
+each counts against the provider's request quota. With batching on, runs of
+consecutive short chunks in one chapter are joined with a paragraph break
+and sent as one request. The audio that comes back is cut on frame
+boundaries into one file per chunk:
+
+- providers with ``supports_alignment`` return when each character is
+  spoken; each cut goes halfway between the last character of one chunk and
+  the first of the next
+- otherwise the paragraph break is the marker: it makes the voice pause, and
+  each cut goes in the middle of the longest pause near where the boundary
+  is expected from the character counts. Pauses are frames that code almost
+  no audio (``frame_activity``), so nothing is decoded
+
+If the audio cannot be cut (no alignment and no pause where one is expected),
+``split_audio`` returns None and the runner synthesizes the chunks one by one.
+"""
+
+import math
+from collections.abc import Callable
+from itertools import pairwise
+
+from lectorius_pipeline.config import BatchConfig
+from lectorius_pipeline.schemas import Chunk
+from lectorius_pipeline.utils.mp3 import MP3Frames, frame_activity, mp3_frames
+
+from .providers.base import AlignedAudio
+
+# Joins chunks in a packed request; a paragraph break reliably makes a pause
+SEPARATOR = "\n\n"
+
+# A pause is a run of frames coding less than this fraction of the median
+QUIET_FRACTION = 0.1
+
+# Shortest run of quiet frames that counts as a pause between chunks
+MIN_PAUSE_S = 0.15
+
+
+class ChunkBatches:
+    """Work items for the TTS queue: single chunks and packed runs of short ones."""
+
+    def __init__(self, chunks: list[Chunk], config: BatchConfig | None) -> None:
+        self.items: list[Chunk] = []
+        # batch chunk_id -> chunks still to synthesize from it, in book order
+        self._members: dict[str, list[Chunk]] = {}
+        self.fallbacks = 0  # batches whose audio could not be split
+
+        run: list[Chunk] = []
+        for chunk in sorted(chunks, key=lambda c: c.chunk_index):
+            if config is None or len(chunk.text) >= config.short_chars:
+                self._add(run)
+                self.items.append(chunk)
+                continue
+            if run and (
+                chunk.chapter_id != run[-1].chapter_id
+                or chunk.chunk_index != run[-1].chunk_index + 1
+                or len(run) >= config.max_chunks
+                or len(batch_text(run)) + len(SEPARATOR) + len(chunk.text) > config.max_chars
+            ):
+                self._add(run)
+            run.append(chunk)
+        self._add(run)
+        self.batched_chunks = sum(len(m) for m in self._members.values())
+
+    def _add(self, run: list[Chunk]) -> None:
+        """Queue ``run`` as one packed item (or as a plain chunk if alone), then clear it."""
+        if len(run) > 1:
+            item = run[0].model_copy(
+                update={
+                    "chunk_id": f"{run[0].chunk_id}+{len(run) - 1}",
+                    "text": batch_text(run),
+                    "char_end": run[-1].char_end,
+                }
+            )
+            self.items.append(item)
+            self._members[item.chunk_id] = list(run)
+        else:
+            self.items.extend(run)
+        run.clear()
+
+    @property
+    def batch_count(self) -> int:
+        return len(self._members)
+
+    def members(self, item: Chunk) -> list[Chunk] | None:
+        """Chunks packed into ``item``, or None if it is a single chunk."""
+        return self._members.get(item.chunk_id)
+
+    def set_members(self, item: Chunk, members: list[Chunk]) -> None:
+        """Narrow a batch to the chunks still missing (e.g. after cache hits)."""
+        self._members[item.chunk_id] = members
+
+    def priority(self, priority: Callable[[Chunk], int]) -> Callable[[Chunk], int]:
+        """Rank a batch by its most urgent member."""
+
+        def batch_priority(item: Chunk) -> int:
+            members = self._members.get(item.chunk_id)
+            return priority(item) if members is None else min(priority(c) for c in members)
+
+        return batch_priority
+
+
+def batch_text(chunks: list[Chunk]) -> str:
+    """Request text for a run of chunks."""
+    return SEPARATOR.join(c.text for c in chunks)
+
+
+def split_audio(
+    data: bytes, chunks: list[Chunk], alignment: AlignedAudio | None = None
+) -> list[bytes] | None:
+    """Cut the audio of ``batch_text(chunks)`` into one MP3 per chunk.
+
+    Returns None if ``data`` is not Layer III audio or no cut could be
+    placed for some boundary.
+    """
+    frames = mp3_frames(data)
+    if frames is None:
+        return None
+    spans: list[tuple[int, int]] = []
+    pos = 0
+    for chunk in chunks:
+        spans.append((pos, pos + len(chunk.text)))
+        pos += len(chunk.text) + len(SEPARATOR)
+    text_len = pos - len(SEPARATOR)
+
+    cuts = None
+    if alignment is not None:
+        cuts = _cuts_from_alignment(frames, spans, text_len, alignment)
+    if cuts is None:
+        cuts = _cuts_from_pauses(frames, frame_activity(data, frames), spans, text_len)
+    if cuts is None:
+        return None
+
+    n = len(frames.offsets)
+    offsets = [*frames.offsets, frames.end]
+    return [data[offsets[a] : offsets[b]] for a, b in pairwise([0, *cuts, n])]
+
+
+def _cuts_from_alignment(
+    frames: MP3Frames, spans: list[tuple[int, int]], text_len: int, alignment: AlignedAudio
+) -> list[int] | None:
+    """Frame index of each cut, halfway between the chunks' spoken characters."""
+    if len(alignment.char_start_s) != text_len or len(alignment.char_end_s) != text_len:
+        return None
+    frame_s = frames.samples_per_frame / frames.sample_rate
+    cuts = []
+    for (_, end), (start, _) in pairwise(spans):
+        t = (alignment.char_end_s[end - 1] + alignment.char_start_s[start]) / 2
+        cuts.append(round(t / frame_s))
+    return cuts if _valid(cuts, len(frames.offsets)) else None
+
+
+def _cuts_from_pauses(
+    frames: MP3Frames, activity: list[int], spans: list[tuple[int, int]], text_len: int
+) -> list[int] | None:
+    """Frame index of each cut, in the longest pause near the expected boundary."""
+    n = len(activity)
+    quiet = sorted(activity)[n // 2] * QUIET_FRACTION
+    min_run = max(1, math.ceil(MIN_PAUSE_S * frames.sample_rate / frames.samples_per_frame))
+    pauses: list[tuple[int, int]] = []  # (first frame, end frame)
+    start = None
+    for i, bits in enumerate([*activity, quiet + 1]):
+        if bits <= quiet:
+            start = i if start is None else start
+        elif start is not None:
+            if i - start >= min_run:
+                pauses.append((start, i))
+            start = None
+
+    cuts: list[int] = []
+    for (start0, end0), (start1, end1) in pairwise(spans):
+        # Characters map to frames roughly linearly; search half the shorter chunk
+        expected = n * (end0 + start1) / 2 / text_len
+        window = n * min(end0 - start0, end1 - start1) / text_len / 2
+        after = cuts[-1] if cuts else 0
+        candidates = [
+            p
+            for p in pauses
+            if (p[0] + p[1]) // 2 > after and abs((p[0] + p[1]) / 2 - expected) <= window
+        ]
+        if not candidates:
+            return None
+        best = max(candidates, key=lambda p: (p[1] - p[0], -abs((p[0] + p[1]) / 2 - expected)))
+        cuts.append((best[0] + best[1]) // 2)
+    return cuts if _valid(cuts, n) else None
+
+
+def _valid(cuts: list[int], n: int) -> bool:
+    """Cuts leave every chunk at least one frame."""
+    return all(a < b for a, b in pairwise([0, *cuts, n]))
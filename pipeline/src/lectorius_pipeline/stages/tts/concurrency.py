@@ -0,0 +1,175 @@
+"""Adaptive (AIMD) concurrency limit for TTS requests.
+
+Like TCP congestion control: every healthy response adds ``1/limit`` to the
+limit (about +1 per full window of requests), while a throttling response
+(429, 5xx, timeout) or a latency spike halves it. A spike is a short-term
+average of latency per input character (a 1600-char chunk is legitimately
+slower than a 200-char one) exceeding the baseline by
+``latency_spike_factor``. The baseline is the lowest value of a slow
+long-term average, so it does not creep up as the limit overloads the
+provider; it is reset at the minimum limit, where there is nothing left to
+back off. After a decrease, further decreases wait for a
+cooldown so a burst of concurrent 429s from one overload counts once.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+
+from lectorius_pipeline.config import AdaptiveConcurrencyConfig
+from lectorius_pipeline.schemas import ConcurrencyPoint
+
+logger = logging.getLogger(__name__)
+
+# Smoothing for the short-term and long-term (baseline) per-char latency averages
+SHORT_EWMA_ALPHA = 0.2
+LONG_EWMA_ALPHA = 0.02
+
+# Successful requests observed before latency spikes can trigger a decrease
+LATENCY_WARMUP_REQUESTS = 10
+
+
+def status_code(exc: BaseException) -> int | None:
+    """HTTP status of a provider error, if it carries one."""
+    status = getattr(exc, "status_code", None)  # openai.APIStatusError
+    if status is None:
+        response = getattr(exc, "response", None)  # httpx.HTTPStatusError
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_throttling_error(exc: BaseException) -> bool:
+    """Whether a provider error means "slow down": 429, 5xx or a timeout."""
+    if isinstance(exc, (httpx.TimeoutException, asyncio.TimeoutError)):
+        return True
+    status = status_code(exc)
+    if status is None:
+        # openai wraps timeouts as APITimeoutError, which has no status
+        return type(exc).__name__ == "APITimeoutError"
+    return status == 429 or status >= 500
+
+
+class AdaptiveLimiter:
+    """Bound in-flight requests with a limit that follows provider capacity.
+
+    With ``config=None`` the limit stays fixed at ``initial``, which behaves
+    like a plain semaphore.
+    """
+
+    def __init__(self, initial: int, config: AdaptiveConcurrencyConfig | None = None) -> None:
+        self._config = config
+        if config is not None:
+            initial = min(max(initial, config.min_concurrency), config.max_concurrency)
+        self._limit = float(max(1, initial))
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+        self._started = time.monotonic()
+        self._last_decrease = -float("inf")
+        self._short_ms_per_char = 0.0
+        self._long_ms_per_char = 0.0
+        self._base_ms_per_char = 0.0
+        self._healthy = 0
+        self.throttled_count = 0
+        self.trajectory: list[ConcurrencyPoint] = [
+            ConcurrencyPoint(elapsed_s=0.0, limit=self.limit, reason="start")
+        ]
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def ceiling(self) -> int:
+        """Highest value the limit can reach."""
+        return self._config.max_concurrency if self._config is not None else self.limit
+
+    @asynccontextmanager
+    async def slot(self, chars: int) -> AsyncIterator[None]:
+        """Hold one request slot for a request of ``chars`` input characters.
+
+        The request's latency, or the exception it raised, adjusts the limit.
+        """
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+        started = time.monotonic()
+        outcome = "error"
+        try:
+            yield
+            outcome = "ok"
+        except Exception as e:
+            if is_throttling_error(e):
+                outcome = "throttled"
+            raise
+        finally:
+            elapsed_ms = (time.monotonic() - started) * 1000
+            async with self._cond:
+                self._in_flight -= 1
+                if outcome == "throttled":
+                    self.throttled_count += 1
+                    self._decrease("throttled")
+                elif outcome == "ok":
+                    self._observe(elapsed_ms / max(1, chars))
+                # Wake only as many waiters as there are free slots
+                self._cond.notify(max(0, self.limit - self._in_flight))
+
+    def _observe(self, ms_per_char: float) -> None:
+        """Additive increase on a healthy response, or decrease on a latency spike."""
+        if self._config is None:
+            return
+        self._healthy += 1
+        if self._healthy == 1:
+            self._short_ms_per_char = self._long_ms_per_char = ms_per_char
+        else:
+            self._short_ms_per_char += SHORT_EWMA_ALPHA * (ms_per_char - self._short_ms_per_char)
+            self._long_ms_per_char += LONG_EWMA_ALPHA * (ms_per_char - self._long_ms_per_char)
+        if self._healthy == 1 or self.limit <= self._config.min_concurrency:
+            self._base_ms_per_char = self._long_ms_per_char
+        else:
+            self._base_ms_per_char = min(self._base_ms_per_char, self._long_ms_per_char)
+
+        if (
+            self._healthy >= LATENCY_WARMUP_REQUESTS
+            and self._short_ms_per_char
+            > self._config.latency_spike_factor * self._base_ms_per_char
+        ):
+            self._decrease("latency")
+            return
+
+        # Only grow a window that is in use; the released slot counts as in use
+        if self._in_flight + 1 < self.limit:
+            return
+        before = self.limit
+        self._limit = min(self._limit + 1 / self._limit, float(self._config.max_concurrency))
+        if self.limit != before:
+            self._record("increase")
+
+    def _decrease(self, reason: str) -> None:
+        if self._config is None:
+            return
+        now = time.monotonic()
+        if now - self._last_decrease < self._config.decrease_cooldown_s:
+            return
+        self._last_decrease = now
+        before = self.limit
+        self._limit = max(self._limit / 2, float(self._config.min_concurrency))
+        if reason == "latency":
+            # Judge the new limit on fresh samples
+            self._short_ms_per_char = self._long_ms_per_char = self._base_ms_per_char
+        if self.limit != before:
+            self._record(reason)
+            logger.info("TTS concurrency %d -> %d (%s)", before, self.limit, reason)
+
+    def _record(self, reason: str) -> None:
+        self.trajectory.append(
+            ConcurrencyPoint(
+                elapsed_s=round(time.monotonic() - self._started, 3),
+                limit=self.limit,
+                reason=reason,
+            )
+        )
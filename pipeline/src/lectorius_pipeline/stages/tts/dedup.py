@@ -0,0 +1,49 @@
+"""Synthesize each distinct chunk text once per run.
+
+Refrains, repeated letters and chapter epigraphs produce chunks with the
+same text. Pending chunks are grouped by normalized text (the audio cache's
+normalization, so it matches what the cache would treat as one entry); only
+the first chunk of each group goes to the provider, and its audio is linked
+to the rest of the group once it is on disk.
+"""
+
+from collections.abc import Callable
+
+from lectorius_pipeline.schemas import Chunk
+
+from .audio_cache import normalize_text
+
+
+class DuplicateGroups:
+    """Pending chunks grouped by normalized text."""
+
+    def __init__(self, chunks: list[Chunk]) -> None:
+        groups: dict[str, list[Chunk]] = {}
+        for chunk in sorted(chunks, key=lambda c: c.chunk_index):
+            groups.setdefault(normalize_text(chunk.text), []).append(chunk)
+        self.representatives = [group[0] for group in groups.values()]
+        # representative chunk_id -> the other chunks with its text
+        self._duplicates = {group[0].chunk_id: group[1:] for group in groups.values()}
+        self.duplicate_count = sum(len(d) for d in self._duplicates.values())
+        self.reused = 0  # duplicates given their representative's audio
+        self.saved_chars = 0  # characters of those that would have gone to the provider
+
+    def duplicates_of(self, chunk: Chunk) -> list[Chunk]:
+        """Chunks sharing ``chunk``'s text, other than ``chunk`` itself."""
+        return self._duplicates.get(chunk.chunk_id, [])
+
+    def record_reuse(self, duplicates: list[Chunk], synthesized: bool) -> None:
+        """Count duplicates served from a representative. Only audio that was
+        synthesized saved characters; a cache hit would have served them too."""
+        self.reused += len(duplicates)
+        if synthesized:
+            self.saved_chars += sum(len(c.text) for c in duplicates)
+
+    def priority(self, priority: Callable[[Chunk], int]) -> Callable[[Chunk], int]:
+        """Rank a representative by its most urgent member (e.g. an epigraph
+        opening a later chapter)."""
+
+        def group_priority(chunk: Chunk) -> int:
+            return min(priority(c) for c in (chunk, *self.duplicates_of(chunk)))
+
+        return group_priority
@@ -0,0 +1,224 @@
+"""Cost and wall-time estimate for a TTS run, without calling the provider.
+
+``estimate_tts`` backs ``tts --dry-run``. Billable characters are what the
+run would actually send: the pending chunks (all of them, or the unfinished
+ones with ``resume``), one per distinct text (dedup.py), minus texts already
+in the audio cache for that provider/voice/model, packed as the run would
+pack them (batching.py). Cost is billable characters at the provider's
+``price_per_million_chars``.
+
+Wall time comes from past runs. Every reports/tts.json under the library
+directory with request telemetry gives characters per second per
+concurrency slot (``chars_per_s`` over its final concurrency). Runs of the
+same voice are used, else of the same model, else of the same provider;
+the rate is scaled to ``concurrency`` slots and then capped by the
+character and request quotas the run would be paced to. Past quota waits
+and retries are part of that rate, so the estimate errs long.
+
+Besides the chosen provider/voice, every provider/voice/model with past
+runs is estimated too, so they can be compared before paying for one.
+"""
+
+import logging
+from collections.abc import Callable
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from lectorius_pipeline.config import AudioCacheConfig, BatchConfig, HedgeConfig, RateLimitConfig
+from lectorius_pipeline.errors import TTSError
+from lectorius_pipeline.schemas import Chunk, TTSEstimate, TTSReport
+from lectorius_pipeline.utils.io import load_book_meta, load_chunks
+from lectorius_pipeline.utils.speech_rate import estimate_speech_rate
+
+from .audio_cache import cache_key, cached_keys
+from .batching import ChunkBatches
+from .dedup import DuplicateGroups
+from .progress import TTSProgress
+from .providers.base import TTSProvider
+from .rate_limit import effective_rate_limit
+from .runner import create_provider
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tts(
+    book_dir: Path,
+    provider_name: str | None = None,
+    voice: str | None = None,
+    model: str | None = None,
+    resume: bool = False,
+    concurrency: int = 5,
+    rate_limit: RateLimitConfig | None = None,
+    cache: AudioCacheConfig | None = None,
+    hedge: HedgeConfig | None = None,
+    batch: BatchConfig | None = None,
+    price_per_million_chars: float | None = None,
+) -> list[TTSEstimate]:
+    """Estimate what ``run_tts`` with these settings would send, cost and take.
+
+    No request is sent and no API key is needed.
+
+    Args:
+        book_dir: Path to book output directory.
+        provider_name: TTS provider ('openai' or 'elevenlabs'). Reads from book.json if None.
+        voice: Voice name/ID (provider-specific). Reads from book.json if None.
+        model: Model name. Uses provider default if None.
+        resume: If True, leave out already-completed chunks.
+        concurrency: Parallel API requests the run would keep busy.
+        rate_limit: Quota the chosen provider would be paced to; fields left
+            as None fall back to the provider's ``default_rate_limit``.
+        cache: Audio cache whose entries would not be billed; None for no cache.
+        hedge: Hedging settings; adds the most hedges could spend.
+        batch: Batching settings, which change the request count.
+        price_per_million_chars: Price of the chosen provider in USD,
+            overriding its list price.
+
+    Returns:
+        One TTSEstimate per provider/voice/model: the chosen one first, then
+        every other one with past runs under the library directory.
+
+    Raises:
+        TTSError: If chunks are missing or the provider cannot be resolved.
+    """
+    chunks = load_chunks(book_dir, TTSError)
+
+    # Resolve provider/voice the way run_tts does: CLI flags > book.json > defaults
+    book_meta = load_book_meta(book_dir)
+    effective_provider = (
+        provider_name or (book_meta.tts_provider if book_meta else None) or "openai"
+    )
+    effective_voice = voice or (book_meta.voice_id if book_meta else None)
+    chosen = create_provider(effective_provider, effective_voice, model, offline=True)
+
+    pending = chunks
+    if resume:
+        progress = TTSProgress(book_dir)
+        progress.load()
+        pending = [c for c in chunks if c.chunk_id not in progress.completed_ids]
+    duplicates = DuplicateGroups(pending)
+    cached = cached_keys(cache) if cache else set()
+    library_dir = book_dir.parent
+    past_runs = _past_runs(library_dir)
+
+    candidates = [(chosen, rate_limit, price_per_million_chars)]
+    seen = {(chosen.name, chosen.voice, chosen.model)}
+    for run in past_runs:
+        identity = (run.provider, run.voice, run.model)
+        if identity in seen:
+            continue
+        seen.add(identity)
+        try:
+            provider = create_provider(run.provider, run.voice, run.model, offline=True)
+        except TTSError:
+            # A provider this version no longer has
+            continue
+        candidates.append((provider, None, None))
+
+    estimates = []
+    for provider, quota_override, price in candidates:
+        to_send = [c for c in duplicates.representatives if _cache_key(provider, c) not in cached]
+        items = ChunkBatches(to_send, batch).items
+        billable = sum(len(c.text) for c in items)
+        price = price if price is not None else provider.price_per_million_chars
+        speech_rate = estimate_speech_rate(library_dir, provider.name, provider.voice)
+        estimate = TTSEstimate(
+            provider=provider.name,
+            voice=provider.voice,
+            model=provider.model,
+            pending_chunks=len(pending),
+            deduplicated_chunks=duplicates.duplicate_count,
+            cached_chunks=len(duplicates.representatives) - len(to_send),
+            requests=len(items),
+            billable_chars=billable,
+            hedge_chars_max=int(billable * hedge.max_extra_chars) if hedge else 0,
+            price_per_million_chars=price,
+            cost_usd=round(billable * price / 1e6, 2) if price is not None else None,
+            audio_duration_s=round(
+                sum(len(c.text) for c in pending) / speech_rate.chars_per_second, 1
+            ),
+        )
+        _estimate_time(
+            estimate,
+            past_runs,
+            concurrency,
+            effective_rate_limit(provider.default_rate_limit, quota_override),
+        )
+        estimates.append(estimate)
+    return estimates
+
+
+def _estimate_time(
+    estimate: TTSEstimate,
+    past_runs: list[TTSReport],
+    concurrency: int,
+    quota: RateLimitConfig,
+) -> None:
+    """Fill in the throughput and ETA fields of ``estimate`` from past runs and quotas.
+
+    Without past runs only the quota bounds apply, so the ETA is a lower
+    bound (``throughput_basis`` stays "none"); with neither it stays unknown.
+    """
+    bounds: dict[str, float] = {}
+    if quota.chars_per_minute:
+        bounds["chars_per_minute"] = estimate.billable_chars * 60 / quota.chars_per_minute
+    if quota.requests_per_minute:
+        bounds["requests_per_minute"] = estimate.requests * 60 / quota.requests_per_minute
+
+    levels: list[tuple[str, Callable[[TTSReport], bool]]] = [
+        (
+            "voice",
+            lambda r: (r.provider, r.model, r.voice)
+            == (estimate.provider, estimate.model, estimate.voice),
+        ),
+        ("model", lambda r: (r.provider, r.model) == (estimate.provider, estimate.model)),
+        ("provider", lambda r: r.provider == estimate.provider),
+    ]
+    for basis, matches in levels:
+        runs = [r for r in past_runs if matches(r)]
+        if runs:
+            # Characters per second of one busy concurrency slot, over all matching runs
+            chars = sum(_sent_chars(r) for r in runs)
+            slot_seconds = sum(
+                _sent_chars(r) / r.requests.chars_per_s * (r.final_concurrency or 1)
+                for r in runs
+            )
+            bounds["concurrency"] = estimate.billable_chars * slot_seconds / chars / concurrency
+            estimate.throughput_basis = basis
+            estimate.throughput_runs = len(runs)
+            break
+    if not bounds:
+        return
+    limited_by = max(bounds, key=lambda k: bounds[k])
+
+    estimate.eta_s = round(bounds[limited_by], 1)
+    estimate.limited_by = limited_by
+    if estimate.eta_s:
+        estimate.chars_per_s = round(estimate.billable_chars / estimate.eta_s, 1)
+
+
+def _past_runs(library_dir: Path) -> list[TTSReport]:
+    """TTS reports with request telemetry from every book under ``library_dir``."""
+    runs = []
+    for book_dir in sorted(p for p in library_dir.iterdir() if p.is_dir()):
+        report_path = book_dir / "reports" / "tts.json"
+        if not report_path.exists():
+            continue
+        try:
+            report = TTSReport.model_validate_json(report_path.read_text())
+        except ValidationError:
+            logger.warning("Skipping unreadable %s", report_path)
+            continue
+        if report.requests.chars_per_s > 0 and _sent_chars(report) > 0:
+            runs.append(report)
+    return runs
+
+
+def _sent_chars(report: TTSReport) -> int:
+    return sum(point.chars for point in report.requests.throughput)
+
+
+def _cache_key(provider: TTSProvider, chunk: Chunk) -> str:
+    return cache_key(
+        provider.name, provider.voice, provider.model, provider.voice_settings, chunk.text
+    )
@@ -0,0 +1,77 @@
+"""When to hedge a slow TTS request, and how much hedging may cost.
+
+A few requests per book take 30-60s while the median takes a few seconds,
+and those stragglers set the length of the whole stage. Once a request has
+run longer than the ``percentile`` latency of recent successful requests,
+the runner sends the same text again and keeps whichever response finishes
+first. The threshold is measured live over a sliding window, so it follows
+the provider's current speed. Every hedge is paid for, so hedges stop once
+they have cost ``max_extra_chars`` of the run's characters.
+"""
+
+import math
+from collections import deque
+
+from lectorius_pipeline.config import HedgeConfig
+
+# Successful latencies the percentile is taken over
+WINDOW = 500
+
+# Recompute the threshold after this many new samples
+RECOMPUTE_EVERY = 10
+
+
+class HedgePolicy:
+    """Live hedge threshold and spend budget for one run (event loop only)."""
+
+    def __init__(self, config: HedgeConfig | None, total_chars: int) -> None:
+        self._config = config
+        self._latencies_s: deque[float] = deque(maxlen=WINDOW)
+        self._new_samples = 0
+        self._threshold_s: float | None = None
+        self.budget_chars = int(total_chars * config.max_extra_chars) if config else 0
+        self.spent_chars = 0
+        self.hedges = 0
+        self.wins = 0  # hedges that finished before the original request
+
+    @property
+    def enabled(self) -> bool:
+        return self._config is not None and self.budget_chars > 0
+
+    @property
+    def threshold_ms(self) -> float | None:
+        return None if self._threshold_s is None else round(self._threshold_s * 1000, 1)
+
+    def observe(self, latency_s: float) -> None:
+        """Add the latency of a successful request."""
+        if self._config is None:
+            return
+        self._latencies_s.append(latency_s)
+        self._new_samples += 1
+        if (
+            len(self._latencies_s) >= self._config.min_samples
+            and self._new_samples >= RECOMPUTE_EVERY
+        ):
+            self._new_samples = 0
+            ordered = sorted(self._latencies_s)
+            rank = min(len(ordered) - 1, math.ceil(self._config.percentile * len(ordered)) - 1)
+            self._threshold_s = max(ordered[rank], self._config.min_delay_s)
+
+    def delay_s(self) -> float | None:
+        """Seconds after which a request should be hedged, or None to not hedge (yet)."""
+        if not self.enabled or self.spent_chars >= self.budget_chars:
+            return None
+        return self._threshold_s
+
+    def try_spend(self, chars: int) -> bool:
+        """Reserve budget for a hedge of ``chars`` characters."""
+        if not self.enabled or self.spent_chars + chars > self.budget_chars:
+            return False
+        self.spent_chars += chars
+        self.hedges += 1
+        return True
+
+    def refund(self, chars: int) -> None:
+        """Return the budget of a hedge that was cancelled before it was sent."""
+        self.spent_chars -= chars
+        self.hedges -= 1
@@ -0,0 +1,38 @@
+"""Event-loop lag: how late the loop wakes a task that asked to sleep.
+
+Anything that blocks the loop thread (disk I/O, parsing, a slow callback)
+delays every in-flight request's response handling by the same amount, so
+the lag a periodic sleeper observes is a direct measure of it.
+"""
+
+import asyncio
+import time
+
+# How often the loop is sampled
+SAMPLE_INTERVAL_S = 0.05
+
+
+class LoopLagMonitor:
+    """Sample event-loop lag while ``run`` is being awaited (cancel it to stop)."""
+
+    def __init__(self, interval_s: float = SAMPLE_INTERVAL_S) -> None:
+        self._interval_s = interval_s
+        self._samples_ms: list[float] = []
+
+    async def run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self._interval_s)
+            lag_s = time.perf_counter() - start - self._interval_s
+            self._samples_ms.append(max(0.0, lag_s * 1000))
+
+    @property
+    def max_ms(self) -> float:
+        return round(max(self._samples_ms, default=0.0), 1)
+
+    @property
+    def p99_ms(self) -> float:
+        if not self._samples_ms:
+            return 0.0
+        ordered = sorted(self._samples_ms)
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 1)
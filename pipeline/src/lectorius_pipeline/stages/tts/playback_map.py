@@ -0,0 +1,147 @@
+"""playback_map.jsonl for the TTS stage, at the end of a run and during it.
+
+While a run is in progress, ``PlaybackMapPublisher`` rewrites the map every
+``publish_interval_s`` with each chapter's playable prefix: its completed
+chunks from the first one up to the first gap. A player reading the map
+mid-run can start any chapter listed there and play to its end without
+hitting missing audio. Each rewrite is atomic, so a reader never sees a
+partial file. At the end of the run the full map (every completed chunk)
+replaces it.
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+
+from lectorius_pipeline.schemas import Chunk, PlaybackMapEntry
+from lectorius_pipeline.utils.io import atomic_write
+
+from .progress import TTSProgress
+
+logger = logging.getLogger(__name__)
+
+
+def build_playback_map(chunks: list[Chunk], progress: TTSProgress) -> list[PlaybackMapEntry]:
+    """Build sorted playback map from progress data."""
+    entries: list[PlaybackMapEntry] = []
+
+    completed_by_id = {e.chunk_id: e for e in progress.completed_entries}
+
+    for chunk in chunks:
+        completed = completed_by_id.get(chunk.chunk_id)
+        if completed is None:
+            continue
+        entries.append(_entry(chunk, completed.audio_path or "", completed.duration_ms or 0))
+
+    # Sort by chunk_index
+    entries.sort(key=lambda e: e.chunk_index)
+    return entries
+
+
+def write_playback_map(book_dir: Path, entries: list[PlaybackMapEntry]) -> None:
+    """Write playback_map.jsonl (atomically; players may be reading it)."""
+    with atomic_write(book_dir / "playback_map.jsonl") as f:
+        for entry in entries:
+            f.write(entry.model_dump_json() + "\n")
+
+
+def _entry(chunk: Chunk, audio_path: str, duration_ms: int) -> PlaybackMapEntry:
+    return PlaybackMapEntry(
+        chunk_id=chunk.chunk_id,
+        chapter_id=chunk.chapter_id,
+        chunk_index=chunk.chunk_index,
+        audio_path=audio_path,
+        duration_ms=duration_ms,
+        start_ms=0,
+        end_ms=duration_ms,
+    )
+
+
+class PlaybackMapPublisher:
+    """Republish the playable prefix of every chapter while chunks complete.
+
+    ``chunk_done`` is thread-safe; the runner calls it from its I/O pool
+    right after recording a chunk in the progress journal.
+    """
+
+    def __init__(
+        self,
+        book_dir: Path,
+        chunks: list[Chunk],
+        progress: TTSProgress,
+        interval_s: float,
+    ) -> None:
+        self._book_dir = book_dir
+        self._interval_s = interval_s
+        self._chapters: dict[str, list[Chunk]] = {}
+        for chunk in sorted(chunks, key=lambda c: c.chunk_index):
+            self._chapters.setdefault(chunk.chapter_id, []).append(chunk)
+        self._chapter_of = {c.chunk_id: c.chapter_id for c in chunks}
+        # chunk_id -> (audio_path, duration_ms), including earlier runs
+        self._done = {
+            e.chunk_id: (e.audio_path or "", e.duration_ms or 0)
+            for e in progress.completed_entries
+        }
+        # Length of each chapter's playable prefix
+        self._prefix = dict.fromkeys(self._chapters, 0)
+        for chapter_id in self._chapters:
+            self._advance(chapter_id)
+        self._published = sum(self._prefix.values())
+        self._started = time.monotonic()
+        self._last_publish = self._started
+        self._lock = threading.Lock()
+        self.publishes = 0
+        # Run time until every chapter had a playable first chunk
+        self.all_chapters_playable_s: float | None = 0.0 if self._all_playable() else None
+
+    @property
+    def enabled(self) -> bool:
+        return self._interval_s > 0
+
+    def chunk_done(self, chunk_id: str, audio_path: str, duration_ms: int) -> None:
+        """Note a completed chunk; republish the map if it is due and has grown."""
+        with self._lock:
+            self._done[chunk_id] = (audio_path, duration_ms)
+            chapter_id = self._chapter_of.get(chunk_id)
+            if chapter_id is None:
+                return
+            self._advance(chapter_id)
+            now = time.monotonic()
+            if self.all_chapters_playable_s is None and self._all_playable():
+                self.all_chapters_playable_s = round(now - self._started, 1)
+            if not self.enabled or now - self._last_publish < self._interval_s:
+                return
+            playable = sum(self._prefix.values())
+            if playable == self._published:
+                return
+            self._publish(playable)
+            self._last_publish = now
+
+    def _advance(self, chapter_id: str) -> None:
+        chapter = self._chapters[chapter_id]
+        n = self._prefix[chapter_id]
+        while n < len(chapter) and chapter[n].chunk_id in self._done:
+            n += 1
+        self._prefix[chapter_id] = n
+
+    def _all_playable(self) -> bool:
+        return all(self._prefix.values())
+
+    def _publish(self, playable: int) -> None:
+        entries = [
+            _entry(chunk, *self._done[chunk.chunk_id])
+            for chapter_id, chapter in self._chapters.items()
+            for chunk in chapter[: self._prefix[chapter_id]]
+        ]
+        entries.sort(key=lambda e: e.chunk_index)
+        write_playback_map(self._book_dir, entries)
+        self._published = playable
+        self.publishes += 1
+        logger.info(
+            "Published playback map: %d/%d chunks playable, %d/%d chapters started",
+            playable,
+            len(self._chapter_of),
+            sum(1 for n in self._prefix.values() if n),
+            len(self._chapters),
+        )
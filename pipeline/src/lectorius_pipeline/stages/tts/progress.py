@@ -1,27 +1,47 @@
 """TTS progress tracking for resumability."""
 
-import json
 import logging
+import os
+import threading
+import time
 from pathlib import Path
+from typing import TextIO
 
 from lectorius_pipeline.schemas import TTSChunkProgress
+from lectorius_pipeline.utils.io import atomic_write
 
 logger = logging.getLogger(__name__)
 
 PROGRESS_FILENAME = "tts_progress.jsonl"
 
+# Buffered records are written out after this many records or seconds,
+# whichever comes first
+FLUSH_EVERY_RECORDS = 64
+FLUSH_INTERVAL_S = 2.0
+
 
 class TTSProgress:
     """Track TTS processing progress for resumability.
 
-    Stores one JSONL record per chunk. On resume, loads completed chunk IDs
-    so they can be skipped.
+    The journal is an append-only JSONL file in which the last record for a
+    chunk wins. Records are buffered and written in batches (see
+    FLUSH_EVERY_RECORDS / FLUSH_INTERVAL_S); ``close`` writes the rest and
+    fsyncs. A crash loses at most the unflushed batch, whose chunks are simply
+    synthesized again. ``compact`` rewrites the journal to one record per
+    chunk, so resume cost follows the number of chunks, not attempts.
+
+    ``record_success``, ``record_failure`` and ``flush`` are thread-safe, so
+    the TTS runner can record from its I/O thread pool.
     """
 
     def __init__(self, book_dir: Path) -> None:
         self._path = book_dir / "reports" / PROGRESS_FILENAME
         self._completed: dict[str, TTSChunkProgress] = {}
         self._failed: dict[str, TTSChunkProgress] = {}
+        self._buffer: list[str] = []
+        self._file: TextIO | None = None
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
 
     @property
     def completed_ids(self) -> set[str]:
@@ -52,17 +72,23 @@ class TTSProgress:
             logger.info("No existing TTS progress found")
             return
 
+        self.flush()
         count = 0
+        seen: set[str] = set()
         with open(self._path) as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
                 entry = TTSChunkProgress.model_validate_json(line)
+                # The last record for a chunk wins
                 if entry.status == "completed":
                     self._completed[entry.chunk_id] = entry
+                    self._failed.pop(entry.chunk_id, None)
                 else:
                     self._failed[entry.chunk_id] = entry
+                    self._completed.pop(entry.chunk_id, None)
+                seen.add(entry.chunk_id)
                 count += 1
 
         logger.info(
@@ -70,6 +96,16 @@ class TTSProgress:
             len(self._completed),
             len(self._failed),
         )
+        if count > len(seen):
+            logger.info("Compacting %d journal records", count)
+            self.compact()
+
+    def rebuild(self, completed: list[TTSChunkProgress]) -> None:
+        """Replace all progress with ``completed`` and rewrite the journal."""
+        self._buffer.clear()
+        self._completed = {e.chunk_id: e for e in completed}
+        self._failed = {}
+        self.compact()
 
     def record_success(
         self,
@@ -84,10 +120,11 @@ class TTSProgress:
             audio_path=audio_path,
             duration_ms=duration_ms,
         )
-        self._completed[chunk_id] = entry
-        # Remove from failed if it was retried
-        self._failed.pop(chunk_id, None)
-        self._append(entry)
+        with self._lock:
+            self._completed[chunk_id] = entry
+            # Remove from failed if it was retried
+            self._failed.pop(chunk_id, None)
+            self._append(entry)
 
     def record_failure(self, chunk_id: str, error: str) -> None:
         """Record a failed chunk."""
@@ -96,14 +133,53 @@ class TTSProgress:
             status="failed",
             error=error,
         )
-        self._failed[chunk_id] = entry
-        self._append(entry)
+        with self._lock:
+            self._failed[chunk_id] = entry
+            self._append(entry)
 
     def _append(self, entry: TTSChunkProgress) -> None:
-        """Append a progress entry to disk."""
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._path, "a") as f:
-            f.write(entry.model_dump_json() + "\n")
+        """Buffer a progress entry, flushing on count or elapsed time."""
+        self._buffer.append(entry.model_dump_json() + "\n")
+        if (
+            len(self._buffer) >= FLUSH_EVERY_RECORDS
+            or time.monotonic() - self._last_flush >= FLUSH_INTERVAL_S
+        ):
+            self._flush()
+
+    def flush(self) -> None:
+        """Write buffered records to the journal (one write call)."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        if self._file is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._path, "a")
+        self._file.write("".join(self._buffer))
+        self._file.flush()
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Flush buffered records and fsync the journal."""
+        self.flush()
+        if self._file is not None:
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+    def compact(self) -> None:
+        """Rewrite the journal with only the latest record per chunk."""
+        self.close()
+        with atomic_write(self._path) as f:
+            for entry in self._completed.values():
+                f.write(entry.model_dump_json() + "\n")
+            for entry in self._failed.values():
+                f.write(entry.model_dump_json() + "\n")
+            f.flush()
+            os.fsync(f.fileno())
 
     def total_duration_ms(self) -> int:
         """Sum of durations for all completed chunks."""
@@ -1,7 +1,7 @@
 """TTS provider implementations."""
 
-from .base import TTSProvider
+from .base import AlignedAudio, TTSProvider
 from .elevenlabs import ElevenLabsTTS
 from .openai_tts import OpenAITTS
 
-__all__ = ["TTSProvider", "OpenAITTS", "ElevenLabsTTS"]
+__all__ = ["AlignedAudio", "TTSProvider", "OpenAITTS", "ElevenLabsTTS"]
@@ -1,10 +1,37 @@
 """Abstract base class for TTS providers."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from types import TracebackType
+
+from lectorius_pipeline.config import RateLimitConfig
+
+
+@dataclass
+class AlignedAudio:
+    """Audio plus when each character of the input text is spoken."""
+
+    audio: bytes
+    char_start_s: list[float]  # one entry per input character
+    char_end_s: list[float]
 
 
 class TTSProvider(ABC):
-    """Base class for text-to-speech providers."""
+    """Base class for text-to-speech providers.
+
+    Providers may hold network clients; use them as an async context manager
+    (or call ``aclose``) so connections are released when the run ends.
+
+    Subclasses may set ``default_rate_limit`` to the provider's quota; the
+    ``tts`` command's --chars-per-minute/--requests-per-minute override it.
+    """
+
+    default_rate_limit: RateLimitConfig = RateLimitConfig()
+    # List price in USD, for estimates (tts --dry-run); None if unknown
+    price_per_million_chars: float | None = None
+    # Whether synthesize_aligned is implemented
+    supports_alignment: bool = False
 
     @property
     @abstractmethod
@@ -24,7 +51,43 @@ class TTSProvider(ABC):
         """Model identifier used for this provider."""
         ...
 
+    @property
+    def voice_settings(self) -> dict[str, object]:
+        """Provider-specific settings that change the audio (part of the cache key)."""
+        return {}
+
     @abstractmethod
     async def synthesize(self, text: str) -> bytes:
         """Generate audio from text, return mp3 bytes."""
         ...
+
+    async def synthesize_stream(self, text: str) -> AsyncGenerator[bytes, None]:
+        """Generate audio from text, yielding mp3 bytes as they arrive.
+
+        The default yields the whole ``synthesize`` result at once. Providers
+        with a streaming API override it, so audio reaches disk as it is
+        received instead of being buffered in memory.
+        """
+        yield await self.synthesize(text)
+
+    async def synthesize_aligned(self, text: str) -> AlignedAudio:
+        """Generate mp3 audio with per-character timestamps.
+
+        Only providers with ``supports_alignment`` implement this.
+        """
+        raise NotImplementedError(f"{self.name} does not return character timestamps")
+
+    async def aclose(self) -> None:
+        """Release network resources. The default provider holds none."""
+        return None
+
+    async def __aenter__(self) -> "TTSProvider":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -1,15 +1,24 @@
 """ElevenLabs TTS provider."""
 
+import base64
+import importlib.util
 import logging
+from collections.abc import AsyncGenerator
 
 import httpx
 
-from .base import TTSProvider
+from lectorius_pipeline.config import HTTPPoolConfig
+
+from .base import AlignedAudio, TTSProvider
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_MODEL = "eleven_multilingual_v2"
 API_BASE = "https://api.elevenlabs.io/v1/text-to-speech"
+VOICE_SETTINGS = {
+    "stability": 0.5,
+    "similarity_boost": 0.75,
+}
 
 
 class ElevenLabsTTS(TTSProvider):
@@ -17,17 +26,28 @@ class ElevenLabsTTS(TTSProvider):
 
     Production-quality voice synthesis. Requires a voice_id from the
     ElevenLabs dashboard. Cost is quota-based (~$300/1M chars equivalent).
+
+    One ``httpx.AsyncClient`` is shared by all requests, so connections (and
+    their TLS sessions) are reused across chunks. It is created on first use,
+    inside the running event loop, and released by ``aclose``.
     """
 
+    # Quota-based plans; roughly what a character costs on them
+    price_per_million_chars = 300.0
+    supports_alignment = True
+
     def __init__(
         self,
         api_key: str,
         voice_id: str,
         model: str = DEFAULT_MODEL,
+        http: HTTPPoolConfig | None = None,
     ) -> None:
         self._api_key = api_key
         self._voice_id = voice_id
         self._model = model
+        self._http = http or HTTPPoolConfig()
+        self._client: httpx.AsyncClient | None = None
 
     @property
     def name(self) -> str:
@@ -41,28 +61,70 @@ class ElevenLabsTTS(TTSProvider):
     def model(self) -> str:
         return self._model
 
+    @property
+    def voice_settings(self) -> dict[str, object]:
+        return dict(VOICE_SETTINGS)
+
     async def synthesize(self, text: str) -> bytes:
         """Generate mp3 audio from text using ElevenLabs API."""
-        url = f"{API_BASE}/{self._voice_id}"
-        headers = {
-            "xi-api-key": self._api_key,
-            "Content-Type": "application/json",
-        }
-        payload = {
+        response = await self._get_client().post(f"/{self._voice_id}", json=self._payload(text))
+        response.raise_for_status()
+        return response.content
+
+    async def synthesize_stream(self, text: str) -> AsyncGenerator[bytes, None]:
+        """Stream mp3 audio from the ElevenLabs streaming endpoint."""
+        async with self._get_client().stream(
+            "POST", f"/{self._voice_id}/stream", json=self._payload(text)
+        ) as response:
+            response.raise_for_status()
+            async for piece in response.aiter_bytes():
+                yield piece
+
+    async def synthesize_aligned(self, text: str) -> AlignedAudio:
+        """Generate mp3 audio with character timestamps (the with-timestamps endpoint)."""
+        response = await self._get_client().post(
+            f"/{self._voice_id}/with-timestamps", json=self._payload(text)
+        )
+        response.raise_for_status()
+        body = response.json()
+        alignment = body.get("alignment") or {}
+        return AlignedAudio(
+            audio=base64.b64decode(body["audio_base64"]),
+            char_start_s=alignment.get("character_start_times_seconds", []),
+            char_end_s=alignment.get("character_end_times_seconds", []),
+        )
+
+    def _payload(self, text: str) -> dict[str, object]:
+        return {
             "text": text,
             "model_id": self._model,
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.75,
-            },
+            "voice_settings": VOICE_SETTINGS,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                headers=headers,
-                json=payload,
-                timeout=60.0,
+    async def aclose(self) -> None:
+        """Close pooled connections. A later synthesize() opens a new client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            http2 = self._http.http2
+            if http2 and importlib.util.find_spec("h2") is None:
+                logger.warning("h2 not installed (pip install 'httpx[http2]'), using HTTP/1.1")
+                http2 = False
+            self._client = httpx.AsyncClient(
+                base_url=API_BASE,
+                headers={
+                    "xi-api-key": self._api_key,
+                    "Content-Type": "application/json",
+                },
+                limits=httpx.Limits(
+                    max_connections=self._http.max_connections,
+                    max_keepalive_connections=self._http.max_keepalive_connections,
+                    keepalive_expiry=self._http.keepalive_expiry,
+                ),
+                http2=http2,
+                timeout=self._http.timeout,
             )
-            response.raise_for_status()
-            return response.content
+        return self._client
@@ -1,6 +1,7 @@
 """OpenAI TTS provider."""
 
 import logging
+from collections.abc import AsyncGenerator
 
 from openai import AsyncOpenAI
 
@@ -14,7 +15,12 @@ DEFAULT_MODEL = "gpt-4o-mini-tts"
 
 
 class OpenAITTS(TTSProvider):
-    """OpenAI text-to-speech provider using gpt-4o-mini-tts."""
+    """OpenAI text-to-speech provider using gpt-4o-mini-tts.
+
+    The SDK client is created on first use and released by ``aclose``.
+    """
+
+    price_per_million_chars = 15.0
 
     def __init__(
         self,
@@ -22,7 +28,8 @@ class OpenAITTS(TTSProvider):
         voice: str = DEFAULT_VOICE,
         model: str = DEFAULT_MODEL,
     ) -> None:
-        self._client = AsyncOpenAI(api_key=api_key)
+        self._api_key = api_key
+        self._client: AsyncOpenAI | None = None
         self._voice = voice
         self._model = model
 
@@ -40,10 +47,32 @@ class OpenAITTS(TTSProvider):
 
     async def synthesize(self, text: str) -> bytes:
         """Generate mp3 audio from text using OpenAI TTS API."""
-        response = await self._client.audio.speech.create(
+        response = await self._get_client().audio.speech.create(
             model=self._model,
             voice=self._voice,
             input=text,
             response_format="mp3",
         )
         return response.content
+
+    async def synthesize_stream(self, text: str) -> AsyncGenerator[bytes, None]:
+        """Stream mp3 audio from the OpenAI TTS API as it is generated."""
+        async with self._get_client().audio.speech.with_streaming_response.create(
+            model=self._model,
+            voice=self._voice,
+            input=text,
+            response_format="mp3",
+        ) as response:
+            async for piece in response.iter_bytes():
+                yield piece
+
+    async def aclose(self) -> None:
+        """Close the SDK's pooled HTTP client."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def _get_client(self) -> AsyncOpenAI:
+        if self._client is None:
+            self._client = AsyncOpenAI(api_key=self._api_key)
+        return self._client
@@ -0,0 +1,101 @@
+"""Token-bucket pacing of TTS requests against provider quotas.
+
+Provider quotas are counted in characters (and requests) per unit of time,
+so requests are paced by two buckets: one refilled at ``chars_per_minute``
+and charged ``len(text)`` per request, one refilled at
+``requests_per_minute`` and charged 1. Each bucket holds ``burst_seconds``
+worth of quota, so a run starts with a short burst and then settles at the
+quota rate instead of overshooting it and burning retries on 429s.
+"""
+
+import asyncio
+import logging
+import time
+
+from lectorius_pipeline.config import RateLimitConfig
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Tokens refill continuously at ``rate_per_s`` up to ``capacity``.
+
+    A charge larger than the capacity is admitted once the bucket is full
+    and leaves it in debt, so oversized requests still go through and are
+    paid for by later ones.
+    """
+
+    def __init__(self, rate_per_s: float, capacity: float) -> None:
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s must be positive")
+        self._rate = rate_per_s
+        self._capacity = max(capacity, 1.0)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def delay_for(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens (capped at capacity) are available."""
+        self._refill()
+        missing = min(amount, self._capacity) - self._tokens
+        return max(0.0, missing / self._rate)
+
+    def charge(self, amount: float) -> None:
+        self._refill()
+        self._tokens -= amount
+
+
+class ProviderRateLimiter:
+    """Pace requests by characters and by count; FIFO across concurrent callers."""
+
+    def __init__(self, config: RateLimitConfig | None = None) -> None:
+        config = config or RateLimitConfig()
+        self._buckets: list[tuple[TokenBucket, bool]] = []  # (bucket, charged per char)
+        if config.chars_per_minute:
+            rate = config.chars_per_minute / 60
+            self._buckets.append((TokenBucket(rate, rate * config.burst_seconds), True))
+        if config.requests_per_minute:
+            rate = config.requests_per_minute / 60
+            self._buckets.append((TokenBucket(rate, rate * config.burst_seconds), False))
+        self._lock = asyncio.Lock()
+        self.wait_s = 0.0  # total time callers spent waiting for quota
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._buckets)
+
+    async def acquire(self, chars: int) -> None:
+        """Wait until a request of ``chars`` characters fits the quota, then charge it."""
+        if not self._buckets:
+            return
+        started = time.monotonic()
+        # Holding the lock while sleeping keeps callers in arrival order
+        async with self._lock:
+            while True:
+                delay = max(
+                    bucket.delay_for(chars if per_char else 1)
+                    for bucket, per_char in self._buckets
+                )
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            for bucket, per_char in self._buckets:
+                bucket.charge(chars if per_char else 1)
+        self.wait_s += time.monotonic() - started
+
+
+def effective_rate_limit(
+    default: RateLimitConfig, override: RateLimitConfig | None
+) -> RateLimitConfig:
+    """Merge explicit quota settings over a provider's defaults."""
+    if override is None:
+        return default
+    return RateLimitConfig(
+        chars_per_minute=override.chars_per_minute or default.chars_per_minute,
+        requests_per_minute=override.requests_per_minute or default.requests_per_minute,
+        burst_seconds=override.burst_seconds,
+    )
@@ -0,0 +1,116 @@
+"""Rebuild TTS progress from the audio files actually on disk.
+
+``--resume`` trusts the progress journal, and a fresh run trusts nothing.
+After a crash or a partial copy of ``audio/chunks/``, neither is right.
+Reconciling probes every chunk's expected MP3 in parallel and keeps a chunk
+only if its file exists, has a readable MPEG header and a plausible duration.
+Progress is then rebuilt from those files, so only missing or corrupt chunks
+are synthesized again.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from lectorius_pipeline.schemas import Chunk, TTSChunkProgress
+from lectorius_pipeline.stages.verify.audio import DEFAULT_PROBE_WORKERS, probe_audio
+from lectorius_pipeline.stages.verify.runner import DURATION_TOLERANCE_MS
+from lectorius_pipeline.utils.speech_rate import SpeechRate
+
+from .progress import TTSProgress
+
+logger = logging.getLogger(__name__)
+
+# Without a journal record, audio shorter than this fraction of the duration
+# expected from the speech rate is taken to be truncated (a partial copy)
+MIN_EXPECTED_DURATION_RATIO = 0.5
+
+
+@dataclass
+class ReconcileResult:
+    """Outcome of comparing chunks with the audio on disk."""
+
+    valid: int = 0
+    missing: list[str] = field(default_factory=list)  # chunk IDs without a file
+    invalid: list[str] = field(default_factory=list)  # chunk IDs with a corrupt/truncated file
+
+
+def reconcile_progress(
+    book_dir: Path,
+    chunks: list[Chunk],
+    progress: TTSProgress,
+    speech_rate: SpeechRate,
+    workers: int = DEFAULT_PROBE_WORKERS,
+) -> ReconcileResult:
+    """
+    Replace ``progress`` with one completed record per valid audio file.
+
+    A file is valid when it exists, is non-empty, parses as MP3 with a
+    positive duration, and that duration matches the journal record (within
+    DURATION_TOLERANCE_MS) or, without a record, is at least
+    MIN_EXPECTED_DURATION_RATIO of what ``speech_rate`` predicts.
+
+    Args:
+        book_dir: Book output directory
+        chunks: All chunks of the book
+        progress: Progress loaded from the journal (may be empty); rebuilt in place
+        speech_rate: Speaking rate used to judge files without a journal record
+        workers: Threads used to probe audio files
+
+    Returns:
+        ReconcileResult with counts of valid, missing and invalid chunks
+    """
+    journal = {e.chunk_id: e for e in progress.completed_entries}
+    paths = {chunk.chunk_id: f"audio/chunks/{chunk.chunk_id}.mp3" for chunk in chunks}
+    probes = probe_audio(book_dir, list(paths.values()), workers)
+
+    result = ReconcileResult()
+    completed: list[TTSChunkProgress] = []
+    for chunk in chunks:
+        path = paths[chunk.chunk_id]
+        probe = probes[path]
+        if probe.size is None:
+            result.missing.append(chunk.chunk_id)
+            continue
+        if not _plausible(probe.duration_ms, journal.get(chunk.chunk_id), chunk, speech_rate):
+            logger.debug(
+                "Chunk %s: %s (%s bytes, %s ms) is not valid audio",
+                chunk.chunk_id,
+                path,
+                probe.size,
+                probe.duration_ms,
+            )
+            result.invalid.append(chunk.chunk_id)
+            continue
+        completed.append(
+            TTSChunkProgress(
+                chunk_id=chunk.chunk_id,
+                status="completed",
+                audio_path=path,
+                duration_ms=probe.duration_ms,
+            )
+        )
+
+    result.valid = len(completed)
+    progress.rebuild(completed)
+    logger.info(
+        "Reconciled with audio on disk: %d valid, %d missing, %d invalid",
+        result.valid,
+        len(result.missing),
+        len(result.invalid),
+    )
+    return result
+
+
+def _plausible(
+    duration_ms: int | None,
+    record: TTSChunkProgress | None,
+    chunk: Chunk,
+    speech_rate: SpeechRate,
+) -> bool:
+    if not duration_ms or duration_ms <= 0:
+        return False
+    if record is not None and record.duration_ms and record.duration_ms > 0:
+        return abs(duration_ms - record.duration_ms) <= DURATION_TOLERANCE_MS
+    expected_ms = len(chunk.text) / speech_rate.chars_per_second * 1000
+    return duration_ms >= MIN_EXPECTED_DURATION_RATIO * expected_ms
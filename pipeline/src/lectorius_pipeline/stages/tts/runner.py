@@ -1,26 +1,86 @@
 """TTS stage runner — generate audio for each chunk."""
 
 import asyncio
+import contextlib
 import logging
 import os
+import signal
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import BinaryIO, TypeVar
 
 from mutagen.mp3 import MP3
 
+from lectorius_pipeline.config import (
+    AdaptiveConcurrencyConfig,
+    AudioCacheConfig,
+    BatchConfig,
+    HedgeConfig,
+    HTTPPoolConfig,
+    RateLimitConfig,
+    TTSScheduleConfig,
+)
 from lectorius_pipeline.errors import AudioWriteError, TTSError, TTSProviderError
-from lectorius_pipeline.schemas import Chunk, PlaybackMapEntry, TTSReport
-from lectorius_pipeline.utils.io import load_book_meta, load_chunks
-
+from lectorius_pipeline.schemas import Chunk, TTSReport
+from lectorius_pipeline.utils.io import (
+    link_or_copy,
+    load_book_meta,
+    load_chunks,
+    unique_temp_path,
+)
+from lectorius_pipeline.utils.mp3 import MP3DurationCounter, mp3_duration_ms
+from lectorius_pipeline.utils.speech_rate import estimate_speech_rate
+
+from .audio_cache import AudioCache, cache_key
+from .batching import ChunkBatches, batch_text, split_audio
+from .concurrency import AdaptiveLimiter
+from .dedup import DuplicateGroups
+from .hedging import HedgePolicy
+from .loop_lag import LoopLagMonitor
+from .playback_map import PlaybackMapPublisher, build_playback_map, write_playback_map
 from .progress import TTSProgress
-from .providers.base import TTSProvider
+from .providers.base import AlignedAudio, TTSProvider
 from .providers.elevenlabs import ElevenLabsTTS
 from .providers.openai_tts import OpenAITTS
+from .rate_limit import ProviderRateLimiter, effective_rate_limit
+from .reconcile import reconcile_progress
+from .scheduler import QUEUE_DEPTH_PER_WORKER, ChunkQueue, chapter_head_priority
+from .telemetry import SAMPLES_FILENAME, RequestSample, RequestTelemetry
 
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 2.0
 
+# Threads for audio writes, cache links and journal records, which must not
+# block the event loop
+IO_WORKERS = 4
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class _SynthesisContext:
+    """Per-run collaborators shared by every chunk's synthesis."""
+
+    provider: TTSProvider
+    audio_dir: Path
+    progress: TTSProgress
+    publisher: PlaybackMapPublisher
+    limiter: AdaptiveLimiter
+    pacer: ProviderRateLimiter
+    cache: AudioCache | None
+    io_pool: ThreadPoolExecutor
+    priority: Callable[[Chunk], int]
+    duplicates: DuplicateGroups
+    batches: ChunkBatches
+    hedging: HedgePolicy
+    lag: LoopLagMonitor = field(default_factory=LoopLagMonitor)
+    telemetry: RequestTelemetry = field(default_factory=RequestTelemetry)
+
 
 def run_tts(
     book_dir: Path,
@@ -30,6 +90,14 @@ def run_tts(
     model: str | None = None,
     resume: bool = False,
     concurrency: int = 5,
+    reconcile: bool = False,
+    http: HTTPPoolConfig | None = None,
+    adaptive: AdaptiveConcurrencyConfig | None = None,
+    rate_limit: RateLimitConfig | None = None,
+    cache: AudioCacheConfig | None = None,
+    schedule: TTSScheduleConfig | None = None,
+    hedge: HedgeConfig | None = None,
+    batch: BatchConfig | None = None,
 ) -> TTSReport:
     """Run the TTS stage.
 
@@ -40,7 +108,22 @@ def run_tts(
         voice: Voice name/ID (provider-specific). Reads from book.json if None.
         model: Model name. Uses provider default if None.
         resume: If True, skip already-completed chunks.
-        concurrency: Max parallel API requests.
+        reconcile: If True, rebuild progress from the valid audio files in
+            audio/chunks/ (checked against the journal where it has a
+            record) and synthesize only missing or corrupt chunks.
+        concurrency: Max parallel API requests (the starting point when adaptive).
+        http: Connection pool settings for HTTP-based providers.
+        adaptive: If set, tune concurrency within these bounds (AIMD) instead
+            of keeping it fixed.
+        rate_limit: Quota to pace requests against. Fields left as None fall
+            back to the provider's ``default_rate_limit``.
+        cache: Content-addressed audio cache to reuse audio from; None disables it.
+        schedule: Chunk ordering and mid-run playback map publishing; defaults
+            to TTSScheduleConfig().
+        hedge: If set, send a second request for a chunk whose request runs
+            past the live latency percentile, within a character budget.
+        batch: If set, pack runs of short chunks into one request and split
+            the returned audio per chunk.
 
     Returns:
         TTSReport with processing stats.
@@ -48,6 +131,8 @@ def run_tts(
     Raises:
         TTSError: If the stage fails critically.
     """
+    schedule = schedule or TTSScheduleConfig()
+
     # Load chunks
     chunks = load_chunks(book_dir, TTSError)
     logger.info("Loaded %d chunks for TTS", len(chunks))
@@ -60,31 +145,99 @@ def run_tts(
     logger.info("Starting TTS stage for %s (provider=%s)", book_id, effective_provider)
 
     # Create provider
-    provider = create_provider(effective_provider, effective_voice, model)
+    provider = create_provider(effective_provider, effective_voice, model, http)
     logger.info("Using %s provider (voice=%s, model=%s)", provider.name, provider.voice, provider.model)
 
     # Setup audio output directory
     audio_dir = book_dir / "audio" / "chunks"
     audio_dir.mkdir(parents=True, exist_ok=True)
+    for stale in audio_dir.glob(".*.tmp"):
+        # Partial stream from an interrupted run
+        stale.unlink()
 
     # Load progress
     progress = TTSProgress(book_dir)
-    if resume:
+    reconciled = None
+    if reconcile:
+        progress.load()
+        speech_rate = estimate_speech_rate(book_dir.parent, provider.name, provider.voice)
+        reconciled = reconcile_progress(book_dir, chunks, progress, speech_rate)
+    elif resume:
         progress.load()
         logger.info("Resuming: %d chunks already completed", progress.completed_count)
 
     # Filter to pending chunks
     pending = [c for c in chunks if c.chunk_id not in progress.completed_ids]
-    logger.info("Processing %d pending chunks (concurrency=%d)", len(pending), concurrency)
+    duplicates = DuplicateGroups(pending)
+    logger.info(
+        "Processing %d pending chunks (concurrency=%d%s)",
+        len(pending),
+        concurrency,
+        ", adaptive" if adaptive else "",
+    )
+    if duplicates.duplicate_count:
+        logger.info(
+            "%d pending chunks repeat another chunk's text and will reuse its audio",
+            duplicates.duplicate_count,
+        )
+    batches = ChunkBatches(duplicates.representatives, batch)
+    if batches.batch_count:
+        logger.info(
+            "Packing %d short chunks into %d requests",
+            batches.batched_chunks,
+            batches.batch_count,
+        )
 
     # Run async processing
-    asyncio.run(_process_chunks(pending, provider, audio_dir, progress, concurrency))
+    limiter = AdaptiveLimiter(concurrency, adaptive)
+    quota = effective_rate_limit(provider.default_rate_limit, rate_limit)
+    pacer = ProviderRateLimiter(quota)
+    if pacer.enabled:
+        logger.info(
+            "Pacing requests to %s chars/min, %s requests/min",
+            quota.chars_per_minute or "unlimited",
+            quota.requests_per_minute or "unlimited",
+        )
+    audio_cache = AudioCache(cache) if cache else None
+    publisher = PlaybackMapPublisher(book_dir, chunks, progress, schedule.publish_interval_s)
+    try:
+        with ThreadPoolExecutor(IO_WORKERS, thread_name_prefix="tts-io") as io_pool:
+            context = _SynthesisContext(
+                provider,
+                audio_dir,
+                progress,
+                publisher,
+                limiter,
+                pacer,
+                audio_cache,
+                io_pool,
+                priority=batches.priority(
+                    duplicates.priority(chapter_head_priority(chunks, schedule.head_chunks))
+                ),
+                duplicates=duplicates,
+                batches=batches,
+                hedging=HedgePolicy(hedge, sum(len(c.text) for c in batches.items)),
+            )
+            asyncio.run(_run_provider(batches.items, context))
+    except asyncio.CancelledError:
+        # SIGTERM; Ctrl-C surfaces as KeyboardInterrupt instead
+        raise TTSError("TTS run was terminated; progress is saved, rerun with --resume") from None
+    finally:
+        # Persist what finished even if the run is interrupted
+        progress.close()
+    # Every pending chunk now has a record, so the in-memory state is complete
+    progress.compact()
 
     # Build playback map
-    playback_entries = _build_playback_map(chunks, progress, book_dir)
+    playback_entries = build_playback_map(chunks, progress)
 
     # Write playback_map.jsonl
-    _write_playback_map(book_dir, playback_entries)
+    write_playback_map(book_dir, playback_entries)
+    logger.info("Wrote %d playback map entries", len(playback_entries))
+
+    reports_dir = book_dir / "reports"
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    context.telemetry.write_samples(reports_dir / SAMPLES_FILENAME)
 
     # Build report
     report = TTSReport(
@@ -97,13 +250,35 @@ def run_tts(
         completed_chunks=progress.completed_count,
         failed_chunks=progress.failed_count,
         total_duration_ms=progress.total_duration_ms(),
+        adaptive_concurrency=adaptive is not None,
+        final_concurrency=limiter.limit,
+        throttled_requests=limiter.throttled_count,
+        concurrency_trajectory=limiter.trajectory,
+        rate_limit_wait_s=round(pacer.wait_s, 1),
+        cache_hits=audio_cache.hits if audio_cache else 0,
+        deduplicated_chunks=duplicates.reused,
+        deduplicated_chars=duplicates.saved_chars,
+        head_chunks=schedule.head_chunks,
+        playback_map_publishes=publisher.publishes,
+        all_chapters_playable_s=publisher.all_chapters_playable_s,
+        requests=context.telemetry.stats(f"reports/{SAMPLES_FILENAME}"),
+        hedged_requests=context.hedging.hedges,
+        hedge_wins=context.hedging.wins,
+        hedge_chars=context.hedging.spent_chars,
+        hedge_threshold_ms=context.hedging.threshold_ms,
+        batched_requests=batches.batch_count,
+        batched_chunks=batches.batched_chunks,
+        batch_split_fallbacks=batches.fallbacks,
+        reconciled=reconciled is not None,
+        reconciled_valid=reconciled.valid if reconciled else 0,
+        reconciled_invalid=reconciled.invalid if reconciled else [],
+        event_loop_lag_p99_ms=context.lag.p99_ms,
+        event_loop_lag_max_ms=context.lag.max_ms,
         warnings=[f"Failed chunk: {e.chunk_id} — {e.error}" for e in progress.failed_entries],
         errors=[],
     )
 
     # Write report
-    reports_dir = book_dir / "reports"
-    reports_dir.mkdir(parents=True, exist_ok=True)
     report_path = reports_dir / "tts.json"
     report_path.write_text(report.model_dump_json(indent=2))
 
@@ -129,11 +304,17 @@ def create_provider(
     provider_name: str,
     voice: str | None,
     model: str | None,
+    http: HTTPPoolConfig | None = None,
+    offline: bool = False,
 ) -> TTSProvider:
-    """Create a TTS provider instance from name and config."""
+    """Create a TTS provider instance from name and config.
+
+    With ``offline``, no API key is needed; the provider is only inspected
+    (name, voice, model, quota, price) and must not send requests.
+    """
     if provider_name == "openai":
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
+        api_key = os.environ.get("OPENAI_API_KEY", "")
+        if not api_key and not offline:
             raise TTSError("OPENAI_API_KEY environment variable not set")
         kwargs: dict = {"api_key": api_key}
         if voice:
@@ -143,8 +324,8 @@ def create_provider(
         return OpenAITTS(**kwargs)
 
     elif provider_name == "elevenlabs":
-        api_key = os.environ.get("ELEVENLABS_API_KEY")
-        if not api_key:
+        api_key = os.environ.get("ELEVENLABS_API_KEY", "")
+        if not api_key and not offline:
             raise TTSError("ELEVENLABS_API_KEY environment variable not set")
         voice_id = voice or os.environ.get("ELEVENLABS_VOICE_ID")
         if not voice_id:
@@ -154,133 +335,476 @@ def create_provider(
         kwargs = {"api_key": api_key, "voice_id": voice_id}
         if model:
             kwargs["model"] = model
+        if http:
+            kwargs["http"] = http
         return ElevenLabsTTS(**kwargs)
 
     else:
         raise TTSError(f"Unknown TTS provider: {provider_name}")
 
 
-async def _process_chunks(
-    chunks: list[Chunk],
-    provider: TTSProvider,
-    audio_dir: Path,
-    progress: TTSProgress,
-    concurrency: int,
-) -> None:
-    """Process chunks with bounded concurrency."""
-    if not chunks:
-        return
+async def _run_provider(chunks: list[Chunk], context: _SynthesisContext) -> None:
+    """Process chunks, closing the provider's connections in the same event loop.
+
+    SIGTERM cancels the run like Ctrl-C does, so in-flight attempts unwind
+    and progress is flushed before the process exits.
+    """
+    loop = asyncio.get_running_loop()
+    main = asyncio.current_task()
+    try:
+        if main is not None:
+            loop.add_signal_handler(signal.SIGTERM, main.cancel)
+    except (NotImplementedError, RuntimeError):
+        pass  # no signal support (Windows) or not the main thread
+    monitor = asyncio.create_task(context.lag.run())
+    try:
+        async with context.provider:
+            await _process_chunks(chunks, context)
+    finally:
+        monitor.cancel()
+        with contextlib.suppress(NotImplementedError, RuntimeError):
+            loop.remove_signal_handler(signal.SIGTERM)
+
+
+async def _process_chunks(chunks: list[Chunk], context: _SynthesisContext) -> None:
+    """Drain a priority queue of chunks with one worker per possible slot.
 
-    semaphore = asyncio.Semaphore(concurrency)
+    The limiter still decides how many requests are in flight; workers
+    beyond its current limit wait for a slot.
+    """
+    workers = context.limiter.ceiling
+    queue = ChunkQueue(
+        chunks, context.priority, depth=workers * QUEUE_DEPTH_PER_WORKER
+    )
+    try:
+        await queue.run(lambda item, attempt: _synthesize_item(item, attempt, context), workers)
+    finally:
+        # Also on cancellation: what finished is on disk before we return
+        await _in_io(context, context.progress.flush)
 
-    async def process_one(chunk: Chunk) -> None:
-        async with semaphore:
-            await _synthesize_chunk(chunk, provider, audio_dir, progress)
 
-    tasks = [process_one(chunk) for chunk in chunks]
-    await asyncio.gather(*tasks)
+async def _synthesize_item(
+    item: Chunk, attempt: int, context: _SynthesisContext
+) -> float | None:
+    """Make one attempt at a queue item: a chunk, or a batch of short ones."""
+    members = context.batches.members(item)
+    if members is None:
+        return await _synthesize_chunk(item, attempt, context)
+    return await _synthesize_batch(item, members, attempt, context)
 
 
 async def _synthesize_chunk(
-    chunk: Chunk,
-    provider: TTSProvider,
-    audio_dir: Path,
-    progress: TTSProgress,
-) -> None:
-    """Synthesize a single chunk with retry logic."""
-    audio_path = audio_dir / f"{chunk.chunk_id}.mp3"
-    relative_path = f"audio/chunks/{chunk.chunk_id}.mp3"
+    chunk: Chunk, attempt: int, context: _SynthesisContext
+) -> float | None:
+    """Make one attempt at synthesizing a chunk.
+
+    Audio already in the cache is linked into the pack without an API call.
+    Once the chunk's audio is on disk, it is linked to every pending chunk
+    with the same text (see DuplicateGroups), which is recorded too.
+    Otherwise the attempt first waits for quota, then holds a limiter slot
+    only for the API call, so neither quota waits nor backoff delays occupy
+    concurrency (or count as request latency). Audio is streamed to a temp
+    file and renamed into place, so a chunk is never held in memory whole.
+    Disk work (cache links, audio writes, journal records) runs on the I/O
+    pool, so no request waits on another's disk I/O. Each API call is timed
+    into ``context.telemetry`` (see telemetry.py).
 
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            audio_bytes = await provider.synthesize(chunk.text)
-
-            # Write to disk
-            try:
-                audio_path.write_bytes(audio_bytes)
-            except OSError as e:
-                raise AudioWriteError(f"Failed to write {audio_path}: {e}") from e
-
-            # Get duration
-            duration_ms = _get_duration_ms(audio_path)
-
-            progress.record_success(chunk.chunk_id, relative_path, duration_ms)
-            logger.debug(
-                "Chunk %s: %dms (%d bytes)",
-                chunk.chunk_id,
-                duration_ms,
-                len(audio_bytes),
-            )
-            return
-
-        except AudioWriteError:
-            # Don't retry disk errors
-            raise
-
-        except Exception as e:
-            if attempt < MAX_RETRIES:
-                delay = RETRY_BACKOFF_BASE ** attempt
-                logger.warning(
-                    "Chunk %s attempt %d/%d failed: %s. Retrying in %.1fs...",
-                    chunk.chunk_id,
-                    attempt,
-                    MAX_RETRIES,
-                    str(e),
-                    delay,
-                )
-                await asyncio.sleep(delay)
-            else:
-                error_msg = f"Failed after {MAX_RETRIES} attempts: {e}"
-                logger.error("Chunk %s: %s", chunk.chunk_id, error_msg)
-                progress.record_failure(chunk.chunk_id, error_msg)
+    Returns:
+        Seconds to back off before the next attempt, or None once the chunk
+        is done or has failed for good (and was recorded as failed).
 
+    Raises:
+        AudioWriteError: If audio cannot be written (not retried).
+    """
+    audio_path = context.audio_dir / f"{chunk.chunk_id}.mp3"
+    if attempt == 1 and await _use_cached(chunk, context):
+        return None
 
-def _get_duration_ms(audio_path: Path) -> int:
-    """Get duration of an mp3 file in milliseconds using mutagen."""
     try:
-        audio = MP3(audio_path)
-        return int(audio.info.length * 1000)
+        await context.pacer.acquire(len(chunk.text))
+        audio_file = await _fetch_audio(chunk, attempt, audio_path, context)
+        try:
+            duration_ms = await _in_io(context, audio_file.commit)
+        finally:
+            await _in_io(context, audio_file.discard)
+        await _chunk_done(chunk, duration_ms, context, synthesized=True)
+        logger.debug(
+            "Chunk %s: %dms (%d bytes)",
+            chunk.chunk_id,
+            duration_ms,
+            audio_file.size,
+        )
+        return None
+
+    except AudioWriteError:
+        # Don't retry disk errors
+        raise
+
     except Exception as e:
-        logger.warning("Could not read duration for %s: %s", audio_path.name, e)
-        return -1
+        return await _retry_or_fail(chunk.chunk_id, [chunk], attempt, e, context)
 
 
-def _build_playback_map(
-    chunks: list[Chunk],
-    progress: TTSProgress,
-    book_dir: Path,
-) -> list[PlaybackMapEntry]:
-    """Build sorted playback map from progress data."""
-    entries: list[PlaybackMapEntry] = []
+async def _synthesize_batch(
+    item: Chunk, members: list[Chunk], attempt: int, context: _SynthesisContext
+) -> float | None:
+    """Make one attempt at a packed request for ``members`` (see batching.py).
 
-    completed_by_id = {e.chunk_id: e for e in progress.completed_entries}
+    Members already in the cache are taken from it first, and the batch
+    shrinks to the rest. Their audio comes back in one piece, with character
+    timestamps if the provider has them, and is cut into one file per chunk.
+    If it cannot be cut, or the last attempt fails, the chunks are
+    synthesized one by one instead.
+    Packed requests are not hedged.
+    """
+    if attempt == 1:
+        members = [m for m in members if not await _use_cached(m, context)]
+        context.batches.set_members(item, members)
+    if len(members) <= 1:
+        return await _synthesize_chunk(members[0], attempt, context) if members else None
 
+    text = batch_text(members)
+    try:
+        await context.pacer.acquire(len(text))
+        data, alignment = await _request_batch(item.chunk_id, text, attempt, context)
+        pieces = await _in_io(context, split_audio, data, members, alignment)
+        reason = "could not split its audio"
+    except AudioWriteError:
+        raise
+    except Exception as e:
+        if attempt < MAX_RETRIES:
+            return await _retry_or_fail(item.chunk_id, members, attempt, e, context)
+        # One bad chunk must not fail its neighbours
+        pieces = None
+        reason = f"failed after {MAX_RETRIES} attempts: {e}"
+
+    if pieces is None:
+        context.batches.fallbacks += 1
+        logger.warning(
+            "Batch %s %s; synthesizing its %d chunks separately",
+            item.chunk_id,
+            reason,
+            len(members),
+        )
+        await asyncio.gather(*(_synthesize_alone(m, context) for m in members))
+        return None
+    for member, piece in zip(members, pieces, strict=True):
+        audio_path = context.audio_dir / f"{member.chunk_id}.mp3"
+        duration_ms = await _in_io(context, _write_audio, audio_path, piece)
+        await _chunk_done(member, duration_ms, context, synthesized=True)
+    logger.debug("Batch %s: %d chunks from one request", item.chunk_id, len(members))
+    return None
+
+
+async def _synthesize_alone(chunk: Chunk, context: _SynthesisContext) -> None:
+    """Synthesize one chunk until done or failed, backing off in place."""
+    attempt = 1
+    while (delay := await _synthesize_chunk(chunk, attempt, context)) is not None:
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _retry_or_fail(
+    label: str,
+    chunks: list[Chunk],
+    attempt: int,
+    error: Exception,
+    context: _SynthesisContext,
+) -> float | None:
+    """Backoff before the next attempt, or None after recording ``chunks`` as failed."""
+    if attempt < MAX_RETRIES:
+        delay = RETRY_BACKOFF_BASE ** attempt
+        logger.warning(
+            "Chunk %s attempt %d/%d failed: %s. Retrying in %.1fs...",
+            label,
+            attempt,
+            MAX_RETRIES,
+            str(error),
+            delay,
+        )
+        return delay
+    error_msg = f"Failed after {MAX_RETRIES} attempts: {error}"
+    logger.error("Chunk %s: %s", label, error_msg)
     for chunk in chunks:
-        completed = completed_by_id.get(chunk.chunk_id)
-        if completed is None:
-            continue
-
-        entries.append(
-            PlaybackMapEntry(
-                chunk_id=chunk.chunk_id,
-                chapter_id=chunk.chapter_id,
-                chunk_index=chunk.chunk_index,
-                audio_path=completed.audio_path or "",
-                duration_ms=completed.duration_ms or 0,
-                start_ms=0,
-                end_ms=completed.duration_ms or 0,
+        await _in_io(context, context.progress.record_failure, chunk.chunk_id, error_msg)
+        for duplicate in context.duplicates.duplicates_of(chunk):
+            await _in_io(
+                context,
+                context.progress.record_failure,
+                duplicate.chunk_id,
+                f"Same text as {chunk.chunk_id}: {error_msg}",
             )
-        )
+    return None
+
+
+async def _use_cached(chunk: Chunk, context: _SynthesisContext) -> bool:
+    """Link cached audio for ``chunk`` into the pack; False on a miss (or no cache)."""
+    if context.cache is None:
+        return False
+    audio_path = context.audio_dir / f"{chunk.chunk_id}.mp3"
+    key = _cache_key(chunk, context)
+    cached_ms = await _in_io(context, _place_cached, context.cache, key, audio_path)
+    if cached_ms is None:
+        return False
+    await _chunk_done(chunk, cached_ms, context, synthesized=False)
+    logger.debug("Chunk %s: %dms (cached)", chunk.chunk_id, cached_ms)
+    return True
+
+
+async def _chunk_done(
+    chunk: Chunk, duration_ms: int, context: _SynthesisContext, synthesized: bool
+) -> None:
+    """Record a chunk whose audio is in place and link it to chunks with the same text.
+
+    Freshly synthesized audio is also added to the cache.
+    """
+    audio_path = context.audio_dir / f"{chunk.chunk_id}.mp3"
+    relative_path = f"audio/chunks/{chunk.chunk_id}.mp3"
+    if synthesized and context.cache is not None:
+        await _in_io(context, context.cache.store, _cache_key(chunk, context), audio_path)
+    await _in_io(context, _record_done, context, chunk.chunk_id, relative_path, duration_ms)
+    duplicates = context.duplicates.duplicates_of(chunk)
+    if duplicates:
+        await _in_io(context, _fan_out, context, audio_path, duration_ms, duplicates)
+        context.duplicates.record_reuse(duplicates, synthesized)
+
+
+def _cache_key(chunk: Chunk, context: _SynthesisContext) -> str:
+    provider = context.provider
+    return cache_key(
+        provider.name, provider.voice, provider.model, provider.voice_settings, chunk.text
+    )
+
+
+async def _in_io(context: _SynthesisContext, fn: Callable[..., _T], *args: object) -> _T:
+    """Run blocking ``fn(*args)`` on the I/O pool."""
+    return await asyncio.get_running_loop().run_in_executor(context.io_pool, fn, *args)
 
-    # Sort by chunk_index
-    entries.sort(key=lambda e: e.chunk_index)
-    return entries
 
+class _StreamedAudioFile:
+    """Temp file that streamed audio is written to, then renamed into place.
+
+    Frames are counted as pieces arrive, so the duration is known without
+    reading the file back. Methods block; the runner calls them on the I/O pool.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._tmp_path = unique_temp_path(path)
+        self._file: BinaryIO | None = None
+        self._frames = MP3DurationCounter()
+        self.size = 0
+
+    def write(self, piece: bytes) -> None:
+        try:
+            if self._file is None:
+                self._file = open(self._tmp_path, "wb")
+            self._file.write(piece)
+        except OSError as e:
+            raise AudioWriteError(f"Failed to write {self._path}: {e}") from e
+        self._frames.feed(piece)
+        self.size += len(piece)
+
+    def commit(self) -> int:
+        """Move the finished file into place; returns its duration in ms."""
+        if self._file is None:
+            raise TTSProviderError("Provider returned no audio")
+        try:
+            self._file.close()
+            os.replace(self._tmp_path, self._path)
+        except OSError as e:
+            raise AudioWriteError(f"Failed to write {self._path}: {e}") from e
+        return _get_duration_ms(self._frames.finish(), self._path)
+
+    def discard(self) -> None:
+        """Remove the temp file unless it was committed."""
+        if self._file is not None:
+            self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+async def _fetch_audio(
+    chunk: Chunk, attempt: int, audio_path: Path, context: _SynthesisContext
+) -> _StreamedAudioFile:
+    """Request a chunk's audio, hedged with a second request if it turns out slow.
+
+    The hedge timer starts once the request is sent, not while it waits for
+    a slot. The first request to succeed wins; the other is cancelled and its
+    temp file removed. If both fail, the original request's error is raised.
+    """
+    if context.hedging.delay_s() is None:
+        return await _request(chunk, attempt, audio_path, context)
+
+    sent = asyncio.Event()
+    primary = asyncio.create_task(_request(chunk, attempt, audio_path, context, sent))
+    sending = asyncio.create_task(sent.wait())
+    hedge: asyncio.Task[_StreamedAudioFile] | None = None
+    winner: _StreamedAudioFile | None = None
+    try:
+        await asyncio.wait([primary, sending], return_when=asyncio.FIRST_COMPLETED)
+        delay = context.hedging.delay_s()
+        if not primary.done() and delay is not None:
+            await asyncio.wait([primary], timeout=delay)
+            if not primary.done() and context.hedging.try_spend(len(chunk.text)):
+                logger.debug("Chunk %s: hedging after %.1fs", chunk.chunk_id, delay)
+                hedge = asyncio.create_task(_hedge(chunk, attempt, audio_path, context))
+        if hedge is None:
+            winner = await primary
+        else:
+            winner = await _first_success(primary, hedge, context)
+        return winner
+    finally:
+        tasks = [t for t in (primary, sending, hedge) if t is not None]
+        for task in tasks:
+            task.cancel()
+        # A loser may have finished before it could be cancelled
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, _StreamedAudioFile) and result is not winner:
+                await _in_io(context, result.discard)
+
+
+async def _hedge(
+    chunk: Chunk, attempt: int, audio_path: Path, context: _SynthesisContext
+) -> _StreamedAudioFile:
+    """Second request for a slow chunk; refunds its budget if never sent."""
+    sent = asyncio.Event()
+    try:
+        await context.pacer.acquire(len(chunk.text))
+        return await _request(chunk, attempt, audio_path, context, sent, hedge=True)
+    finally:
+        if not sent.is_set():
+            context.hedging.refund(len(chunk.text))
+
+
+async def _first_success(
+    primary: asyncio.Task[_StreamedAudioFile],
+    hedge: asyncio.Task[_StreamedAudioFile],
+    context: _SynthesisContext,
+) -> _StreamedAudioFile:
+    """Result of whichever request succeeds first (the original on a tie)."""
+    pending: set[asyncio.Task[_StreamedAudioFile]] = {primary, hedge}
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in (primary, hedge):
+            if task in done and task.exception() is None:
+                if task is hedge:
+                    context.hedging.wins += 1
+                return task.result()
+    return primary.result()
+
+
+async def _request(
+    chunk: Chunk,
+    attempt: int,
+    audio_path: Path,
+    context: _SynthesisContext,
+    sent: asyncio.Event | None = None,
+    hedge: bool = False,
+) -> _StreamedAudioFile:
+    """Send one API request in a limiter slot, streaming its audio to a temp file.
+
+    The file is left uncommitted for the caller to rename into place (or
+    discard, for the losing request of a hedged chunk). ``sent`` is set once
+    the request holds its slot.
+    """
+    text = chunk.text
+    audio_file = _StreamedAudioFile(audio_path)
+    sample: RequestSample | None = None
+    try:
+        async with context.limiter.slot(len(text)):
+            sample = context.telemetry.begin(chunk.chunk_id, attempt, len(text), hedge)
+            if sent is not None:
+                sent.set()
+            async with aclosing(context.provider.synthesize_stream(text)) as stream:
+                async for piece in stream:
+                    context.telemetry.first_byte(sample)
+                    await _in_io(context, audio_file.write, piece)
+            if audio_file.size == 0:
+                raise TTSProviderError("Provider returned no audio")
+            context.telemetry.succeeded(sample, audio_file.size)
+            context.hedging.observe(sample.latency_ms / 1000)
+    except BaseException as e:
+        if sample is not None:
+            context.telemetry.failed(sample, e)
+        await _in_io(context, audio_file.discard)
+        raise
+    return audio_file
+
+
+async def _request_batch(
+    label: str, text: str, attempt: int, context: _SynthesisContext
+) -> tuple[bytes, AlignedAudio | None]:
+    """Send a packed request in a limiter slot, with timestamps if the provider has them."""
+    provider = context.provider
+    sample: RequestSample | None = None
+    try:
+        async with context.limiter.slot(len(text)):
+            sample = context.telemetry.begin(label, attempt, len(text))
+            alignment = None
+            if provider.supports_alignment:
+                alignment = await provider.synthesize_aligned(text)
+                data = alignment.audio
+            else:
+                data = await provider.synthesize(text)
+            if not data:
+                raise TTSProviderError("Provider returned no audio")
+            context.telemetry.succeeded(sample, len(data))
+    except BaseException as e:
+        if sample is not None:
+            context.telemetry.failed(sample, e)
+        raise
+    return data, alignment
+
+
+def _write_audio(audio_path: Path, data: bytes) -> int:
+    """Write ``data`` to ``audio_path`` through a temp file; returns its duration in ms."""
+    audio_file = _StreamedAudioFile(audio_path)
+    try:
+        audio_file.write(data)
+        return audio_file.commit()
+    finally:
+        audio_file.discard()
+
+
+def _record_done(
+    context: _SynthesisContext, chunk_id: str, relative_path: str, duration_ms: int
+) -> None:
+    """Record a finished chunk and let the playback map publisher know."""
+    context.progress.record_success(chunk_id, relative_path, duration_ms)
+    context.publisher.chunk_done(chunk_id, relative_path, duration_ms)
+
+
+def _fan_out(
+    context: _SynthesisContext, audio_path: Path, duration_ms: int, duplicates: list[Chunk]
+) -> None:
+    """Link a chunk's audio to chunks with the same text and record them as done."""
+    for duplicate in duplicates:
+        relative_path = f"audio/chunks/{duplicate.chunk_id}.mp3"
+        try:
+            link_or_copy(audio_path, audio_path.with_name(f"{duplicate.chunk_id}.mp3"))
+        except OSError as e:
+            raise AudioWriteError(f"Failed to write {relative_path}: {e}") from e
+        _record_done(context, duplicate.chunk_id, relative_path, duration_ms)
+
+
+def _place_cached(cache: AudioCache, key: str, audio_path: Path) -> int | None:
+    """Link cached audio into the pack; returns its duration, or None on a miss."""
+    try:
+        if not cache.fetch(key, audio_path):
+            return None
+        audio_bytes = audio_path.read_bytes()
+    except OSError as e:
+        raise AudioWriteError(f"Failed to write {audio_path}: {e}") from e
+    return _get_duration_ms(mp3_duration_ms(audio_bytes), audio_path)
+
+
+def _get_duration_ms(parsed_ms: int | None, audio_path: Path) -> int:
+    """Duration from the in-memory MP3 parser, falling back to mutagen."""
+    if parsed_ms is not None:
+        return parsed_ms
+    try:
+        audio = MP3(audio_path)
+        return int(audio.info.length * 1000)
+    except Exception as e:
+        logger.warning("Could not read duration for %s: %s", audio_path.name, e)
+        return -1
 
-def _write_playback_map(book_dir: Path, entries: list[PlaybackMapEntry]) -> None:
-    """Write playback_map.jsonl."""
-    map_path = book_dir / "playback_map.jsonl"
-    with open(map_path, "w") as f:
-        for entry in entries:
-            f.write(entry.model_dump_json() + "\n")
-    logger.info("Wrote %d playback map entries", len(entries))
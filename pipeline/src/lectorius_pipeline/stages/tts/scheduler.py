@@ -0,0 +1,138 @@
+"""Priority work queue for TTS chunks, drained by a fixed pool of workers.
+
+Only ``depth`` chunks are queued at a time; the rest wait in a sorted list
+and are fed in as workers take jobs, so a 20k-chunk book costs a few dozen
+queue entries and one coroutine per worker rather than one per chunk.
+Lower priorities run first: a retry (after its backoff) goes ahead of fresh
+chunks, and the first few chunks of every chapter go ahead of the rest, so
+every chapter can start playing early (see ``chapter_head_priority``).
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from lectorius_pipeline.schemas import Chunk
+
+PRIORITY_RETRY = 0
+# Chunk n (0-based) of a chapter's head runs at PRIORITY_CHAPTER_HEAD + n;
+# chunks past the head come after all heads
+PRIORITY_CHAPTER_HEAD = 1
+
+# Queued jobs per worker; enough that a worker never waits on the feeder
+QUEUE_DEPTH_PER_WORKER = 2
+
+# (chunk, attempt) -> seconds to wait before the next attempt, or None when done
+ChunkHandler = Callable[[Chunk, int], Awaitable[float | None]]
+
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    order: int
+    chunk: Chunk = field(compare=False)
+    attempt: int = field(default=1, compare=False)
+
+
+def chapter_head_priority(chunks: list[Chunk], head_chunks: int) -> Callable[[Chunk], int]:
+    """Priority function for the first ``head_chunks`` chunks of each chapter.
+
+    Heads go round-robin across chapters (every chapter's first chunk, then
+    every chapter's second, ...) and the remaining chunks follow in book
+    order. With ``head_chunks=0`` all chunks run in book order.
+    """
+    by_chapter: dict[str, list[Chunk]] = {}
+    for chunk in chunks:
+        by_chapter.setdefault(chunk.chapter_id, []).append(chunk)
+    positions: dict[str, int] = {}
+    for chapter in by_chapter.values():
+        chapter.sort(key=lambda c: c.chunk_index)
+        for position, chunk in enumerate(chapter[:head_chunks]):
+            positions[chunk.chunk_id] = position
+    rest = PRIORITY_CHAPTER_HEAD + head_chunks
+
+    def priority(chunk: Chunk) -> int:
+        position = positions.get(chunk.chunk_id)
+        return rest if position is None else PRIORITY_CHAPTER_HEAD + position
+
+    return priority
+
+
+class ChunkQueue:
+    """Run a handler over chunks with ``workers`` concurrent workers.
+
+    The handler makes one attempt at a chunk. If it returns a delay, the
+    chunk is queued again at PRIORITY_RETRY once the delay has passed;
+    exceptions stop the whole run. Cancelling ``run`` cancels the workers
+    and pending retries before returning.
+    """
+
+    def __init__(
+        self,
+        chunks: list[Chunk],
+        priority: Callable[[Chunk], int],
+        depth: int,
+    ) -> None:
+        ordered = sorted(chunks, key=lambda c: (priority(c), c.chunk_index))
+        self._feed = iter(ordered)
+        self._priority = priority
+        self._queue: asyncio.PriorityQueue[_Job] = asyncio.PriorityQueue()
+        self._depth = depth
+        self._remaining = len(ordered)
+        self._done = asyncio.Event()
+        self._retries: set[asyncio.TimerHandle] = set()
+
+    async def run(self, handle: ChunkHandler, workers: int) -> None:
+        """Process every chunk to completion (or final failure)."""
+        if self._remaining == 0:
+            return
+        self._refill()
+        tasks = [
+            asyncio.create_task(self._worker(handle), name=f"tts-worker-{i}")
+            for i in range(workers)
+        ]
+        finished = asyncio.create_task(self._done.wait())
+        try:
+            done, _ = await asyncio.wait([finished, *tasks], return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = None if task is finished else task.exception()
+                if error is not None:
+                    raise error
+        finally:
+            for timer in self._retries:
+                timer.cancel()
+            self._retries.clear()
+            for task in (finished, *tasks):
+                task.cancel()
+            # Let in-flight attempts unwind (temp files, limiter slots)
+            await asyncio.gather(finished, *tasks, return_exceptions=True)
+
+    def _refill(self) -> None:
+        """Top the queue up to ``depth`` jobs from the sorted feed."""
+        while self._queue.qsize() < self._depth:
+            chunk = next(self._feed, None)
+            if chunk is None:
+                return
+            self._queue.put_nowait(_Job(self._priority(chunk), chunk.chunk_index, chunk))
+
+    async def _worker(self, handle: ChunkHandler) -> None:
+        while True:
+            job = await self._queue.get()
+            self._refill()
+            delay = await handle(job.chunk, job.attempt)
+            if delay is None:
+                self._remaining -= 1
+                if self._remaining == 0:
+                    self._done.set()
+            else:
+                self._retry_later(job, delay)
+
+    def _retry_later(self, job: _Job, delay: float) -> None:
+        retry = _Job(PRIORITY_RETRY, job.order, job.chunk, job.attempt + 1)
+
+        def enqueue() -> None:
+            self._retries.discard(timer)
+            self._queue.put_nowait(retry)
+
+        timer = asyncio.get_running_loop().call_later(delay, enqueue)
+        self._retries.add(timer)
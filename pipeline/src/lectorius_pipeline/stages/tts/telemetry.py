@@ -0,0 +1,194 @@
+"""Per-request telemetry for TTS runs.
+
+Every API attempt (cache hits are not requests) becomes a ``RequestSample``:
+when it was sent, when its first audio byte and its end arrived, how many
+characters went out and bytes came back, which attempt it was and, if it
+failed, what kind of error it was. Times are milliseconds since the start of
+synthesis, measured from the moment the request holds a concurrency slot,
+so quota waits and backoff are not counted as latency.
+
+``RequestTelemetry.stats`` aggregates the samples for reports/tts.json
+(latency percentiles, throughput per THROUGHPUT_BUCKET_S, attempts per chunk,
+errors by type). ``write_samples`` writes the raw samples as CSV, one row per
+request, to size concurrency or compare providers offline.
+"""
+
+import asyncio
+import csv
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from lectorius_pipeline.schemas import LatencyPercentiles, ThroughputPoint, TTSRequestStats
+
+from .concurrency import status_code
+
+SAMPLES_FILENAME = "tts_requests.csv"
+
+# Width of the throughput buckets in the report
+THROUGHPUT_BUCKET_S = 60
+
+_COLUMNS = (
+    "chunk_id",
+    "attempt",
+    "chars",
+    "bytes",
+    "start_ms",
+    "first_byte_ms",
+    "end_ms",
+    "error",
+    "hedge",
+)
+
+# Error label of a request cancelled because its hedge finished first (or
+# the run was stopped); not a failure
+CANCELLED = "cancelled"
+
+
+@dataclass
+class RequestSample:
+    """One API attempt at a chunk."""
+
+    chunk_id: str
+    attempt: int
+    chars: int
+    start_ms: int
+    first_byte_ms: int | None = None
+    end_ms: int | None = None
+    bytes: int = 0
+    error: str | None = None
+    hedge: bool = False  # duplicate of a slow request (see hedging.py)
+
+    @property
+    def latency_ms(self) -> int:
+        return (self.end_ms or self.start_ms) - self.start_ms
+
+
+def error_type(exc: BaseException) -> str:
+    """Short label for a request failure: ``http_<status>`` or the exception class."""
+    if isinstance(exc, asyncio.CancelledError):
+        return CANCELLED
+    status = status_code(exc)
+    return f"http_{status}" if status is not None else type(exc).__name__
+
+
+class RequestTelemetry:
+    """Collects a sample per request. Used from the event loop thread only."""
+
+    def __init__(self) -> None:
+        self._started = time.monotonic()
+        self.samples: list[RequestSample] = []
+
+    def _now_ms(self) -> int:
+        return int((time.monotonic() - self._started) * 1000)
+
+    def begin(
+        self, chunk_id: str, attempt: int, chars: int, hedge: bool = False
+    ) -> RequestSample:
+        """Start timing a request that is about to be sent."""
+        sample = RequestSample(chunk_id, attempt, chars, self._now_ms(), hedge=hedge)
+        self.samples.append(sample)
+        return sample
+
+    def first_byte(self, sample: RequestSample) -> None:
+        if sample.first_byte_ms is None:
+            sample.first_byte_ms = self._now_ms()
+
+    def succeeded(self, sample: RequestSample, size: int) -> None:
+        sample.end_ms = self._now_ms()
+        sample.bytes = size
+
+    def failed(self, sample: RequestSample, exc: BaseException) -> None:
+        if sample.end_ms is None:
+            sample.end_ms = self._now_ms()
+        sample.error = error_type(exc)
+
+    def stats(self, samples_path: str | None = None) -> TTSRequestStats:
+        """Aggregate the finished samples."""
+        finished = [s for s in self.samples if s.end_ms is not None]
+        ok = [s for s in finished if s.error is None]
+        errors_by_type: dict[str, int] = {}
+        cancelled = 0
+        for s in finished:
+            if s.error == CANCELLED:
+                cancelled += 1
+            elif s.error is not None:
+                errors_by_type[s.error] = errors_by_type.get(s.error, 0) + 1
+        attempts: dict[int, int] = {}
+        for s in ok:
+            attempts[s.attempt] = attempts.get(s.attempt, 0) + 1
+
+        busy_ms = 0
+        if finished:
+            busy_ms = max(s.end_ms or 0 for s in finished) - min(s.start_ms for s in finished)
+        chars = sum(s.chars for s in ok)
+        return TTSRequestStats(
+            requests=len(finished),
+            failed_requests=len(finished) - len(ok) - cancelled,
+            cancelled_requests=cancelled,
+            latency=_percentiles([s.latency_ms for s in ok]),
+            first_byte=_percentiles(
+                [s.first_byte_ms - s.start_ms for s in ok if s.first_byte_ms is not None]
+            ),
+            chars_per_s=round(chars * 1000 / busy_ms, 1) if busy_ms else 0.0,
+            audio_bytes=sum(s.bytes for s in ok),
+            throughput=_throughput(finished),
+            attempts_histogram=dict(sorted(attempts.items())),
+            errors_by_type=dict(sorted(errors_by_type.items(), key=lambda kv: -kv[1])),
+            samples_path=samples_path,
+        )
+
+    def write_samples(self, path: Path) -> None:
+        """Write finished samples as CSV (empty cells for missing values)."""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(_COLUMNS)
+            for s in self.samples:
+                if s.end_ms is None:
+                    continue
+                writer.writerow(
+                    (
+                        s.chunk_id,
+                        s.attempt,
+                        s.chars,
+                        s.bytes,
+                        s.start_ms,
+                        "" if s.first_byte_ms is None else s.first_byte_ms,
+                        s.end_ms,
+                        s.error or "",
+                        int(s.hedge),
+                    )
+                )
+
+
+def _percentiles(values: list[int]) -> LatencyPercentiles:
+    if not values:
+        return LatencyPercentiles()
+    ordered = sorted(values)
+
+    def rank(q: float) -> float:
+        # Nearest rank
+        return float(ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)])
+
+    return LatencyPercentiles(
+        p50_ms=rank(0.50), p95_ms=rank(0.95), p99_ms=rank(0.99), max_ms=float(ordered[-1])
+    )
+
+
+def _throughput(samples: list[RequestSample]) -> list[ThroughputPoint]:
+    buckets: dict[int, ThroughputPoint] = {}
+    for s in samples:
+        bucket = (s.end_ms or 0) // (THROUGHPUT_BUCKET_S * 1000)
+        point = buckets.get(bucket)
+        if point is None:
+            point = buckets[bucket] = ThroughputPoint(
+                elapsed_s=bucket * THROUGHPUT_BUCKET_S, requests=0, errors=0, chars=0, bytes=0
+            )
+        point.requests += 1
+        if s.error is None:
+            point.chars += s.chars
+            point.bytes += s.bytes
+        elif s.error != CANCELLED:
+            point.errors += 1
+    return [buckets[b] for b in sorted(buckets)]
@@ -3,10 +3,25 @@
 import logging
 import re
 from collections import Counter
+from collections.abc import Sequence
 
-from lectorius_pipeline.config import ChunkConfig
+import numpy as np
+
+from lectorius_pipeline.config import ChunkConfig, ValidateConfig
 from lectorius_pipeline.schemas import Chunk, ValidationIssue
 
+from .engine import (
+    FEATURE_BATCH_CHUNKS,
+    ChunkColumns,
+    TextLoader,
+    duplicate_id_issues,
+    duplicate_text_issues,
+    index_sequence_issues,
+    offset_sequence_issues,
+    per_chunk_issues,
+)
+from .near_duplicates import MinHashLSH, near_duplicate_issues
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,7 +104,6 @@ def check_duplicate_ids(chunks: list[Chunk]) -> list[ValidationIssue]:
 
 def check_duplicate_text(chunks: list[Chunk]) -> list[ValidationIssue]:
     """Check for duplicate text content."""
-    issues: list[ValidationIssue] = []
     text_to_ids: dict[str, list[str]] = {}
 
     for chunk in chunks:
@@ -98,6 +112,13 @@ def check_duplicate_text(chunks: list[Chunk]) -> list[ValidationIssue]:
             text_to_ids[text] = []
         text_to_ids[text].append(chunk.chunk_id)
 
+    return _duplicate_text_issues(text_to_ids)
+
+
+def _duplicate_text_issues(text_to_ids: dict[str, list[str]]) -> list[ValidationIssue]:
+    """Build duplicate_text warnings from a text -> chunk_ids grouping."""
+    issues: list[ValidationIssue] = []
+
     for text, ids in text_to_ids.items():
         if len(ids) > 1:
             issues.append(
@@ -188,32 +209,101 @@ def check_offset_sequence(chunks: list[Chunk]) -> list[ValidationIssue]:
     return issues
 
 
-def validate_chunks(chunks: list[Chunk], config: ChunkConfig) -> list[ValidationIssue]:
-    """Run all validation checks on chunks."""
-    issues: list[ValidationIssue] = []
-
-    # Per-chunk checks
-    for chunk in chunks:
-        issue = check_empty_text(chunk)
-        if issue:
-            issues.append(issue)
-
-        issue = check_too_short(chunk, config.min_chars)
-        if issue:
-            issues.append(issue)
-
-        issue = check_too_long(chunk, config.max_chars)
-        if issue:
-            issues.append(issue)
+class ChunkValidator:
+    """Single-pass validator for chunks streamed from chunks.jsonl.
+
+    Chunks are buffered in batches and reduced to ``ChunkColumns``, so only
+    fixed-size numeric columns and a 16-byte text digest per chunk are
+    retained, never the Chunk models or their text. Texts are read back
+    only for chunks whose digest repeats, to confirm duplicates.
+    """
+
+    def __init__(self, config: ChunkConfig, validation: ValidateConfig | None = None) -> None:
+        self._config = config
+        self._validation = validation
+        self._lsh = MinHashLSH(validation) if validation and validation.near_duplicates else None
+        self._batch: list[Chunk] = []
+        self._parts: list[ChunkColumns] = []
+        self._band_keys: list[np.ndarray] = []
+        self._shingle_counts: list[np.ndarray] = []
+        self._count = 0
+
+    @property
+    def chunk_count(self) -> int:
+        return self._count
+
+    def add(self, chunk: Chunk) -> None:
+        """Buffer a chunk, reducing the buffer to columns when it is full."""
+        self._batch.append(chunk)
+        self._count += 1
+        if len(self._batch) >= FEATURE_BATCH_CHUNKS:
+            self._flush()
+
+    def finish(self, load_texts: TextLoader) -> list[ValidationIssue]:
+        """
+        Run all checks and return issues in validate_chunks order.
+
+        Args:
+            load_texts: Returns the stripped text of the given 0-based rows
+                (chunk positions in the stream), used to verify duplicates.
+        """
+        self._flush()
+        columns = ChunkColumns.concatenate(self._parts)
+        issues = _validate_columns(columns, load_texts, self._config)
+        if self._lsh and self._validation:
+            issues.extend(near_duplicate_issues(
+                columns,
+                np.concatenate(self._band_keys),
+                np.concatenate(self._shingle_counts),
+                load_texts,
+                self._validation,
+            ))
+        return issues
 
-        issue = check_non_prose(chunk)
-        if issue:
-            issues.append(issue)
+    def _flush(self) -> None:
+        if self._batch:
+            self._parts.append(ChunkColumns.from_chunks(self._batch))
+            if self._lsh:
+                keys, counts = self._lsh.band_keys([c.text for c in self._batch])
+                self._band_keys.append(keys)
+                self._shingle_counts.append(counts)
+            self._batch = []
+
+
+def validate_chunks(
+    chunks: list[Chunk],
+    config: ChunkConfig,
+    validation: ValidateConfig | None = None,
+) -> list[ValidationIssue]:
+    """
+    Run all validation checks on chunks.
+
+    Uses the vectorized engine; results are identical to running the
+    ``check_*`` functions above chunk by chunk. With
+    ``validation.near_duplicates`` MinHash/LSH near-duplicate clusters are
+    appended after the other checks.
+    """
+    columns = ChunkColumns.from_chunks(chunks)
+
+    def load_texts(rows: Sequence[int]) -> dict[int, str]:
+        return {r: chunks[r].text.strip() for r in rows}
+
+    issues = _validate_columns(columns, load_texts, config)
+    if validation and validation.near_duplicates:
+        keys, counts = MinHashLSH(validation).band_keys([c.text for c in chunks])
+        issues.extend(near_duplicate_issues(columns, keys, counts, load_texts, validation))
+    return issues
 
-    # Cross-chunk checks
-    issues.extend(check_duplicate_ids(chunks))
-    issues.extend(check_duplicate_text(chunks))
-    issues.extend(check_index_sequence(chunks))
-    issues.extend(check_offset_sequence(chunks))
 
+def _validate_columns(
+    columns: ChunkColumns,
+    load_texts: TextLoader,
+    config: ChunkConfig,
+) -> list[ValidationIssue]:
+    """Per-chunk checks, then cross-chunk checks, in the historical order."""
+    issues = per_chunk_issues(columns, config)
+    issues.extend(duplicate_id_issues(columns))
+    issues.extend(duplicate_text_issues(columns, load_texts))
+    issues.extend(index_sequence_issues(columns))
+    issues.extend(offset_sequence_issues(columns))
     return issues
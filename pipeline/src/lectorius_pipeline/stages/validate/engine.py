@@ -0,0 +1,299 @@
+"""Vectorized chunk validation.
+
+The fields every check looks at (id, index, offsets, length, two text
+flags and a text digest) are extracted into NumPy columns in one pass.
+Each check is then a boolean mask over those columns, and
+``ValidationIssue`` objects are built only for the rows that fail.
+Messages and ordering match the scalar ``check_*`` functions in
+``checks.py``.
+"""
+
+import hashlib
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+
+from lectorius_pipeline.config import ChunkConfig
+from lectorius_pipeline.schemas import Chunk, ValidationIssue
+
+logger = logging.getLogger(__name__)
+
+# Code points str.strip() removes (all of them are below U+3001)
+_WHITESPACE = np.array([c for c in range(0x3001) if chr(c).isspace()], dtype=np.uint32)
+
+# Texts decoded to code points per batch, bounding the UTF-32 scratch buffer
+FEATURE_BATCH_CHUNKS = 4096
+
+# Offset gap that gets a warning (chars)
+MAX_OFFSET_GAP = 100
+
+# 128-bit digests: collisions are verified, but should never actually happen
+TEXT_DIGEST_BYTES = 16
+
+# Given row numbers, return each row's stripped chunk text
+TextLoader = Callable[[Sequence[int]], dict[int, str]]
+
+
+@dataclass
+class ChunkColumns:
+    """Column view of a chunk list, one array entry per chunk in file order."""
+
+    chunk_ids: np.ndarray  # str
+    chunk_index: np.ndarray  # int64
+    char_start: np.ndarray  # int64
+    char_end: np.ndarray  # int64
+    length: np.ndarray  # int64, len(text)
+    blank: np.ndarray  # bool, text.strip() is empty
+    has_letter: np.ndarray  # bool, text contains an ASCII letter
+    text_digest: np.ndarray  # uint64 (n, 2), blake2b of text.strip()
+
+    def __len__(self) -> int:
+        return len(self.chunk_index)
+
+    @classmethod
+    def from_chunks(cls, chunks: Sequence[Chunk]) -> "ChunkColumns":
+        n = len(chunks)
+        length, blank, has_letter = text_features([c.text for c in chunks])
+        return cls(
+            chunk_ids=np.array([c.chunk_id for c in chunks], dtype=str),
+            chunk_index=np.fromiter((c.chunk_index for c in chunks), np.int64, n),
+            char_start=np.fromiter((c.char_start for c in chunks), np.int64, n),
+            char_end=np.fromiter((c.char_end for c in chunks), np.int64, n),
+            length=length,
+            blank=blank,
+            has_letter=has_letter,
+            text_digest=text_digests([c.text for c in chunks]),
+        )
+
+    @classmethod
+    def concatenate(cls, parts: Sequence["ChunkColumns"]) -> "ChunkColumns":
+        if not parts:
+            return cls.from_chunks([])
+        return cls(
+            chunk_ids=np.concatenate([p.chunk_ids for p in parts]),
+            chunk_index=np.concatenate([p.chunk_index for p in parts]),
+            char_start=np.concatenate([p.char_start for p in parts]),
+            char_end=np.concatenate([p.char_end for p in parts]),
+            length=np.concatenate([p.length for p in parts]),
+            blank=np.concatenate([p.blank for p in parts]),
+            has_letter=np.concatenate([p.has_letter for p in parts]),
+            text_digest=np.concatenate([p.text_digest for p in parts]),
+        )
+
+
+def text_features(texts: Sequence[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute (length, blank, has_letter) for each text.
+
+    Texts are concatenated and decoded to fixed-width UTF-32 code points, so
+    the per-character tests are array comparisons and the per-text answers
+    come from ``logical_or.reduceat`` over each text's span.
+    """
+    n = len(texts)
+    length = np.fromiter(map(len, texts), np.int64, n)
+    blank = np.ones(n, dtype=bool)
+    has_letter = np.zeros(n, dtype=bool)
+
+    for lo in range(0, n, FEATURE_BATCH_CHUNKS):
+        hi = min(lo + FEATURE_BATCH_CHUNKS, n)
+        codes = np.frombuffer("".join(texts[lo:hi]).encode("utf-32-le"), dtype=np.uint32)
+        if not codes.size:
+            continue
+
+        lengths = length[lo:hi]
+        starts = np.zeros(hi - lo, dtype=np.int64)
+        np.cumsum(lengths[:-1], out=starts[1:])
+        # Empty texts own no code points; reduceat needs strictly useful starts
+        nonempty = lengths > 0
+
+        folded = codes | 0x20  # ASCII upper -> lower
+        letter = (folded >= ord("a")) & (folded <= ord("z"))
+        nonspace = ~np.isin(codes, _WHITESPACE)
+
+        blank[lo:hi][nonempty] = ~np.logical_or.reduceat(nonspace, starts[nonempty])
+        has_letter[lo:hi][nonempty] = np.logical_or.reduceat(letter, starts[nonempty])
+
+    return length, blank, has_letter
+
+
+def text_digests(texts: Sequence[str]) -> np.ndarray:
+    """Fixed-size digest of each stripped text, as an (n, 2) uint64 array."""
+    raw = b"".join(
+        hashlib.blake2b(text.strip().encode("utf-8"), digest_size=TEXT_DIGEST_BYTES).digest()
+        for text in texts
+    )
+    return np.frombuffer(raw, dtype=np.uint64).reshape(len(texts), 2)
+
+
+def per_chunk_issues(columns: ChunkColumns, config: ChunkConfig) -> list[ValidationIssue]:
+    """empty_text, too_short, too_long and non_prose, in chunk order then check order."""
+    masks = np.column_stack([
+        columns.blank,
+        columns.length < config.min_chars,
+        columns.length > config.max_chars,
+        ~columns.blank & ~columns.has_letter,
+    ])
+    # nonzero() walks row-major, i.e. chunk by chunk, each in check order
+    rows, checks = np.nonzero(masks)
+
+    issues: list[ValidationIssue] = []
+    severity: Literal["ERROR", "WARN"]
+    for row, check in zip(rows.tolist(), checks.tolist()):
+        chunk_id = str(columns.chunk_ids[row])
+        chunk_index = int(columns.chunk_index[row])
+        length = int(columns.length[row])
+        if check == 0:
+            severity, name, message = "ERROR", "empty_text", "Chunk has empty text"
+        elif check == 1:
+            severity, name = "WARN", "too_short"
+            message = f"Chunk is too short ({length} < {config.min_chars} chars)"
+        elif check == 2:
+            severity, name = "ERROR", "too_long"
+            message = f"Chunk exceeds max length ({length} > {config.max_chars} chars)"
+        else:
+            severity, name = "WARN", "non_prose"
+            message = "Chunk contains only digits/punctuation/whitespace"
+        issues.append(ValidationIssue(
+            severity=severity,
+            check=name,
+            message=message,
+            chunk_id=chunk_id,
+            chunk_index=chunk_index,
+        ))
+    return issues
+
+
+def duplicate_id_issues(columns: ChunkColumns) -> list[ValidationIssue]:
+    """duplicate_chunk_id errors, ordered by first occurrence."""
+    if not len(columns):
+        return []
+    unique, first, counts = np.unique(columns.chunk_ids, return_index=True, return_counts=True)
+    repeated = np.nonzero(counts > 1)[0]
+    repeated = repeated[np.argsort(first[repeated])]
+    return [
+        ValidationIssue(
+            severity="ERROR",
+            check="duplicate_chunk_id",
+            message=f"chunk_id '{unique[i]}' appears {counts[i]} times",
+            chunk_id=str(unique[i]),
+        )
+        for i in repeated.tolist()
+    ]
+
+
+def duplicate_text_issues(columns: ChunkColumns, load_texts: TextLoader) -> list[ValidationIssue]:
+    """
+    duplicate_text warnings, grouped by digest and confirmed on the real text.
+
+    Rows are sorted by digest; only rows whose digest repeats are looked up
+    with ``load_texts`` and regrouped by exact text, so a digest collision
+    can never merge two different texts. Groups are ordered by their first
+    chunk, with members in file order.
+    """
+    n = len(columns)
+    if n < 2:
+        return []
+
+    digest = columns.text_digest
+    rows = np.arange(n)
+    order = np.lexsort((rows, digest[:, 1], digest[:, 0]))
+    sorted_digest = digest[order]
+    new_run = np.ones(n, dtype=bool)
+    new_run[1:] = (sorted_digest[1:] != sorted_digest[:-1]).any(axis=1)
+    run_id = np.cumsum(new_run) - 1
+    repeated = np.bincount(run_id)[run_id] > 1
+    if not repeated.any():
+        return []
+
+    candidate_rows = order[repeated]
+    candidate_runs = run_id[repeated]
+    texts = load_texts(np.sort(candidate_rows).tolist())
+
+    groups: list[list[int]] = []
+    by_text: dict[str, list[int]] = {}
+    current_run = -1
+    for row, run in zip(candidate_rows.tolist(), candidate_runs.tolist()):
+        if run != current_run:
+            groups.extend(g for g in by_text.values() if len(g) > 1)
+            if len(by_text) > 1:
+                logger.debug("Text digest collision between %d distinct texts", len(by_text))
+            by_text = {}
+            current_run = run
+        by_text.setdefault(texts[row], []).append(row)
+    groups.extend(g for g in by_text.values() if len(g) > 1)
+
+    groups.sort(key=lambda g: g[0])
+    return [
+        ValidationIssue(
+            severity="WARN",
+            check="duplicate_text",
+            message=f"Duplicate text in chunks: {', '.join(str(columns.chunk_ids[r]) for r in g)}",
+        )
+        for g in groups
+    ]
+
+
+def index_sequence_issues(columns: ChunkColumns) -> list[ValidationIssue]:
+    """chunk_index_gap errors for a bad first index and every non-consecutive step."""
+    if not len(columns):
+        return []
+
+    indices = np.sort(columns.chunk_index)
+    issues: list[ValidationIssue] = []
+    if indices[0] != 1:
+        issues.append(ValidationIssue(
+            severity="ERROR",
+            check="chunk_index_gap",
+            message=f"chunk_index should start at 1, found {indices[0]}",
+        ))
+
+    for i in (np.nonzero(np.diff(indices) != 1)[0] + 1).tolist():
+        issues.append(ValidationIssue(
+            severity="ERROR",
+            check="chunk_index_gap",
+            message=f"Gap in chunk_index: {indices[i - 1]} to {indices[i]}",
+        ))
+    return issues
+
+
+def offset_sequence_issues(columns: ChunkColumns) -> list[ValidationIssue]:
+    """offset_overlap errors and offset_gap warnings between neighbours by char_start."""
+    if len(columns) < 2:
+        return []
+
+    order = np.argsort(columns.char_start, kind="stable")
+    starts = columns.char_start[order]
+    ends = columns.char_end[order]
+    gaps = starts[1:] - ends[:-1]
+
+    masks = np.column_stack([ends[:-1] > starts[1:], gaps > MAX_OFFSET_GAP])
+    pairs, checks = np.nonzero(masks)
+
+    issues: list[ValidationIssue] = []
+    for pair, check in zip(pairs.tolist(), checks.tolist()):
+        prev, curr = order[pair], order[pair + 1]
+        prev_id = str(columns.chunk_ids[prev])
+        curr_id = str(columns.chunk_ids[curr])
+        if check == 0:
+            issues.append(ValidationIssue(
+                severity="ERROR",
+                check="offset_overlap",
+                message=(
+                    f"Offset overlap: {prev_id} ends at {columns.char_end[prev]}, "
+                    f"{curr_id} starts at {columns.char_start[curr]}"
+                ),
+                chunk_id=curr_id,
+                chunk_index=int(columns.chunk_index[curr]),
+            ))
+        else:
+            issues.append(ValidationIssue(
+                severity="WARN",
+                check="offset_gap",
+                message=f"Gap of {gaps[pair]} chars between {prev_id} and {curr_id}",
+                chunk_id=curr_id,
+                chunk_index=int(columns.chunk_index[curr]),
+            ))
+    return issues
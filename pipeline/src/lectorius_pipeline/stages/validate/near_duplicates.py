@@ -0,0 +1,257 @@
+"""Near-duplicate chunk detection with MinHash signatures and LSH banding.
+
+Exact duplicates are caught by digest; this finds chunks that are almost the
+same, e.g. running headers that leaked into prose, repeated epigraphs or
+illustration captions, which would otherwise be synthesized and embedded
+once per copy.
+
+Each chunk is reduced to the set of its word shingles. A MinHash signature
+of ``permutations`` minimums estimates Jaccard similarity between sets; the
+signature is cut into ``bands`` bands and each band hashed to one key, so
+two chunks become candidates only if some band matches exactly. Only the
+band keys are kept per chunk. Candidates are confirmed by exact Jaccard on
+the reloaded texts, and confirmed pairs are merged into clusters.
+"""
+
+import logging
+import re
+import zlib
+from collections.abc import Sequence
+
+import numpy as np
+
+from lectorius_pipeline.config import ValidateConfig
+from lectorius_pipeline.schemas import ValidationIssue
+
+from .engine import ChunkColumns, TextLoader
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+")
+
+# Buckets larger than this are linked to their first member only, instead of
+# pairwise, so a flood of similar chunks cannot make candidate generation
+# quadratic. Clusters still form through the shared first member.
+MAX_BUCKET_PAIRWISE = 32
+
+# Shingles hashed per MinHash batch, bounding the (shingles x permutations) matrix
+SHINGLE_BATCH = 1 << 15
+
+_SHINGLE_PRIME = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer: a fast, well-distributed 64-bit hash (wraps mod 2**64)."""
+    x = x ^ (x >> np.uint64(30))
+    x = x * _MIX_1
+    x = x ^ (x >> np.uint64(27))
+    x = x * _MIX_2
+    x = x ^ (x >> np.uint64(31))
+    return x
+
+
+def shingle_hashes(text: str, shingle_words: int) -> np.ndarray:
+    """64-bit hashes of the lowercased word n-grams of ``text``, in text order.
+
+    Repeated n-grams repeat in the output (MinHash minimums don't care; take
+    a set for Jaccard). Texts shorter than ``shingle_words`` words form a
+    single shingle.
+    """
+    words = _WORD_RE.findall(text.lower())
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+
+    word_hashes = np.fromiter(
+        (zlib.crc32(w.encode("utf-8")) for w in words), np.uint64, len(words)
+    )
+    k = min(shingle_words, len(words))
+    count = len(words) - k + 1
+    hashes = np.zeros(count, dtype=np.uint64)
+    for j in range(k):
+        hashes = hashes * _SHINGLE_PRIME + word_hashes[j : j + count]
+    return hashes
+
+
+class MinHashLSH:
+    """Compute LSH band keys from MinHash signatures of word shingles."""
+
+    def __init__(self, config: ValidateConfig) -> None:
+        if config.minhash_permutations % config.lsh_bands:
+            raise ValueError("minhash_permutations must be a multiple of lsh_bands")
+        self._shingle_words = config.shingle_words
+        self._bands = config.lsh_bands
+        self._rows = config.minhash_permutations // config.lsh_bands
+        # Permutation j maps a (pre-mixed) shingle hash x to a_j * x + b_j mod 2**64;
+        # odd multipliers make each map a bijection
+        rng = np.random.default_rng(0x5EED)
+        high = np.iinfo(np.uint64).max
+        self._mult = rng.integers(0, high, config.minhash_permutations, np.uint64, True)
+        self._mult |= np.uint64(1)
+        self._add = rng.integers(0, high, config.minhash_permutations, np.uint64, True)
+
+    @property
+    def bands(self) -> int:
+        return self._bands
+
+    def band_keys(self, texts: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Band keys and shingle counts for each text.
+
+        Returns:
+            Tuple of (keys as (n, bands) uint64, shingle count per text).
+            Rows with no shingles have meaningless keys and must be skipped.
+        """
+        n = len(texts)
+        keys = np.zeros((n, self._bands), dtype=np.uint64)
+        shingles = [shingle_hashes(t, self._shingle_words) for t in texts]
+        counts = np.fromiter(map(len, shingles), np.int64, n)
+
+        lo = 0
+        while lo < n:
+            # Take texts until the batch holds SHINGLE_BATCH shingles (at least one text)
+            hi, total = lo, 0
+            while hi < n and (hi == lo or total + counts[hi] <= SHINGLE_BATCH):
+                total += counts[hi]
+                hi += 1
+
+            present = np.nonzero(counts[lo:hi])[0]
+            if present.size:
+                flat = np.concatenate([shingles[lo + i] for i in present])
+                starts = np.zeros(present.size, dtype=np.int64)
+                np.cumsum(counts[lo:hi][present][:-1], out=starts[1:])
+                # (permutations, shingles) layout: reduceat runs along contiguous rows
+                hashed = self._mult[:, None] * _mix(flat)[None, :]
+                hashed += self._add[:, None]
+                signatures = np.minimum.reduceat(hashed, starts, axis=1).T
+                keys[lo + present] = self._fold_bands(signatures)
+            lo = hi
+
+        return keys, counts
+
+    def _fold_bands(self, signatures: np.ndarray) -> np.ndarray:
+        """Hash each band's ``rows`` signature values into one key."""
+        banded = signatures.reshape(len(signatures), self._bands, self._rows)
+        key = np.zeros(banded.shape[:2], dtype=np.uint64)
+        for r in range(self._rows):
+            key = _mix(key ^ banded[:, :, r])
+        return key
+
+
+def near_duplicate_issues(
+    columns: ChunkColumns,
+    band_keys: np.ndarray,
+    shingle_counts: np.ndarray,
+    load_texts: TextLoader,
+    config: ValidateConfig,
+) -> list[ValidationIssue]:
+    """
+    Report clusters of chunks whose shingle sets are at least
+    ``config.near_duplicate_threshold`` Jaccard-similar.
+
+    Chunks with identical text are collapsed to their first occurrence before
+    banding (they are reported by duplicate_text) and re-attached to the
+    cluster afterwards. A cluster made only of identical texts is skipped.
+    """
+    n = len(columns)
+    if n < 2:
+        return []
+
+    representative = _first_with_same_digest(columns.text_digest)
+    reps = np.nonzero((representative == np.arange(n)) & (shingle_counts > 0))[0]
+    if reps.size < 2:
+        return []
+
+    candidates = _candidate_pairs(band_keys[reps])
+    if not candidates.size:
+        return []
+    pairs = reps[candidates]
+
+    # Exact Jaccard on the candidates only
+    rows = np.unique(pairs).tolist()
+    texts = load_texts(rows)
+    sets = {r: set(shingle_hashes(texts[r], config.shingle_words).tolist()) for r in rows}
+
+    parent = {r: r for r in rows}
+
+    def find(r: int) -> int:
+        while parent[r] != r:
+            parent[r] = parent[parent[r]]
+            r = parent[r]
+        return r
+
+    confirmed = 0
+    for a, b in pairs.tolist():
+        sa, sb = sets[a], sets[b]
+        if len(sa & sb) >= config.near_duplicate_threshold * len(sa | sb):
+            confirmed += 1
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent[max(ra, rb)] = min(ra, rb)
+    logger.debug(
+        "Near-duplicate check: %d LSH candidate pairs, %d confirmed", len(pairs), confirmed
+    )
+
+    clusters: dict[int, list[int]] = {}
+    for r in rows:
+        clusters.setdefault(find(r), []).append(r)
+
+    issues: list[ValidationIssue] = []
+    for root in sorted(clusters):
+        members = clusters[root]
+        if len(members) < 2:
+            continue
+        # Re-attach exact copies of each member, in file order
+        all_rows = np.nonzero(np.isin(representative, members))[0]
+        ids = ", ".join(str(columns.chunk_ids[r]) for r in all_rows.tolist())
+        issues.append(ValidationIssue(
+            severity="WARN",
+            check="near_duplicate_text",
+            message=(
+                f"Near-duplicate text (Jaccard >= {config.near_duplicate_threshold:.2f}) "
+                f"in {len(all_rows)} chunks: {ids}"
+            ),
+            chunk_id=str(columns.chunk_ids[root]),
+            chunk_index=int(columns.chunk_index[root]),
+        ))
+    return issues
+
+
+def _first_with_same_digest(digest: np.ndarray) -> np.ndarray:
+    """For each row, the first row with the same text digest."""
+    n = len(digest)
+    order = np.lexsort((np.arange(n), digest[:, 1], digest[:, 0]))
+    sorted_digest = digest[order]
+    new_run = np.ones(n, dtype=bool)
+    new_run[1:] = (sorted_digest[1:] != sorted_digest[:-1]).any(axis=1)
+    # order is row-ascending within a run, so the run's first entry is its first row
+    run_first = order[new_run]
+    representative = np.empty(n, dtype=np.int64)
+    representative[order] = run_first[np.cumsum(new_run) - 1]
+    return representative
+
+
+def _candidate_pairs(keys: np.ndarray) -> np.ndarray:
+    """Distinct (i, j), i < j, pairs of rows sharing a key in any band."""
+    n, bands = keys.shape
+    found: list[np.ndarray] = []
+    for band in range(bands):
+        order = np.argsort(keys[:, band], kind="stable")
+        sorted_keys = keys[order, band]
+        boundaries = np.nonzero(sorted_keys[1:] != sorted_keys[:-1])[0] + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [n]))
+        for start, end in zip(starts[ends - starts > 1].tolist(), ends[ends - starts > 1].tolist()):
+            members = np.sort(order[start:end])
+            if len(members) <= MAX_BUCKET_PAIRWISE:
+                i, j = np.triu_indices(len(members), k=1)
+                found.append(np.column_stack((members[i], members[j])))
+            else:
+                found.append(
+                    np.column_stack((np.full(len(members) - 1, members[0]), members[1:]))
+                )
+
+    if not found:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.concatenate(found), axis=0)
@@ -1,14 +1,17 @@
 """Validate stage runner."""
 
 import logging
+from collections.abc import Sequence
+from dataclasses import replace
 from pathlib import Path
 
-from lectorius_pipeline.config import PipelineConfig
-from lectorius_pipeline.errors import ValidationFailedError
-from lectorius_pipeline.schemas import Chunk, ValidateReport
-from lectorius_pipeline.utils.io import load_chunks, update_manifest
+from lectorius_pipeline.config import ChunkConfig, PipelineConfig
+from lectorius_pipeline.errors import ValidateError, ValidationFailedError
+from lectorius_pipeline.schemas import ChunkifyReport, ValidateReport
+from lectorius_pipeline.utils.io import iter_chunks, load_chunks, update_manifest
+from lectorius_pipeline.utils.resources import peak_rss_mb
 
-from .checks import validate_chunks
+from .checks import ChunkValidator, validate_chunks
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +20,11 @@ def run_validate(output_dir: Path, book_id: str, config: PipelineConfig) -> Vali
     """
     Run the validate stage.
 
-    Validates all chunks for errors and warnings.
+    Validates all chunks for errors and warnings. Length checks use the
+    min/max chars recorded in reports/chunks.json when present, since
+    ``chunkify --target-seconds`` derives them from the voice's speech rate.
+    With ``config.low_memory`` chunks are streamed through a ChunkValidator
+    instead of being loaded into a list first.
 
     Args:
         output_dir: Book output directory
@@ -31,17 +38,27 @@ def run_validate(output_dir: Path, book_id: str, config: PipelineConfig) -> Vali
         ValidationFailedError: If any ERROR-level issues are found
     """
     logger.info("Starting validate stage for %s", book_id)
-
-    # Load chunks
-    chunks = load_chunks(output_dir)
-    logger.info("Loaded %d chunks for validation", len(chunks))
-
-    # Run validation
-    issues = validate_chunks(chunks, config.chunking)
+    chunking = _chunk_bounds(output_dir, config.chunking)
+
+    if config.low_memory:
+        validator = ChunkValidator(chunking, config.validation)
+        for chunk in iter_chunks(output_dir, ValidateError):
+            validator.add(chunk)
+        if not validator.chunk_count:
+            raise ValidateError("chunks.jsonl is empty")
+        total_chunks = validator.chunk_count
+        logger.info("Streamed %d chunks for validation", total_chunks)
+        issues = validator.finish(lambda rows: _load_texts(output_dir, rows))
+    else:
+        chunks = load_chunks(output_dir)
+        total_chunks = len(chunks)
+        logger.info("Loaded %d chunks for validation", total_chunks)
+        issues = validate_chunks(chunks, chunking, config.validation)
 
     # Count by severity
     error_count = sum(1 for i in issues if i.severity == "ERROR")
     warning_count = sum(1 for i in issues if i.severity == "WARN")
+    near_duplicate_clusters = sum(1 for i in issues if i.check == "near_duplicate_text")
 
     logger.info("Validation found %d errors, %d warnings", error_count, warning_count)
 
@@ -61,10 +78,13 @@ def run_validate(output_dir: Path, book_id: str, config: PipelineConfig) -> Vali
     report = ValidateReport(
         success=success,
         book_id=book_id,
-        total_chunks=len(chunks),
+        total_chunks=total_chunks,
         issues=issues,
         error_count=error_count,
         warning_count=warning_count,
+        near_duplicate_clusters=near_duplicate_clusters,
+        low_memory=config.low_memory,
+        peak_rss_mb=peak_rss_mb(),
     )
     _write_report(output_dir / "reports", report)
 
@@ -75,6 +95,34 @@ def run_validate(output_dir: Path, book_id: str, config: PipelineConfig) -> Vali
     return report
 
 
+def _chunk_bounds(output_dir: Path, chunking: ChunkConfig) -> ChunkConfig:
+    """Use the min/max chars chunkify recorded in reports/chunks.json, if any."""
+    path = output_dir / "reports" / "chunks.json"
+    if not path.exists():
+        return chunking
+    report = ChunkifyReport.model_validate_json(path.read_text())
+    if report.min_chars is None or report.max_chars is None:
+        return chunking
+    if (report.min_chars, report.max_chars) != (chunking.min_chars, chunking.max_chars):
+        logger.info(
+            "Checking lengths against chunkify's bounds: %d-%d chars",
+            report.min_chars,
+            report.max_chars,
+        )
+    return replace(chunking, min_chars=report.min_chars, max_chars=report.max_chars)
+
+
+def _load_texts(output_dir: Path, rows: Sequence[int]) -> dict[int, str]:
+    """Re-read the stripped text of selected chunks (0-based rows) from chunks.jsonl."""
+    wanted = set(rows)
+    texts: dict[int, str] = {}
+    for row, chunk in enumerate(iter_chunks(output_dir, ValidateError)):
+        if row in wanted:
+            texts[row] = chunk.text.strip()
+            if len(texts) == len(wanted):
+                break
+    return texts
+
 
 def _write_report(reports_dir: Path, report: ValidateReport) -> None:
     """Write validation.json report."""
@@ -0,0 +1,5 @@
+"""verify-pack: cross-check the artifacts of a finished book pack."""
+
+from lectorius_pipeline.stages.verify.runner import run_verify_pack
+
+__all__ = ["run_verify_pack"]
@@ -0,0 +1,72 @@
+"""Parallel probing of chunk MP3 files."""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from mutagen.mp3 import MP3, MPEGInfo
+
+logger = logging.getLogger(__name__)
+
+# Probing is mostly file I/O (mutagen reads only the first frames), so threads
+# overlap well even though parsing holds the GIL
+DEFAULT_PROBE_WORKERS = 16
+
+
+@dataclass
+class AudioProbe:
+    """What the file on disk says about one chunk's audio."""
+
+    path: str  # relative to the book directory, as in playback_map.jsonl
+    size: int | None  # bytes, None if the file does not exist
+    duration_ms: int | None  # from the MP3 headers, None if unreadable
+    error: str | None = None
+
+
+def list_audio_files(audio_dir: Path) -> dict[str, int]:
+    """Map every file name in ``audio_dir`` to its size, in one directory scan."""
+    if not audio_dir.is_dir():
+        return {}
+    with os.scandir(audio_dir) as entries:
+        return {e.name: e.stat().st_size for e in entries if e.is_file()}
+
+
+def probe_audio(
+    book_dir: Path, paths: list[str], workers: int = DEFAULT_PROBE_WORKERS
+) -> dict[str, AudioProbe]:
+    """
+    Read size and header-derived duration of each audio file in a thread pool.
+
+    Args:
+        book_dir: Book output directory
+        paths: Audio paths relative to ``book_dir``
+        workers: Thread pool size
+
+    Returns:
+        Mapping from relative path to its AudioProbe
+    """
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        probes = pool.map(lambda p: _probe_one(book_dir, p), paths)
+        return {probe.path: probe for probe in probes}
+
+
+def _probe_one(book_dir: Path, relative_path: str) -> AudioProbe:
+    path = book_dir / relative_path
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return AudioProbe(path=relative_path, size=None, duration_ms=None)
+    if size == 0:
+        return AudioProbe(path=relative_path, size=0, duration_ms=None, error="empty file")
+
+    try:
+        info: MPEGInfo | None = MP3(path).info  # type: ignore[no-untyped-call]
+    except Exception as e:
+        return AudioProbe(path=relative_path, size=size, duration_ms=None, error=str(e))
+    if info is None:
+        return AudioProbe(path=relative_path, size=size, duration_ms=None, error="no audio info")
+    return AudioProbe(path=relative_path, size=size, duration_ms=int(info.length * 1000))
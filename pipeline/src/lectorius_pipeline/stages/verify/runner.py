@@ -0,0 +1,481 @@
+"""verify-pack: cross-check a finished book pack.
+
+Each artifact (chunks.jsonl, playback_map.jsonl and the packaged
+audio/chapters/playback_map.jsonl, rag/meta.jsonl, memory/checkpoints.jsonl
+and audio/chunks/) is read once and indexed by
+chunk_id; every other artifact is then checked against the chunk index.
+Audio files are probed in a thread pool.
+"""
+
+import json
+import logging
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from lectorius_pipeline.errors import PackVerificationFailedError, VerifyPackError
+from lectorius_pipeline.schemas import (
+    PlaybackMapEntry,
+    RAGMeta,
+    ValidationIssue,
+    VerifyPackReport,
+)
+from lectorius_pipeline.utils.io import iter_chunks
+
+from .audio import DEFAULT_PROBE_WORKERS, AudioProbe, list_audio_files, probe_audio
+
+logger = logging.getLogger(__name__)
+
+# Allowed difference between playback_map duration_ms and the MP3 headers
+DURATION_TOLERANCE_MS = 100
+
+# Written by package-audio alongside the chapter files
+CHAPTER_MAP = "audio/chapters/playback_map.jsonl"
+
+# Chunk IDs listed in one "missing/orphan" summary issue
+MAX_LISTED_IDS = 10
+
+_Record = TypeVar("_Record", bound=BaseModel)
+
+
+@dataclass
+class _ChunkKey:
+    chunk_index: int
+    chapter_id: str
+
+
+def run_verify_pack(
+    book_dir: Path, book_id: str, workers: int = DEFAULT_PROBE_WORKERS
+) -> VerifyPackReport:
+    """
+    Verify that a book pack's artifacts agree with each other.
+
+    Artifacts other than chunks.jsonl are optional; a missing one is simply
+    not checked. Writes reports/verify_pack.json.
+
+    Args:
+        book_dir: Book output directory
+        book_id: Book identifier
+        workers: Threads used to probe audio files
+
+    Returns:
+        VerifyPackReport with every issue found
+
+    Raises:
+        VerifyPackError: If chunks.jsonl is missing or empty
+        PackVerificationFailedError: If any ERROR-level issues are found
+    """
+    logger.info("Verifying book pack %s", book_id)
+    started = time.perf_counter()
+
+    chunks: dict[str, _ChunkKey] = {}
+    by_index: dict[int, str] = {}
+    for chunk in iter_chunks(book_dir, VerifyPackError):
+        chunks.setdefault(chunk.chunk_id, _ChunkKey(chunk.chunk_index, chunk.chapter_id))
+        by_index.setdefault(chunk.chunk_index, chunk.chunk_id)
+    if not chunks:
+        raise VerifyPackError("chunks.jsonl is empty")
+
+    issues: list[ValidationIssue] = []
+    playback_entries, audio_checked = _check_playback(
+        book_dir, "playback_map.jsonl", chunks, workers, issues
+    )
+    if (book_dir / CHAPTER_MAP).exists():
+        _, chapter_files = _check_playback(book_dir, CHAPTER_MAP, chunks, workers, issues)
+        audio_checked += chapter_files
+    rag_vectors = _check_rag(book_dir, chunks, issues)
+    checkpoints = _check_checkpoints(book_dir, by_index, issues)
+
+    error_count = sum(1 for i in issues if i.severity == "ERROR")
+    warning_count = sum(1 for i in issues if i.severity == "WARN")
+    for issue in issues:
+        if issue.severity == "ERROR":
+            logger.error("[%s] %s", issue.check, issue.message)
+        else:
+            logger.warning("[%s] %s", issue.check, issue.message)
+
+    report = VerifyPackReport(
+        success=error_count == 0,
+        book_id=book_id,
+        total_chunks=len(chunks),
+        playback_entries=playback_entries,
+        audio_files_checked=audio_checked,
+        rag_vectors=rag_vectors,
+        checkpoints=checkpoints,
+        issues=issues,
+        error_count=error_count,
+        warning_count=warning_count,
+        elapsed_s=round(time.perf_counter() - started, 3),
+    )
+    reports_dir = book_dir / "reports"
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    (reports_dir / "verify_pack.json").write_text(report.model_dump_json(indent=2))
+
+    logger.info(
+        "Pack verification: %d errors, %d warnings in %.2fs",
+        error_count,
+        warning_count,
+        report.elapsed_s,
+    )
+    if error_count:
+        raise PackVerificationFailedError(error_count)
+    return report
+
+
+def _check_playback(
+    book_dir: Path,
+    relative_map: str,
+    chunks: dict[str, _ChunkKey],
+    workers: int,
+    issues: list[ValidationIssue],
+) -> tuple[int, int]:
+    """Check a playback map against the chunks and the files in audio/chunks/.
+
+    Entries with a byte range point into a chapter file written by
+    package-audio (audio/chapters/playback_map.jsonl); those are checked for
+    contiguity, against the file size, and per file against its duration.
+
+    Returns:
+        Tuple of (playback entries, audio files probed)
+    """
+    map_path = book_dir / relative_map
+    label = relative_map.removesuffix(".jsonl")
+    audio_dir = book_dir / "audio" / "chunks"
+    on_disk = list_audio_files(audio_dir)
+    if not map_path.exists():
+        if on_disk:
+            issues.append(_issue(
+                "ERROR",
+                "missing_artifact",
+                f"audio/chunks/ has {len(on_disk)} files but {relative_map} is missing",
+            ))
+        return 0, 0
+
+    entries: list[PlaybackMapEntry] = list(
+        _iter_records(map_path, PlaybackMapEntry, label, issues)
+    )
+    seen: set[str] = set()
+    previous_index = 0
+    for entry in entries:
+        key = chunks.get(entry.chunk_id)
+        if key is None:
+            issues.append(_issue(
+                "ERROR", "playback_unknown_chunk",
+                f"{label} entry for unknown chunk {entry.chunk_id}",
+                entry.chunk_id, entry.chunk_index,
+            ))
+            continue
+        if entry.chunk_id in seen:
+            issues.append(_issue(
+                "ERROR", "playback_duplicate",
+                f"chunk {entry.chunk_id} appears more than once in {label}",
+                entry.chunk_id, entry.chunk_index,
+            ))
+        seen.add(entry.chunk_id)
+        if (entry.chunk_index, entry.chapter_id) != (key.chunk_index, key.chapter_id):
+            issues.append(_issue(
+                "ERROR", "playback_chunk_mismatch",
+                f"{label} has {entry.chunk_id} at index {entry.chunk_index} in "
+                f"{entry.chapter_id}, chunks.jsonl at {key.chunk_index} in {key.chapter_id}",
+                entry.chunk_id, entry.chunk_index,
+            ))
+        if entry.chunk_index <= previous_index:
+            issues.append(_issue(
+                "ERROR", "playback_order",
+                f"{label} is not sorted by chunk_index at {entry.chunk_id}",
+                entry.chunk_id, entry.chunk_index,
+            ))
+        previous_index = max(previous_index, entry.chunk_index)
+        if entry.duration_ms <= 0 or entry.end_ms - entry.start_ms != entry.duration_ms:
+            issues.append(_issue(
+                "ERROR", "playback_bounds",
+                f"{entry.chunk_id} has duration_ms={entry.duration_ms}, "
+                f"start_ms={entry.start_ms}, end_ms={entry.end_ms}",
+                entry.chunk_id, entry.chunk_index,
+            ))
+
+    missing = [chunk_id for chunk_id in chunks if chunk_id not in seen]
+    if missing:
+        issues.append(_issue(
+            "WARN", "playback_incomplete",
+            f"{len(missing)} chunks have no audio: {_list_ids(missing)}",
+        ))
+
+    # Entries are checked against a single directory scan; only files that
+    # exist are opened, in parallel
+    paths = sorted({e.audio_path for e in entries})
+    existing = [p for p in paths if _in_audio_dir(p) and Path(p).name in on_disk]
+    existing += [p for p in paths if not _in_audio_dir(p) and (book_dir / p).exists()]
+    probes = probe_audio(book_dir, existing, workers)
+
+    previous_ranged: dict[str, PlaybackMapEntry] = {}
+    for entry in entries:
+        probe = probes.get(entry.audio_path)
+        if entry.byte_start is not None or entry.byte_end is not None:
+            _check_byte_range(entry, previous_ranged.get(entry.audio_path), probe, issues)
+            previous_ranged[entry.audio_path] = entry
+            continue
+        if probe is None or probe.size is None:
+            issues.append(_issue(
+                "ERROR", "audio_missing",
+                f"{entry.audio_path} does not exist",
+                entry.chunk_id, entry.chunk_index,
+            ))
+        elif probe.duration_ms is None:
+            issues.append(_issue(
+                "ERROR", "audio_unreadable",
+                f"{entry.audio_path} ({probe.size} bytes) is not a readable MP3: {probe.error}",
+                entry.chunk_id, entry.chunk_index,
+            ))
+        elif abs(probe.duration_ms - entry.duration_ms) > DURATION_TOLERANCE_MS:
+            issues.append(_issue(
+                "ERROR", "audio_duration_mismatch",
+                f"{entry.audio_path} is {probe.duration_ms}ms, "
+                f"{label} says {entry.duration_ms}ms",
+                entry.chunk_id, entry.chunk_index,
+            ))
+
+    for path, last in previous_ranged.items():
+        probe = probes.get(path)
+        if probe and probe.duration_ms is not None:
+            if abs(probe.duration_ms - last.end_ms) > DURATION_TOLERANCE_MS:
+                issues.append(_issue(
+                    "ERROR", "audio_duration_mismatch",
+                    f"{path} is {probe.duration_ms}ms, {label} ends at {last.end_ms}ms",
+                ))
+
+    # Packaged chunk files stay on disk as tts sources, so they are not orphans
+    referenced = {Path(p).name for p in paths if _in_audio_dir(p)}
+    orphans = sorted(name for name in on_disk if name not in referenced)
+    if orphans and not previous_ranged:
+        issues.append(_issue(
+            "WARN", "audio_orphan",
+            f"{len(orphans)} files in audio/chunks/ are not in {label}: "
+            f"{_list_ids(orphans)}",
+        ))
+
+    logger.info("Checked %d playback entries, probed %d audio files", len(entries), len(probes))
+    return len(entries), len(probes)
+
+
+def _check_byte_range(
+    entry: PlaybackMapEntry,
+    previous: PlaybackMapEntry | None,
+    probe: AudioProbe | None,
+    issues: list[ValidationIssue],
+) -> None:
+    """Check a packaged entry against the previous one in its file and the file itself."""
+    start, end = entry.byte_start, entry.byte_end
+    if start is None or end is None or start >= end:
+        issues.append(_issue(
+            "ERROR", "playback_byte_range",
+            f"{entry.chunk_id} has byte range {start}-{end}",
+            entry.chunk_id, entry.chunk_index,
+        ))
+        return
+    expected = (0, 0) if previous is None else (previous.byte_end, previous.end_ms)
+    if (start, entry.start_ms) != expected:
+        issues.append(_issue(
+            "ERROR", "playback_byte_range",
+            f"{entry.chunk_id} starts at byte {start}/{entry.start_ms}ms in "
+            f"{entry.audio_path}, expected {expected[0]}/{expected[1]}ms",
+            entry.chunk_id, entry.chunk_index,
+        ))
+    if probe is None or probe.size is None:
+        issues.append(_issue(
+            "ERROR", "audio_missing",
+            f"{entry.audio_path} does not exist",
+            entry.chunk_id, entry.chunk_index,
+        ))
+    elif end > probe.size:
+        issues.append(_issue(
+            "ERROR", "playback_byte_range",
+            f"{entry.chunk_id} ends at byte {end} but {entry.audio_path} has {probe.size}",
+            entry.chunk_id, entry.chunk_index,
+        ))
+
+
+def _check_rag(
+    book_dir: Path, chunks: dict[str, _ChunkKey], issues: list[ValidationIssue]
+) -> int:
+    """Check rag/meta.jsonl against the chunks (and passages.jsonl, if used)."""
+    meta_path = book_dir / "rag" / "meta.jsonl"
+    if not meta_path.exists():
+        return 0
+
+    passage_ids: set[str] | None = None
+    embedded: set[str] = set()
+    count = 0
+    for meta in _iter_records(meta_path, RAGMeta, "rag_meta", issues):
+        if meta.vector_id != count:
+            issues.append(_issue(
+                "ERROR", "rag_vector_id",
+                f"vector_id {meta.vector_id} at position {count} in rag/meta.jsonl",
+                meta.chunk_id, meta.chunk_index,
+            ))
+        count += 1
+
+        key = chunks.get(meta.chunk_id)
+        if key is None:
+            issues.append(_issue(
+                "ERROR", "rag_unknown_chunk",
+                f"rag/meta.jsonl vector {meta.vector_id} points at unknown chunk {meta.chunk_id}",
+                meta.chunk_id, meta.chunk_index,
+            ))
+            continue
+        if (meta.chunk_index, meta.chapter_id) != (key.chunk_index, key.chapter_id):
+            issues.append(_issue(
+                "ERROR", "rag_chunk_mismatch",
+                f"rag/meta.jsonl has {meta.chunk_id} at index {meta.chunk_index} in "
+                f"{meta.chapter_id}, chunks.jsonl at {key.chunk_index} in {key.chapter_id}",
+                meta.chunk_id, meta.chunk_index,
+            ))
+        if meta.passage_id is not None:
+            if passage_ids is None:
+                passage_ids = _load_passage_ids(book_dir)
+            if meta.passage_id not in passage_ids:
+                issues.append(_issue(
+                    "ERROR", "rag_unknown_passage",
+                    f"rag/meta.jsonl vector {meta.vector_id} points at unknown passage "
+                    f"{meta.passage_id}",
+                    meta.chunk_id, meta.chunk_index,
+                ))
+        embedded.add(meta.chunk_id)
+
+    missing = [chunk_id for chunk_id in chunks if chunk_id not in embedded]
+    if missing:
+        issues.append(_issue(
+            "WARN", "rag_incomplete",
+            f"{len(missing)} chunks have no vectors: {_list_ids(missing)}",
+        ))
+    return count
+
+
+def _check_checkpoints(
+    book_dir: Path, by_index: dict[int, str], issues: list[ValidationIssue]
+) -> int:
+    """Check that memory checkpoints point at real chunks, in increasing order.
+
+    Memory skips a checkpoint whose generation failed but keeps numbering by
+    position, so a gap in checkpoint_index is only a warning; going backwards
+    is an error.
+    """
+    path = book_dir / "memory" / "checkpoints.jsonl"
+    if not path.exists():
+        return 0
+
+    count = 0
+    previous_index = 0
+    previous_until = 0
+    for line_no, line in enumerate(path.read_text().splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            checkpoint = json.loads(line)
+            until_index = int(checkpoint["until_chunk_index"])
+            until_id = checkpoint.get("until_chunk_id")
+            checkpoint_index = checkpoint.get("checkpoint_index")
+        except (ValueError, KeyError, TypeError) as e:
+            issues.append(_issue(
+                "ERROR", "unparseable_record",
+                f"memory/checkpoints.jsonl line {line_no}: {e}",
+            ))
+            continue
+        count += 1
+
+        if not isinstance(checkpoint_index, int) or checkpoint_index <= previous_index:
+            issues.append(_issue(
+                "ERROR", "checkpoint_sequence",
+                f"checkpoint_index {checkpoint_index} does not follow {previous_index}",
+            ))
+        else:
+            if checkpoint_index != previous_index + 1:
+                missing = [str(i) for i in range(previous_index + 1, checkpoint_index)]
+                issues.append(_issue(
+                    "WARN", "checkpoint_gap",
+                    f"checkpoint_index {_list_ids(missing)} missing before "
+                    f"{checkpoint_index} (failed during memory generation)",
+                ))
+            previous_index = checkpoint_index
+        chunk_id = by_index.get(until_index)
+        if chunk_id is None:
+            issues.append(_issue(
+                "ERROR", "checkpoint_out_of_range",
+                f"checkpoint {checkpoint_index} until_chunk_index {until_index} "
+                f"is not a chunk_index in chunks.jsonl",
+                until_id, until_index,
+            ))
+            continue
+        if until_id is not None and until_id != chunk_id:
+            issues.append(_issue(
+                "ERROR", "checkpoint_chunk_mismatch",
+                f"checkpoint {checkpoint_index} until_chunk_id {until_id} but chunk "
+                f"{until_index} is {chunk_id}",
+                until_id, until_index,
+            ))
+        if until_index <= previous_until:
+            issues.append(_issue(
+                "ERROR", "checkpoint_order",
+                f"checkpoint {checkpoint_index} until_chunk_index {until_index} does not "
+                f"advance past {previous_until}",
+                until_id, until_index,
+            ))
+        previous_until = max(previous_until, until_index)
+
+    last_index = max(by_index)
+    if count and previous_until != last_index:
+        issues.append(_issue(
+            "WARN", "checkpoint_incomplete",
+            f"last checkpoint ends at chunk {previous_until}, book ends at {last_index}",
+        ))
+    return count
+
+
+def _iter_records(
+    path: Path, model: type[_Record], name: str, issues: list[ValidationIssue]
+) -> Iterator[_Record]:
+    """Parse a JSONL artifact, reporting (and skipping) malformed lines."""
+    with open(path) as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield model.model_validate_json(line)
+            except ValidationError as e:
+                issues.append(_issue(
+                    "ERROR", "unparseable_record",
+                    f"{name} line {line_no}: {e.error_count()} validation error(s)",
+                ))
+
+
+def _load_passage_ids(book_dir: Path) -> set[str]:
+    path = book_dir / "passages.jsonl"
+    if not path.exists():
+        return set()
+    with open(path) as f:
+        return {json.loads(line)["passage_id"] for line in f if line.strip()}
+
+
+def _in_audio_dir(relative_path: str) -> bool:
+    return Path(relative_path).parent == Path("audio/chunks")
+
+
+def _list_ids(ids: list[str]) -> str:
+    listed = ", ".join(ids[:MAX_LISTED_IDS])
+    return listed if len(ids) <= MAX_LISTED_IDS else f"{listed}, ..."
+
+
+def _issue(
+    severity: Literal["ERROR", "WARN"],
+    check: str,
+    message: str,
+    chunk_id: str | None = None,
+    chunk_index: int | None = None,
+) -> ValidationIssue:
+    return ValidationIssue(
+        severity=severity, check=check, message=message, chunk_id=chunk_id, chunk_index=chunk_index
+    )
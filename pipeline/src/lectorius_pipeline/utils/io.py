@@ -1,37 +1,68 @@
 """Shared I/O utilities for pipeline stages."""
 
 import logging
+import os
+import shutil
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TextIO
 
 from lectorius_pipeline.errors import PipelineError
-from lectorius_pipeline.schemas import BookMeta, Chunk, Manifest
+from lectorius_pipeline.schemas import (
+    BookMeta,
+    Chunk,
+    ChunkChangeSet,
+    ChunkifyReport,
+    Manifest,
+    MemorySection,
+    Passage,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def load_chunks(book_dir: Path, error_class: type[PipelineError] = PipelineError) -> list[Chunk]:
-    """Load chunks from chunks.jsonl.
+def iter_chunks(
+    book_dir: Path, error_class: type[PipelineError] = PipelineError
+) -> Iterator[Chunk]:
+    """Stream chunks from chunks.jsonl one record at a time.
 
     Args:
         book_dir: Path to book output directory.
         error_class: Exception class to raise on failure.
 
-    Returns:
-        List of Chunk objects.
+    Yields:
+        Chunk objects in file order.
 
     Raises:
-        error_class: If chunks.jsonl is missing or empty.
+        error_class: If chunks.jsonl is missing.
     """
     chunks_path = book_dir / "chunks.jsonl"
     if not chunks_path.exists():
         raise error_class(f"chunks.jsonl not found in {book_dir}")
 
-    chunks: list[Chunk] = []
     with open(chunks_path) as f:
         for line in f:
             line = line.strip()
             if line:
-                chunks.append(Chunk.model_validate_json(line))
+                yield Chunk.model_validate_json(line)
+
+
+def load_chunks(book_dir: Path, error_class: type[PipelineError] = PipelineError) -> list[Chunk]:
+    """Load chunks from chunks.jsonl.
+
+    Args:
+        book_dir: Path to book output directory.
+        error_class: Exception class to raise on failure.
+
+    Returns:
+        List of Chunk objects.
+
+    Raises:
+        error_class: If chunks.jsonl is missing or empty.
+    """
+    chunks = list(iter_chunks(book_dir, error_class))
 
     if not chunks:
         raise error_class("chunks.jsonl is empty")
@@ -39,6 +70,133 @@ def load_chunks(book_dir: Path, error_class: type[PipelineError] = PipelineError
     return chunks
 
 
+def load_passages(
+    book_dir: Path, error_class: type[PipelineError] = PipelineError
+) -> list[Passage]:
+    """Load retrieval passages from passages.jsonl.
+
+    Args:
+        book_dir: Path to book output directory.
+        error_class: Exception class to raise on failure.
+
+    Returns:
+        List of Passage objects.
+
+    Raises:
+        error_class: If passages.jsonl is missing or empty.
+    """
+    path = book_dir / "passages.jsonl"
+    if not path.exists():
+        raise error_class(
+            f"passages.jsonl not found in {book_dir} (run chunkify with --multi-granularity)"
+        )
+
+    passages: list[Passage] = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                passages.append(Passage.model_validate_json(line))
+
+    if not passages:
+        raise error_class("passages.jsonl is empty")
+
+    return passages
+
+
+def load_sections(book_dir: Path) -> list[MemorySection] | None:
+    """Load memory sections from sections.jsonl if available.
+
+    Args:
+        book_dir: Path to book output directory.
+
+    Returns:
+        List of MemorySection objects, or None if sections.jsonl does not exist.
+    """
+    path = book_dir / "sections.jsonl"
+    if not path.exists():
+        return None
+
+    sections: list[MemorySection] = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                sections.append(MemorySection.model_validate_json(line))
+    return sections
+
+
+def load_chunk_changes(book_dir: Path) -> ChunkChangeSet | None:
+    """Load the change set written by the last incremental chunkify run.
+
+    The change set only applies while chunk IDs are content-stable, so it is
+    ignored unless reports/chunks.json records the last run as incremental.
+
+    Args:
+        book_dir: Path to book output directory.
+
+    Returns:
+        ChunkChangeSet, or None if reports/chunk_changes.json does not exist
+        or the last chunkify run was not incremental.
+    """
+    path = book_dir / "reports" / "chunk_changes.json"
+    report_path = book_dir / "reports" / "chunks.json"
+    if not path.exists() or not report_path.exists():
+        return None
+    if not ChunkifyReport.model_validate_json(report_path.read_text()).incremental:
+        return None
+    return ChunkChangeSet.model_validate_json(path.read_text())
+
+
+@contextmanager
+def atomic_write(path: Path) -> Iterator[TextIO]:
+    """Open a temp file next to ``path`` and move it into place on success.
+
+    Readers never observe a half-written file, and a failure part-way
+    through leaves the previous version untouched.
+
+    Args:
+        path: Final destination path.
+
+    Yields:
+        Text file handle to write to.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def unique_temp_path(path: Path) -> Path:
+    """Hidden, uniquely named sibling of ``path`` to write before renaming over it."""
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+
+
+def link_or_copy(source: Path, dest: Path) -> None:
+    """Atomically replace ``dest`` with a hardlink to ``source`` (a copy across devices)."""
+    try:
+        if os.path.samefile(source, dest):
+            # Already linked; rename() between two links of one inode is a no-op
+            return
+    except FileNotFoundError:
+        if not source.exists():
+            raise
+    # Unique name: the destination may be written by concurrent runs
+    tmp = unique_temp_path(dest)
+    try:
+        try:
+            os.link(source, tmp)
+        except OSError:
+            shutil.copyfile(source, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def update_manifest(output_dir: Path, stage_name: str) -> None:
     """Append a stage to manifest.json stages_completed list.
 
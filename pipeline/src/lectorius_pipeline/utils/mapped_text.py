@@ -0,0 +1,130 @@
+"""Memory-mapped, character-indexed access to large UTF-8 text files."""
+
+import logging
+import mmap
+from bisect import bisect_right
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+# Bytes between index checkpoints. Slicing decodes at most one block per bound.
+DEFAULT_BLOCK_BYTES = 1 << 20
+
+
+class MappedText:
+    """Read-only view of a UTF-8 text file that slices like a ``str``.
+
+    Chapter and chunk offsets are character offsets, but UTF-8 is
+    variable-width, so a sparse index of (char offset, byte offset)
+    checkpoints is built once by scanning the mapped file block by block.
+    Slicing then decodes only the bytes it needs. Memory use stays bounded
+    by the block size regardless of file size.
+
+    Supports ``len(text)``, ``text[start:end]`` and line iteration, which is
+    everything the chapterize and chunkify stages need from ``raw_text.txt``.
+    """
+
+    def __init__(self, path: Path, block_bytes: int = DEFAULT_BLOCK_BYTES) -> None:
+        self._path = path
+        self._block_bytes = block_bytes
+        self._file = open(path, "rb")
+        self._size = self._file.seek(0, 2)
+        # mmap cannot map empty files
+        self._mm: mmap.mmap | None = None
+        if self._size:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._char_marks: list[int] = [0]
+        self._byte_marks: list[int] = [0]
+        self._length = self._build_index()
+        logger.debug(
+            "Mapped %s: %d bytes, %d chars, %d index blocks",
+            path.name,
+            self._size,
+            self._length,
+            len(self._char_marks),
+        )
+
+    def __enter__(self) -> "MappedText":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file and close the handle."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key: slice) -> str:
+        if not isinstance(key, slice):
+            raise TypeError("MappedText only supports slicing")
+        start, stop, step = key.indices(self._length)
+        if step != 1:
+            raise ValueError("MappedText does not support stepped slices")
+        if stop <= start or self._mm is None:
+            return ""
+        byte_start = self._byte_offset(start)
+        byte_stop = self._byte_offset(stop)
+        return self._mm[byte_start:byte_stop].decode("utf-8")
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield lines without their newline, matching ``text.split("\\n")``."""
+        if self._mm is None:
+            yield ""
+            return
+
+        pos = 0
+        while True:
+            newline = self._mm.find(b"\n", pos)
+            if newline == -1:
+                yield self._mm[pos:].decode("utf-8")
+                return
+            yield self._mm[pos:newline].decode("utf-8")
+            pos = newline + 1
+
+    def _build_index(self) -> int:
+        """Record a checkpoint at every block boundary and return the char length."""
+        if self._mm is None:
+            return 0
+
+        chars = 0
+        byte_pos = 0
+        while byte_pos < self._size:
+            block_end = min(byte_pos + self._block_bytes, self._size)
+            # Never split a multi-byte sequence: advance past continuation bytes
+            while block_end < self._size and (self._mm[block_end] & 0xC0) == 0x80:
+                block_end += 1
+            chars += len(self._mm[byte_pos:block_end].decode("utf-8"))
+            byte_pos = block_end
+            if byte_pos < self._size:
+                self._char_marks.append(chars)
+                self._byte_marks.append(byte_pos)
+        return chars
+
+    def _byte_offset(self, char_offset: int) -> int:
+        """Translate a character offset into a byte offset in the mapped file."""
+        if char_offset >= self._length:
+            return self._size
+
+        assert self._mm is not None
+        i = bisect_right(self._char_marks, char_offset) - 1
+        base_byte = self._byte_marks[i]
+        remaining = char_offset - self._char_marks[i]
+        if remaining == 0:
+            return base_byte
+
+        block_end = self._byte_marks[i + 1] if i + 1 < len(self._byte_marks) else self._size
+        block = self._mm[base_byte:block_end].decode("utf-8")
+        return base_byte + len(block[:remaining].encode("utf-8"))
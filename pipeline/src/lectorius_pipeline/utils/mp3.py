@@ -0,0 +1,308 @@
+"""Duration of MPEG Layer III audio, read from bytes already in memory.
+
+The TTS stage has every file's bytes in hand when it writes them, so reading
+the duration there should not re-open the file through mutagen. This module
+reads only what the duration depends on. The first frame header sets the
+sample rate and samples per frame. A Xing/Info header (LAME, ffmpeg) or a
+VBRI header (Fraunhofer) then gives the frame count, with the LAME encoder
+delay and padding removed the way mutagen does. Without either header, the
+frame headers are walked and counted, which is exact for CBR and VBR alike.
+``MP3DurationCounter`` does the same for audio that arrives in pieces
+(streamed responses), holding only a few bytes between pieces. ``mp3_frames``
+lists the audio frames themselves, for joining and cutting files on frame
+boundaries, and ``frame_activity`` finds pauses without decoding the audio.
+
+Only Layer III is handled; anything else returns None so callers can fall
+back to mutagen.
+"""
+
+import functools
+from dataclasses import dataclass
+
+# Bitrates in kbps by index, for MPEG-1 and MPEG-2/2.5 Layer III
+_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+_SAMPLE_RATES_V1 = (44100, 48000, 32000)
+
+# Version bits -> sample rate divisor (MPEG-1, MPEG-2, MPEG-2.5); 0b01 is reserved
+_VERSION_DIVISORS = {0b11: 1, 0b10: 2, 0b00: 4}
+
+_MONO = 0b11
+
+
+@functools.cache
+def _decode_header(word: int) -> tuple[int, int, int, int] | None:
+    """Decode a 32-bit Layer III frame header.
+
+    Returns (frame_length, sample_rate, samples_per_frame, side_info_offset),
+    or None if ``word`` is not a valid header. A stream repeats a handful of
+    distinct headers, so results are cached.
+    """
+    if word >> 21 != 0x7FF:
+        return None
+    version = (word >> 19) & 0b11
+    layer = (word >> 17) & 0b11
+    bitrate_index = (word >> 12) & 0xF
+    rate_index = (word >> 10) & 0b11
+    if version not in _VERSION_DIVISORS or layer != 0b01:
+        return None
+    if bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == 0b11
+    sample_rate = _SAMPLE_RATES_V1[rate_index] // _VERSION_DIVISORS[version]
+    bitrate = (_BITRATES_V1 if mpeg1 else _BITRATES_V2)[bitrate_index] * 1000
+    padding = (word >> 9) & 1
+    mono = (word >> 6) & 0b11 == _MONO
+    if mpeg1:
+        frame_length = 144 * bitrate // sample_rate + padding
+        side_info = 21 if mono else 36
+        samples = 1152
+    else:
+        frame_length = 72 * bitrate // sample_rate + padding
+        side_info = 13 if mono else 21
+        samples = 576
+    return frame_length, sample_rate, samples, side_info
+
+
+def _frame_header(
+    data: bytes | bytearray | memoryview, pos: int
+) -> tuple[int, int, int, int] | None:
+    """The decoded frame header at ``pos``, or None if there is none."""
+    if pos + 4 > len(data):
+        return None
+    return _decode_header(int.from_bytes(data[pos : pos + 4], "big"))
+
+
+def _skip_id3v2(data: bytes | bytearray | memoryview) -> int:
+    """Offset just past any leading ID3v2 tags."""
+    pos = 0
+    while len(data) >= pos + 10 and bytes(data[pos : pos + 3]) == b"ID3":
+        size = 0
+        for b in data[pos + 6 : pos + 10]:
+            size = (size << 7) | (b & 0x7F)
+        footer = 10 if data[pos + 5] & 0x10 else 0
+        pos += 10 + size + footer
+    return pos
+
+
+def _first_frame(
+    data: bytes | bytearray | memoryview, final: bool
+) -> tuple[int, tuple[int, int, int, int]] | None:
+    """Find the first frame whose successor also lines up.
+
+    Until ``final``, a candidate whose successor is not in ``data`` yet is
+    left for a later call; at the end of the stream, the end may follow it.
+    """
+    pos = _skip_id3v2(data)
+    end = len(data) - 4
+    while pos <= end:
+        if data[pos] == 0xFF:
+            header = _frame_header(data, pos)
+            if header is not None:
+                following = pos + header[0]
+                if following + 4 > len(data):
+                    if final and following >= len(data):
+                        return pos, header
+                    if not final:
+                        return None
+                elif _frame_header(data, following) is not None:
+                    return pos, header
+        pos += 1
+    return None
+
+
+def _uint32(data: bytes | bytearray | memoryview, pos: int) -> int:
+    return int.from_bytes(data[pos : pos + 4], "big")
+
+
+def _xing_samples(
+    data: bytes | bytearray | memoryview, pos: int, samples_per_frame: int
+) -> int | None:
+    """Sample count from a Xing/Info header at ``pos``, net of LAME delay and padding."""
+    if len(data) < pos + 8 or bytes(data[pos : pos + 4]) not in (b"Xing", b"Info"):
+        return None
+    flags = _uint32(data, pos + 4)
+    if not flags & 0x1:
+        return None
+    frames = _uint32(data, pos + 8)
+    # Skip frames, bytes, TOC and VBR scale fields to reach the LAME tag
+    tag = pos + 12 + (4 if flags & 0x2 else 0) + (100 if flags & 0x4 else 0)
+    tag += 4 if flags & 0x8 else 0
+    samples = frames * samples_per_frame
+    if len(data) >= tag + 24 and bytes(data[tag : tag + 3]) in (b"LAM", b"Lav"):
+        # 9-byte encoder version, then the extended header; revision must be 0
+        if data[tag + 9] >> 4 == 0:
+            delay_padding = int.from_bytes(data[tag + 21 : tag + 24], "big")
+            samples -= (delay_padding >> 12) + (delay_padding & 0xFFF)
+    return max(0, samples)
+
+
+def _is_info_frame(data: bytes | bytearray | memoryview, pos: int, side_info: int) -> bool:
+    """Whether the frame at ``pos`` holds a Xing/Info or VBRI header instead of audio."""
+    tag = bytes(data[pos + side_info : pos + side_info + 4])
+    return tag in (b"Xing", b"Info") or bytes(data[pos + 36 : pos + 40]) == b"VBRI"
+
+
+def _vbri_frames(data: bytes | bytearray | memoryview, pos: int) -> int | None:
+    """Frame count from a VBRI header at ``pos``."""
+    if len(data) < pos + 18 or bytes(data[pos : pos + 4]) != b"VBRI":
+        return None
+    return _uint32(data, pos + 14)
+
+
+class MP3DurationCounter:
+    """Duration of MP3 audio fed in pieces, as ``mp3_duration_ms`` would compute it."""
+
+    def __init__(self) -> None:
+        self._pending = bytearray()  # bytes not yet walked
+        self._header: tuple[int, int, int, int] | None = None  # first frame
+        self._samples: int | None = None  # from a Xing/VBRI header
+        self._frames = 0
+        self._skip = 0  # bytes of the last counted frame not received yet
+        self._done = False  # VBR header found, or a bad header ended the walk
+
+    def feed(self, data: bytes | memoryview) -> None:
+        """Account for the next piece of the stream."""
+        if self._done:
+            return
+        self._pending += data
+        if self._header is None and not self._lock_on(final=False):
+            return
+        self._walk()
+
+    def finish(self) -> int | None:
+        """Duration in milliseconds, or None if the stream was not Layer III audio."""
+        if self._header is None and not self._lock_on(final=True):
+            return None
+        assert self._header is not None
+        sample_rate, samples_per_frame = self._header[1], self._header[2]
+        if self._samples is not None:
+            return self._samples * 1000 // sample_rate
+        # The last counted frame is truncated if some of it never arrived
+        frames = self._frames - (1 if self._skip else 0)
+        return frames * samples_per_frame * 1000 // sample_rate
+
+    def _lock_on(self, final: bool) -> bool:
+        """Find the first frame and read its VBR header, once enough bytes arrived."""
+        first = _first_frame(self._pending, final)
+        if first is None:
+            return False
+        pos, self._header = first
+        _, _, samples_per_frame, side_info = self._header
+        samples = _xing_samples(self._pending, pos + side_info, samples_per_frame)
+        if samples is None:
+            vbri = _vbri_frames(self._pending, pos + 36)
+            if vbri is not None:
+                samples = vbri * samples_per_frame
+        if samples is not None:
+            self._samples = samples
+            self._done = True
+            self._pending.clear()
+        else:
+            del self._pending[:pos]
+        return True
+
+    def _walk(self) -> None:
+        """Count frames in the pending bytes, keeping any partial header."""
+        data = self._pending
+        size = len(data)
+        pos = self._skip
+        while pos + 4 <= size:
+            header = _decode_header(int.from_bytes(data[pos : pos + 4], "big"))
+            if header is None:
+                # Trailing tag or garbage: the audio ends here
+                self._done = True
+                self._skip = 0
+                self._pending.clear()
+                return
+            self._frames += 1
+            pos += header[0]
+        if pos >= size:
+            self._skip = pos - size
+            self._pending.clear()
+        else:
+            self._skip = 0
+            del self._pending[:pos]
+
+
+def mp3_duration_ms(data: bytes | memoryview) -> int | None:
+    """Duration of MP3 ``data`` in milliseconds, or None if it is not Layer III audio."""
+    counter = MP3DurationCounter()
+    counter.feed(data)
+    return counter.finish()
+
+
+@dataclass
+class MP3Frames:
+    """Audio frames of one MP3 file, without tags or the Xing/Info/VBRI frame."""
+
+    sample_rate: int
+    samples_per_frame: int
+    offsets: list[int]  # byte offset of each frame; frames are contiguous
+    end: int  # byte offset just past the last frame
+
+    @property
+    def start(self) -> int:
+        return self.offsets[0]
+
+    @property
+    def duration_ms(self) -> int:
+        return len(self.offsets) * self.samples_per_frame * 1000 // self.sample_rate
+
+
+def mp3_frames(data: bytes | memoryview) -> MP3Frames | None:
+    """List the Layer III audio frames in ``data``, or None if there are none.
+
+    The walk stops at the first truncated frame, tag or frame of another
+    sample rate, so ``data[start:end]`` is clean, joinable audio.
+    """
+    first = _first_frame(data, final=True)
+    if first is None:
+        return None
+    pos, (frame_length, sample_rate, samples_per_frame, side_info) = first
+    if _is_info_frame(data, pos, side_info):
+        pos += frame_length
+    offsets: list[int] = []
+    size = len(data)
+    while pos + 4 <= size:
+        header = _decode_header(int.from_bytes(data[pos : pos + 4], "big"))
+        if header is None or header[1:3] != (sample_rate, samples_per_frame):
+            break
+        if pos + header[0] > size:
+            break
+        offsets.append(pos)
+        pos += header[0]
+    if not offsets:
+        return None
+    return MP3Frames(sample_rate, samples_per_frame, offsets, pos)
+
+
+def frame_activity(data: bytes | memoryview, frames: MP3Frames) -> list[int]:
+    """Bits of coded audio in each frame, read from its side information.
+
+    This is part2_3_length (scalefactors plus Huffman data) summed over the
+    frame's granules and channels. Silence codes to almost nothing, so runs
+    of near-zero frames are pauses in speech.
+    """
+    activity: list[int] = []
+    for pos in frames.offsets:
+        word = int.from_bytes(data[pos : pos + 4], "big")
+        mpeg1 = (word >> 19) & 0b11 == 0b11
+        channels = 1 if (word >> 6) & 0b11 == _MONO else 2
+        # Side information follows the header and its optional CRC
+        start = pos + 4 + (0 if (word >> 16) & 1 else 2)
+        if mpeg1:
+            size = 17 if channels == 1 else 32
+            bit = 9 + (5 if channels == 1 else 3) + 4 * channels  # main_data_begin, private, scfsi
+            granules, granule_bits = 2, 59
+        else:
+            size = 9 if channels == 1 else 17
+            bit = 8 + channels  # main_data_begin, private bits
+            granules, granule_bits = 1, 63
+        side = int.from_bytes(data[start : start + size], "big")
+        bits = 0
+        for _ in range(granules * channels):
+            bits += (side >> (size * 8 - bit - 12)) & 0xFFF
+            bit += granule_bits
+        activity.append(bits)
+    return activity
@@ -0,0 +1,17 @@
+"""Process resource usage helpers for stage reports."""
+
+import resource
+import sys
+
+
+def peak_rss_mb() -> float:
+    """Return the process's peak resident set size in MiB.
+
+    This is a high-water mark for the whole process, so when several stages
+    run in one ``process`` invocation it includes the earlier stages.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux but bytes on macOS
+    if sys.platform == "darwin":
+        peak //= 1024
+    return round(peak / 1024, 1)
@@ -0,0 +1,194 @@
+"""Per-voice speaking rate learned from finished TTS runs."""
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from lectorius_pipeline.schemas import (
+    ChunkifyReport,
+    PlaybackMapEntry,
+    TTSChunkProgress,
+    TTSReport,
+)
+from lectorius_pipeline.utils.io import load_book_meta
+
+logger = logging.getLogger(__name__)
+
+# Used when no book under the library root has audio yet
+DEFAULT_CHARS_PER_SECOND = 15.0
+
+# Fewer samples than this and the next, broader level is used instead
+MIN_SAMPLES = 20
+
+
+@dataclass
+class SpeechRate:
+    """Characters of chunk text spoken per second of audio."""
+
+    chars_per_second: float
+    samples: int  # chunks the estimate is based on (0 = built-in default)
+    basis: str  # "voice", "provider", "all" or "default"
+
+    def chars_for(self, seconds: float) -> int:
+        """Characters that take roughly ``seconds`` to speak."""
+        return max(1, round(seconds * self.chars_per_second))
+
+
+@dataclass
+class _Totals:
+    chars: int = 0
+    duration_ms: int = 0
+    samples: int = 0
+
+    def add(self, chars: int, duration_ms: int) -> None:
+        self.chars += chars
+        self.duration_ms += duration_ms
+        self.samples += 1
+
+
+def estimate_speech_rate(
+    library_dir: Path, provider: str | None, voice: str | None
+) -> SpeechRate:
+    """
+    Estimate the speaking rate of a voice from every book under ``library_dir``.
+
+    Each book contributes (chunk length, audio duration) pairs from
+    playback_map.jsonl and completed reports/tts_progress.jsonl entries,
+    attributed to the provider/voice in reports/tts.json (or book.json).
+    The rate is total chars over total seconds, which weights long chunks
+    more and is robust to a few odd short clips.
+
+    Falls back from the exact voice to all voices of the provider, then to
+    every book, then to DEFAULT_CHARS_PER_SECOND, whenever the narrower
+    level has fewer than MIN_SAMPLES chunks.
+
+    Args:
+        library_dir: Directory holding one subdirectory per book
+        provider: TTS provider the book will be voiced with
+        voice: Voice name/ID, or None for the provider default
+
+    Returns:
+        SpeechRate estimate
+    """
+    by_voice: dict[tuple[str, str], _Totals] = {}
+    by_provider: dict[str, _Totals] = {}
+    overall = _Totals()
+
+    for book_dir in sorted(p for p in library_dir.iterdir() if p.is_dir()):
+        book_provider, book_voice = _book_voice(book_dir)
+        for chars, duration_ms in _book_samples(book_dir):
+            by_voice.setdefault((book_provider, book_voice), _Totals()).add(chars, duration_ms)
+            by_provider.setdefault(book_provider, _Totals()).add(chars, duration_ms)
+            overall.add(chars, duration_ms)
+
+    levels: list[tuple[str, _Totals | None]] = [
+        ("voice", by_voice.get((provider or "", voice or "")) if voice else None),
+        ("provider", by_provider.get(provider or "")),
+        ("all", overall),
+    ]
+    for basis, totals in levels:
+        if totals and totals.samples >= MIN_SAMPLES and totals.duration_ms > 0:
+            return SpeechRate(
+                chars_per_second=round(totals.chars * 1000 / totals.duration_ms, 2),
+                samples=totals.samples,
+                basis=basis,
+            )
+    return SpeechRate(chars_per_second=DEFAULT_CHARS_PER_SECOND, samples=0, basis="default")
+
+
+def _book_voice(book_dir: Path) -> tuple[str, str]:
+    """Provider and voice that produced a book's audio."""
+    report_path = book_dir / "reports" / "tts.json"
+    if report_path.exists():
+        try:
+            report = TTSReport.model_validate_json(report_path.read_text())
+            return report.provider, report.voice
+        except ValidationError:
+            pass
+
+    meta = load_book_meta(book_dir)
+    if meta is None:
+        return "", ""
+    return meta.tts_provider or "", meta.voice_id or ""
+
+
+def _book_samples(book_dir: Path) -> list[tuple[int, int]]:
+    """(chunk chars, duration_ms) for every voiced chunk of one book.
+
+    Durations are joined to the current chunks.jsonl by chunk_id. Unless the
+    last chunkify was incremental (content-stable IDs), a positional ID only
+    names the same text as long as the book has not been re-chunked since,
+    so a progress journal or playback map older than chunks.jsonl is skipped.
+    """
+    chunks_path = book_dir / "chunks.jsonl"
+    if not chunks_path.exists():
+        return []
+    stable_ids = _has_stable_ids(book_dir)
+    chunks_mtime = chunks_path.stat().st_mtime
+
+    chunk_chars: dict[str, int] = {}
+    with open(chunks_path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                data = json.loads(line)
+                chunk_chars[data["chunk_id"]] = len(data["text"])
+
+    durations: dict[str, int] = {}
+    progress_path = book_dir / "reports" / "tts_progress.jsonl"
+    if _is_current(progress_path, chunks_mtime, stable_ids):
+        with open(progress_path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    progress = TTSChunkProgress.model_validate_json(line)
+                except ValidationError:
+                    logger.warning("Skipping malformed line in %s", progress_path)
+                    continue
+                if progress.status == "completed" and progress.duration_ms:
+                    durations[progress.chunk_id] = progress.duration_ms
+
+    # The playback map is authoritative where both exist
+    map_path = book_dir / "playback_map.jsonl"
+    if _is_current(map_path, chunks_mtime, stable_ids):
+        with open(map_path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    mapped = PlaybackMapEntry.model_validate_json(line)
+                except ValidationError:
+                    logger.warning("Skipping malformed line in %s", map_path)
+                    continue
+                if mapped.duration_ms:
+                    durations[mapped.chunk_id] = mapped.duration_ms
+
+    return [
+        (chunk_chars[chunk_id], duration_ms)
+        for chunk_id, duration_ms in durations.items()
+        if chunk_id in chunk_chars
+    ]
+
+
+def _has_stable_ids(book_dir: Path) -> bool:
+    """Whether the last chunkify gave content-stable chunk IDs (``--incremental``)."""
+    report_path = book_dir / "reports" / "chunks.json"
+    if not report_path.exists():
+        return False
+    try:
+        return ChunkifyReport.model_validate_json(report_path.read_text()).incremental
+    except ValidationError:
+        return False
+
+
+def _is_current(path: Path, chunks_mtime: float, stable_ids: bool) -> bool:
+    """Whether durations in ``path`` still belong to the chunks in chunks.jsonl."""
+    if not path.exists():
+        return False
+    if stable_ids or path.stat().st_mtime >= chunks_mtime:
+        return True
+    logger.info("Skipping %s: older than chunks.jsonl, which was re-chunked since", path)
+    return False